@@ -0,0 +1,131 @@
+"""One window, every example.
+
+pygame is initialized once and the display is created once. Each game is built the
+first time it's picked and then kept, so switching back resumes it where it was
+left, with its fonts and baked frames still in memory. (Every game asks for the
+same 960x540 display, so its own `set_mode` call just gets the existing window
+surface back.)
+"""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+import sys
+import time
+
+import pygame
+
+from arcade_launcher.idle import IdleLoop
+from arcade_launcher.scenes import GameEntry, Menu, Scene
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+GAMES = [
+    GameEntry("intro", "Week 1 Intro Arcade", "week1/examples/01-intro-arcade", "intro_arcade.game"),
+    GameEntry("bounds", "Week 2 Movement + Boundaries", "week2/examples/02-movement-bounds", "movement_bounds.game"),
+    GameEntry("feel", "Week 3 Input + Control Feel", "week3/examples/03-input-control-feel", "input_control_feel.game"),
+    GameEntry("sprites", "Week 4 Sprites + Collisions", "week4/examples/04-sprites-collisions", "sprites_collisions.game"),
+    GameEntry(
+        "live",
+        "Week 4 Live Build Collision Loop",
+        "week4/examples/04-live-build-collision-loop",
+        "live_build_collision_loop.game",
+    ),
+    GameEntry("anim", "Week 5 Animation + Feedback", "week5/examples/05-animation-feedback", "anim_feedback.game"),
+]
+
+_NUMBER_KEYS = [pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9]
+
+
+class Launcher:
+    SCREEN_W, SCREEN_H = 960, 540
+
+    def __init__(self, entries: list[GameEntry] = GAMES) -> None:
+        self.entries = entries
+        self.screen = pygame.display.set_mode((self.SCREEN_W, self.SCREEN_H))
+        font = pygame.font.Font(None, 26)
+        big_font = pygame.font.Font(None, 48)
+
+        self.menu = Menu(self.screen, entries, font, big_font)
+        self.scenes: dict[str, Scene] = {}
+        self.current: Scene = self.menu
+        pygame.display.set_caption("COMP 323 Examples")
+
+    def load(self, entry: GameEntry) -> Scene:
+        """The running game for `entry`, built on first use."""
+        scene = self.scenes.get(entry.key)
+        if scene is None:
+            folder = str(REPO_ROOT / entry.folder)
+            if folder not in sys.path:
+                sys.path.insert(0, folder)
+            module = importlib.import_module(entry.module)
+            scene = module.Game()
+            self.scenes[entry.key] = scene
+        return scene
+
+    def switch(self, entry: GameEntry) -> float:
+        """Make `entry` the current scene; returns how long it took in ms."""
+        t0 = time.perf_counter()
+        self.current = self.load(entry)
+        pygame.display.set_caption(entry.title)
+        ms = (time.perf_counter() - t0) * 1000
+        self.menu.status = f"Switched to {entry.title} in {ms:.1f} ms"
+        return ms
+
+    def back_to_menu(self) -> None:
+        self.current = self.menu
+        pygame.display.set_caption("COMP 323 Examples")
+
+    def preload(self) -> None:
+        for entry in self.entries:
+            self.load(entry)
+
+    def close(self) -> None:
+        """Let the games that hold resources (threads, files) release them."""
+        for scene in self.scenes.values():
+            close = getattr(scene, "close", None)
+            if close is not None:
+                close()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            # Launcher keys are handled here and never reach the game.
+            if event.key == pygame.K_ESCAPE:
+                self.back_to_menu()
+                return
+            if event.mod & pygame.KMOD_CTRL and event.key in _NUMBER_KEYS:
+                i = _NUMBER_KEYS.index(event.key)
+                if i < len(self.entries):
+                    self.switch(self.entries[i])
+                return
+
+        self.current.handle_event(event)
+
+        if self.menu.chosen is not None:
+            entry, self.menu.chosen = self.menu.chosen, None
+            self.switch(entry)
+
+    def on_menu(self) -> bool:
+        """On the launcher menu, or on a game's title or game-over screen."""
+        if self.current is self.menu:
+            return True
+        return getattr(self.current, "state", "play") not in ("play", "playing")
+
+    def run(self, loop: IdleLoop | None = None) -> None:
+        loop = loop or IdleLoop(60)
+        running = True
+        while running:
+            loop.fps = getattr(self.current, "fps", 60)
+            dt, events = loop.tick(menu=self.on_menu())
+            dt = min(dt, 0.05)
+
+            for event in events:
+                if event.type == pygame.QUIT:
+                    running = False
+                else:
+                    self.handle_event(event)
+
+            self.current.update(dt)
+            self.current.draw()
+            pygame.display.flip()
@@ -0,0 +1,77 @@
+"""The scene interface every example game already follows, plus the launcher menu."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Protocol
+
+import pygame
+
+
+class Scene(Protocol):
+    """What the launcher needs from a game: the same three calls each `main.py` makes.
+
+    `fps` is optional (60 if missing).
+    """
+
+    def handle_event(self, event: pygame.event.Event) -> None: ...
+
+    def update(self, dt: float) -> None: ...
+
+    def draw(self) -> None: ...
+
+
+@dataclass(frozen=True)
+class GameEntry:
+    key: str
+    title: str
+    folder: str  # example folder, relative to the repo root
+    module: str  # module with the `Game` class
+
+
+class Menu:
+    """Pick a game with Up/Down + Enter (or Ctrl+number from anywhere)."""
+
+    fps = 60
+
+    def __init__(self, screen: pygame.Surface, entries: list[GameEntry], font: pygame.font.Font, big_font: pygame.font.Font) -> None:
+        self.screen = screen
+        self.entries = entries
+        self.font = font
+        self.big_font = big_font
+
+        self.selected = 0
+        self.chosen: GameEntry | None = None  # set on Enter; the launcher switches and clears it
+        self.status = ""  # e.g. how long the last switch took
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key in (pygame.K_UP, pygame.K_w):
+            self.selected = (self.selected - 1) % len(self.entries)
+        elif event.key in (pygame.K_DOWN, pygame.K_s):
+            self.selected = (self.selected + 1) % len(self.entries)
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            self.chosen = self.entries[self.selected]
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def draw(self) -> None:
+        self.screen.fill((22, 24, 28))
+
+        title = self.big_font.render("COMP 323 Examples", True, (236, 239, 244))
+        self.screen.blit(title, (60, 50))
+
+        for i, entry in enumerate(self.entries):
+            color = (235, 203, 139) if i == self.selected else (163, 173, 191)
+            line = self.font.render(f"Ctrl+{i + 1}   {entry.title}", True, color)
+            self.screen.blit(line, (80, 130 + i * 40))
+
+        hints = [
+            "Up/Down + Enter: play    Ctrl+number: switch from anywhere    Esc: back here",
+            self.status,
+        ]
+        for i, text in enumerate(hints):
+            surf = self.font.render(text, True, (163, 173, 191))
+            self.screen.blit(surf, (60, self.screen.get_height() - 80 + i * 30))
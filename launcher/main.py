@@ -0,0 +1,42 @@
+import argparse
+
+import pygame
+
+from arcade_launcher.idle import IdleLoop
+from arcade_launcher.launcher import Launcher
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="COMP 323 example launcher")
+    parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="build every game at startup, so even the first switch to each is instant",
+    )
+    parser.add_argument(
+        "--no-idle",
+        action="store_true",
+        help="always run at the full frame rate, even on menus or in the background",
+    )
+    parser.add_argument(
+        "--idle-after",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="slow the loop down after this long without input (default: 60)",
+    )
+    args = parser.parse_args()
+
+    pygame.init()
+
+    launcher = Launcher()
+    if args.preload:
+        launcher.preload()
+    launcher.run(IdleLoop(60, after=args.idle_after, enabled=not args.no_idle))
+    launcher.close()
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Scripted players for the environments: no learning, just simple rules.
+
+A bot maps a batch of "state" observations (one row per game, the layout in
+`ArcadeEnv.observation_shape`) to a batch of button masks, all in NumPy, so one
+call drives every game in a `VectorEnv`:
+
+- `RandomWalk`: holds a random direction (or nothing) for a random while
+- `GreedyCoin`: heads straight for the nearest coin
+- `HazardAvoider`: heads for the nearest coin, pushed away from hazards that are close
+
+The observation has no walls in it, so the steering bots notice when they're
+pressing a direction but not moving that way, and wander randomly for a moment to get
+around whatever is in the way.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from arcade_env.env import DOWN, LEFT, RIGHT, UP
+
+# Observations are in screen fractions; this turns dy into the same units as dx.
+_ASPECT = 540 / 960
+
+# Every direction a bot can hold (including none).
+_DIRECTIONS = np.array([0, LEFT, RIGHT, UP, DOWN, LEFT | UP, LEFT | DOWN, RIGHT | UP, RIGHT | DOWN], np.uint8)
+
+_TAN_22_5 = 0.4142
+
+
+def _nearest(obs: np.ndarray) -> int:
+    """How many coins (and hazards) each observation row lists."""
+    return (obs.shape[1] - 5) // 6
+
+
+def buttons_toward(dx: np.ndarray, dy: np.ndarray, *, dead_zone: float = 0.01) -> np.ndarray:
+    """Button masks for the nearest of the 8 directions to (dx, dy); shorter than `dead_zone` is none.
+
+    An axis only counts when it's more than tan(22.5°) of the other, so a target
+    almost straight ahead doesn't flick the other axis back and forth every step.
+    """
+    ax, ay = np.abs(dx), np.abs(dy)
+    moving = np.hypot(dx, dy) > dead_zone
+    use_x = moving & (ax > _TAN_22_5 * ay)
+    use_y = moving & (ay > _TAN_22_5 * ax)
+    actions = np.zeros(dx.shape, np.uint8)
+    actions[use_x & (dx < 0)] |= LEFT
+    actions[use_x & (dx > 0)] |= RIGHT
+    actions[use_y & (dy < 0)] |= UP
+    actions[use_y & (dy > 0)] |= DOWN
+    return actions
+
+
+class RandomWalk:
+    def __init__(self, *, hold: tuple[int, int] = (10, 40), seed: int | None = None) -> None:
+        self.hold = hold  # steps to keep a direction, min and max
+        self.rng = np.random.default_rng(seed)
+        self._actions: np.ndarray | None = None
+        self._left: np.ndarray | None = None
+
+    def act(self, obs: np.ndarray) -> np.ndarray:
+        n = len(obs)
+        if self._actions is None or len(self._actions) != n:
+            self._actions = np.zeros(n, np.uint8)
+            self._left = np.zeros(n, np.int32)
+        self._left -= 1
+        change = self._left <= 0
+        count = int(change.sum())
+        if count:
+            self._actions[change] = self.rng.choice(_DIRECTIONS, count)
+            self._left[change] = self.rng.integers(self.hold[0], self.hold[1] + 1, count)
+        return self._actions.copy()
+
+
+class GreedyCoin:
+    def __init__(self, *, stuck_after: int = 8, wander: int = 20, seed: int | None = None) -> None:
+        self.stuck_after = stuck_after  # steps pressing without moving before wandering
+        self.wander = wander  # steps to wander once stuck
+        self.walk = RandomWalk(hold=(wander // 2, wander), seed=seed)
+        self._stuck: np.ndarray | None = None
+        self._wandering: np.ndarray | None = None
+
+    def act(self, obs: np.ndarray) -> np.ndarray:
+        dx, dy = self.steer(obs)
+        actions = buttons_toward(dx, dy)
+        return self._unstick(obs, actions)
+
+    def steer(self, obs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Where each row wants to go: toward its nearest coin (nowhere if there is none)."""
+        has_coin = obs[:, 6] > 0
+        return np.where(has_coin, obs[:, 4], 0.0), np.where(has_coin, obs[:, 5] * _ASPECT, 0.0)
+
+    def _unstick(self, obs: np.ndarray, actions: np.ndarray) -> np.ndarray:
+        n = len(obs)
+        if self._stuck is None or len(self._stuck) != n:
+            self._stuck = np.zeros(n, np.int32)
+            self._wandering = np.zeros(n, np.int32)
+        # Stuck: pressing along an axis without moving along it (a wall the observation doesn't show).
+        blocked_x = ((actions & (LEFT | RIGHT)) != 0) & (np.abs(obs[:, 2]) < 1e-3)
+        blocked_y = ((actions & (UP | DOWN)) != 0) & (np.abs(obs[:, 3]) < 1e-3)
+        self._stuck = np.where(blocked_x | blocked_y, self._stuck + 1, 0)
+        self._wandering = np.where(self._stuck >= self.stuck_after, self.wander, np.maximum(self._wandering - 1, 0))
+        random_actions = self.walk.act(obs)
+        return np.where(self._wandering > 0, random_actions, actions).astype(np.uint8)
+
+
+class HazardAvoider(GreedyCoin):
+    def __init__(self, *, radius: float = 0.12, push: float = 2.0, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.radius = radius  # hazards closer than this (fraction of the screen width) push the bot away
+        self.push = push  # how hard, relative to the pull of the coin
+
+    def steer(self, obs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        dx, dy = super().steer(obs)
+        length = np.hypot(dx, dy)
+        length[length == 0] = 1.0
+        dx, dy = dx / length, dy / length
+
+        k = _nearest(obs)
+        first = 4 + 3 * k  # the hazard entries follow the coin entries
+        for j in range(k):
+            col = first + 3 * j
+            hx = obs[:, col]
+            hy = obs[:, col + 1] * _ASPECT
+            dist = np.hypot(hx, hy)
+            near = (obs[:, col + 2] > 0) & (dist < self.radius) & (dist > 0)
+            strength = np.where(near, self.push * (1 - dist / self.radius) / np.where(dist > 0, dist, 1.0), 0.0)
+            dx -= hx * strength
+            dy -= hy * strength
+        return dx, dy
+
+
+BOTS = {"random": RandomWalk, "greedy": GreedyCoin, "avoid": HazardAvoider}
@@ -0,0 +1,249 @@
+"""One example game as an environment: reset / step / observation / reward.
+
+An action is a bitmask of buttons (`LEFT | UP | A`, ...), held for one step. The
+games read the keyboard themselves, so while a step runs, `VirtualKeyboard`
+answers `pygame.key.get_pressed()` with the action's keys, and pressing or
+releasing a button also sends the KEYDOWN / KEYUP event a real key would.
+
+Observations come in two kinds:
+
+- "state": a float32 vector; see `ArcadeEnv.observation_shape` for the layout
+- "pixels": the frame the game would show, shrunk `pixel_scale` times, as a
+  (height, width, 3) uint8 array
+
+The reward is coins (score) gained minus HP lost. An episode ends when the game
+reaches one of its end states (game over, win/lose), or is cut off after
+`max_steps`. Each step's info also says how many coins and hits it saw, whether a
+level was cleared (all coins taken, so the game spawned new ones, or a win), and
+how long the game's update (and draw) took.
+
+Needs numpy. Run it with SDL's dummy video driver (`SDL_VIDEODRIVER=dummy`) when
+there's no window to show; `VectorEnv` workers set that themselves.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+import numpy as np
+import pygame
+
+from arcade_env.games import SPECS
+
+# Buttons; an action is any combination of them.
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+A = 16  # Space: jump / action
+B = 32  # Shift: dash
+
+_BUTTON_KEYS = [(LEFT, pygame.K_LEFT), (RIGHT, pygame.K_RIGHT), (UP, pygame.K_UP), (DOWN, pygame.K_DOWN), (A, pygame.K_SPACE), (B, pygame.K_LSHIFT)]
+
+
+class VirtualKeyboard:
+    """Stands in for the keyboard in a process that doesn't have one."""
+
+    def __init__(self) -> None:
+        self.held: frozenset[int] = frozenset()
+
+    def get_pressed(self) -> VirtualKeyboard:
+        return self
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.held
+
+
+KEYBOARD = VirtualKeyboard()
+
+
+def _key_event(kind: int, key: int) -> pygame.event.Event:
+    return pygame.event.Event(kind, key=key, mod=0, unicode="", scancode=0)
+
+
+class ArcadeEnv:
+    def __init__(
+        self,
+        game: str,
+        *,
+        obs: str = "state",
+        nearest: int = 4,
+        pixel_scale: int = 8,
+        frame_skip: int = 1,
+        max_steps: int | None = None,
+        render: bool = False,
+    ) -> None:
+        if game not in SPECS:
+            raise ValueError(f"unknown game {game!r}; choose from {', '.join(SPECS)}")
+        if obs not in ("state", "pixels"):
+            raise ValueError(f"obs must be 'state' or 'pixels', got {obs!r}")
+        self.spec = SPECS[game]
+        self.obs = obs
+        self.nearest = nearest  # coins and hazards in the state vector
+        self.pixel_scale = pixel_scale
+        self.frame_skip = frame_skip  # game updates per step, all with the same action
+        self.max_steps = max_steps
+        self.render = render  # draw every step even for "state" observations (load testing)
+
+        self.game: Any = None
+        self.steps = 0
+        # Each episode's game seed, for the games that take one; `reset(seed=...)` restarts the sequence.
+        self._episode_seeds = random.Random()
+        self._held: frozenset[int] = frozenset()
+        self._prev_center = (0.0, 0.0)
+        self._score = 0
+        self._hp = 0
+        self._coins = 0
+        self._step_info: dict = {}
+        self._drawn = False  # the screen already shows the current frame
+        self._small: pygame.Surface | None = None
+
+    @property
+    def observation_shape(self) -> tuple[int, ...]:
+        """Shape of one observation.
+
+        "state": (4 + 6 * nearest + 1,), laid out as
+
+        - player x, y (fraction of the screen) and velocity (screen widths/heights per second)
+        - `nearest` coins, then `nearest` hazards, closest first: dx, dy (screen
+          fractions) and 1.0, or 0, 0, 0 where there are fewer
+        - HP
+
+        "pixels": (screen height // pixel_scale, screen width // pixel_scale, 3).
+        """
+        if self.obs == "pixels":
+            w, h = self._screen_size()
+            return (h // self.pixel_scale, w // self.pixel_scale, 3)
+        return (4 + 6 * self.nearest + 1,)
+
+    @property
+    def observation_dtype(self) -> type:
+        return np.uint8 if self.obs == "pixels" else np.float32
+
+    def reset(self, *, seed: int | None = None, out: np.ndarray | None = None) -> tuple[np.ndarray, dict]:
+        """Start a new episode with a fresh `Game`; returns (observation, info).
+
+        With `seed`, this episode and the ones after it (reset without a seed) play
+        out the same every time; without, they carry on from the last seed.
+        """
+        if seed is not None:
+            random.seed(seed)  # for the games that use the global `random`
+            self._episode_seeds.seed(seed)
+        # From here on this process's "keyboard" is whatever the current step holds.
+        pygame.key.get_pressed = KEYBOARD.get_pressed
+        KEYBOARD.held = frozenset()
+        if self.game is not None and hasattr(self.game, "close"):
+            self.game.close()  # sprites: its stage prefetch thread
+        self.game = self.spec.new_game(self._episode_seeds.getrandbits(31))
+        self._held = frozenset()
+        self.steps = 0
+        self._small = None
+        self._drawn = False
+        if self.game.state == "title":
+            self.game.handle_event(_key_event(pygame.KEYDOWN, self.spec.start_key))
+
+        self._prev_center = self.spec.player(self.game).center
+        self._score = self.spec.score(self.game)
+        self._hp = self.spec.hp(self.game)
+        self._coins = len(self.spec.coins(self.game))
+        self._step_info = {"coins": 0, "hits": 0, "cleared": False, "frame_time": 0.0}
+        return self.observe(out), self._info()
+
+    def step(self, action: int, *, out: np.ndarray | None = None) -> tuple[np.ndarray, float, bool, bool, dict]:
+        """Hold `action`'s buttons for `frame_skip` updates.
+
+        Returns (observation, reward, terminated, truncated, info), like Gymnasium.
+        """
+        game = self.game
+        held = frozenset(key for button, key in _BUTTON_KEYS if action & button)
+        for key in self._held - held:
+            game.handle_event(_key_event(pygame.KEYUP, key))
+        for key in held - self._held:
+            game.handle_event(_key_event(pygame.KEYDOWN, key))
+        self._held = held
+        KEYBOARD.held = held
+
+        dt = 1.0 / getattr(game, "fps", 60)
+        self._prev_center = self.spec.player(game).center
+        t0 = time.perf_counter()
+        for _ in range(self.frame_skip):
+            game.update(dt)
+            if game.state in self.spec.end_states:
+                break
+        self._drawn = self.render or self.obs == "pixels"
+        if self._drawn:
+            game.draw()
+        frame_time = time.perf_counter() - t0
+        self.steps += 1
+
+        score = self.spec.score(game)
+        hp = self.spec.hp(game)
+        coins = len(self.spec.coins(game))
+        # Some games zero the score on game over; that isn't a loss of coins.
+        gained = max(0, score - self._score)
+        hits = max(0, self._hp - hp)
+        self._step_info = {
+            "coins": gained,
+            "hits": hits,
+            # The coin-collecting games spawn a new level once the last coin is taken.
+            "cleared": coins > self._coins or game.state == "win",
+            "frame_time": frame_time,
+        }
+        self._score, self._hp, self._coins = score, hp, coins
+
+        terminated = game.state in self.spec.end_states
+        truncated = not terminated and self.max_steps is not None and self.steps >= self.max_steps
+        return self.observe(out), float(gained - hits), terminated, truncated, self._info()
+
+    def observe(self, out: np.ndarray | None = None) -> np.ndarray:
+        """The current observation, written into `out` if given."""
+        if out is None:
+            out = np.zeros(self.observation_shape, self.observation_dtype)
+        if self.obs == "pixels":
+            self._observe_pixels(out)
+        else:
+            self._observe_state(out)
+        return out
+
+    def _observe_state(self, out: np.ndarray) -> None:
+        spec, game = self.spec, self.game
+        w, h = self._screen_size()
+        x, y = spec.player(game).center
+        per_second = getattr(game, "fps", 60) / self.frame_skip
+        out[0] = x / w
+        out[1] = y / h
+        out[2] = (x - self._prev_center[0]) * per_second / w
+        out[3] = (y - self._prev_center[1]) * per_second / h
+
+        i = 4
+        for rects in (spec.coins(game), spec.hazards(game)):
+            by_distance = sorted(((r.centerx - x, r.centery - y) for r in rects), key=lambda d: d[0] * d[0] + d[1] * d[1])
+            for k in range(self.nearest):
+                if k < len(by_distance):
+                    dx, dy = by_distance[k]
+                    out[i : i + 3] = (dx / w, dy / h, 1.0)
+                else:
+                    out[i : i + 3] = 0.0
+                i += 3
+        out[i] = spec.hp(game)
+
+    def _observe_pixels(self, out: np.ndarray) -> None:
+        if not self._drawn:
+            self.game.draw()
+        self._drawn = False
+        screen = self.game.screen
+        if self._small is None:
+            h, w, _ = self.observation_shape
+            self._small = pygame.Surface((w, h), 0, screen)
+        pygame.transform.scale(screen, self._small.get_size(), self._small)
+        out[...] = pygame.surfarray.pixels3d(self._small).swapaxes(0, 1)
+
+    def _screen_size(self) -> tuple[int, int]:
+        if self.game is not None:
+            return self.game.screen.get_size()
+        return (960, 540)  # every example uses this size
+
+    def _info(self) -> dict:
+        return {"score": self._score, "hp": self._hp, "state": self.game.state, "steps": self.steps, **self._step_info}
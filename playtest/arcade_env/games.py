@@ -0,0 +1,144 @@
+"""What the environment needs to know about each example game.
+
+The games weren't written for bots: each reads the keyboard with
+`pygame.key.get_pressed()` and keeps its state in its own attribute names. A
+`GameSpec` says where a game lives, which key starts (and restarts) a run, which
+states end an episode, how a game is seeded, and how to read the player, coins,
+hazards, score and HP off a running `Game`, all as rects and ints so `ArcadeEnv`
+can treat every game the same way.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib
+import os
+from pathlib import Path
+import sys
+from typing import Any, Callable
+
+import pygame
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass(frozen=True)
+class GameSpec:
+    key: str
+    folder: str  # example folder, relative to the repo root
+    module: str  # module with the `Game` class
+    start_key: int  # starts a run from the title screen and restarts it after the end
+    end_states: frozenset[str]  # `game.state` values that end an episode
+    player: Callable[[Any], pygame.Rect]
+    coins: Callable[[Any], list[pygame.Rect]]
+    hazards: Callable[[Any], list[pygame.Rect]]
+    score: Callable[[Any], int]
+    hp: Callable[[Any], int]
+    # Takes its own `seed` for its layouts; the others draw from the global `random`.
+    seeded: bool = False
+
+    def new_game(self, seed: int | None = None) -> Any:
+        """A fresh `Game` (pygame must be initialized), built from `seed` if the game takes one."""
+        folder = str(REPO_ROOT / self.folder)
+        if folder not in sys.path:
+            sys.path.insert(0, folder)
+        kwargs = {"seed": seed} if self.seeded and seed is not None else {}
+        game = importlib.import_module(self.module).Game(**kwargs)
+        if self.key == "intro":
+            # Don't let thousands of bot runs fight over the real high score file.
+            game.save_path = Path(os.devnull)
+        return game
+
+
+def _sprite_rects(group) -> list[pygame.Rect]:
+    return [sprite.rect for sprite in group]
+
+
+def _goal_rect(game) -> pygame.Rect:
+    r = game.goal.radius
+    return pygame.Rect(int(game.goal.pos.x) - r, int(game.goal.pos.y) - r, 2 * r, 2 * r)
+
+
+SPECS = {
+    spec.key: spec
+    for spec in [
+        GameSpec(
+            "intro",
+            "week1/examples/01-intro-arcade",
+            "intro_arcade.game",
+            start_key=pygame.K_RETURN,
+            end_states=frozenset({"gameover"}),
+            player=lambda g: g.player,
+            coins=lambda g: [g.coin],
+            hazards=lambda g: g.enemy_rects,
+            score=lambda g: g.score,
+            hp=lambda g: g.lives,
+        ),
+        # Week 2 has one goal per level and a level timer: reaching it wins (+1), running
+        # out of time loses (HP 1 -> 0).
+        GameSpec(
+            "bounds",
+            "week2/examples/02-movement-bounds",
+            "movement_bounds.game",
+            start_key=pygame.K_SPACE,
+            end_states=frozenset({"win", "lose"}),
+            player=lambda g: g.player_rect,
+            coins=lambda g: [_goal_rect(g)],
+            hazards=lambda g: [],
+            score=lambda g: g.level,
+            hp=lambda g: 0 if g.state == "lose" else 1,
+        ),
+        # Week 3 is a movement sandbox: no goals, so no reward and no end (and nothing random).
+        GameSpec(
+            "feel",
+            "week3/examples/03-input-control-feel",
+            "input_control_feel.game",
+            start_key=pygame.K_SPACE,
+            end_states=frozenset(),
+            player=lambda g: g.player_rect,
+            coins=lambda g: [],
+            hazards=lambda g: [],
+            score=lambda g: 0,
+            hp=lambda g: 1,
+        ),
+        GameSpec(
+            "sprites",
+            "week4/examples/04-sprites-collisions",
+            "sprites_collisions.game",
+            start_key=pygame.K_SPACE,
+            end_states=frozenset({"gameover"}),
+            player=lambda g: g.player.rect,
+            coins=lambda g: _sprite_rects(g.coins),
+            hazards=lambda g: _sprite_rects(g.hazards),
+            score=lambda g: g.score,
+            hp=lambda g: g.player.hp,
+            seeded=True,
+        ),
+        GameSpec(
+            "live",
+            "week4/examples/04-live-build-collision-loop",
+            "live_build_collision_loop.game",
+            start_key=pygame.K_r,
+            end_states=frozenset({"win", "lose"}),
+            player=lambda g: g.player.rect,
+            coins=lambda g: _sprite_rects(g.coins),
+            hazards=lambda g: _sprite_rects(g.hazards),
+            score=lambda g: g.score,
+            hp=lambda g: g.hp,
+            seeded=True,
+        ),
+        GameSpec(
+            "anim",
+            "week5/examples/05-animation-feedback",
+            "anim_feedback.game",
+            start_key=pygame.K_SPACE,
+            end_states=frozenset({"gameover"}),
+            player=lambda g: g.player.rect,
+            coins=lambda g: _sprite_rects(g.coins),
+            hazards=lambda g: _sprite_rects(g.hazards),
+            score=lambda g: g.player.score,
+            hp=lambda g: g.player.hp,
+            seeded=True,
+        ),
+    ]
+}
@@ -0,0 +1,156 @@
+"""Headless playtests: many sessions of one game, played by a bot, then summarized.
+
+`run_sessions` keeps `envs` games going on a `VectorEnv` until `sessions`
+sessions have been played to the end (game over, win/lose, or the time limit).
+Exactly `sessions` are started and every one of them is finished, so short
+sessions aren't over-counted. For each it records the coins collected, the hits
+taken, whether it ended in a death, its length, and how long each level clear
+took (game seconds). Step times (the game's update, plus its draw with `render`)
+go into a histogram with 0.01 ms buckets, for percentiles.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import json
+import time
+from typing import Callable
+
+import numpy as np
+
+from arcade_env.vector import VectorEnv
+
+_BUCKET_MS = 0.01
+_BUCKETS = 10_000  # up to 100 ms; slower steps land in the last bucket
+
+
+@dataclass
+class Session:
+    score: int
+    hits: int
+    died: bool
+    seconds: float
+    clear_times: list[float] = field(default_factory=list)
+
+
+@dataclass
+class Report:
+    game: str
+    bot: str
+    sessions: list[Session]
+    steps: int  # env steps taken by the recorded sessions
+    wall_seconds: float
+    step_hist: np.ndarray  # step-time counts per bucket
+    worst_step: float  # seconds
+
+    def step_percentile(self, q: float) -> float:
+        """The `q`-th percentile (0-100) of step times, in ms (to bucket accuracy)."""
+        total = int(self.step_hist.sum())
+        if not total:
+            return 0.0
+        bucket = int(np.searchsorted(np.cumsum(self.step_hist), total * q / 100))
+        return (bucket + 1) * _BUCKET_MS
+
+    def summary(self) -> dict:
+        scores = np.array([s.score for s in self.sessions])
+        clears = np.array([t for s in self.sessions for t in s.clear_times])
+        return {
+            "game": self.game,
+            "bot": self.bot,
+            "sessions": len(self.sessions),
+            "score": _describe(scores),
+            "deaths": sum(s.died for s in self.sessions),
+            "hits_per_session": round(float(np.mean([s.hits for s in self.sessions])), 3) if self.sessions else 0.0,
+            "session_seconds": _describe(np.array([s.seconds for s in self.sessions])),
+            "levels_cleared": len(clears),
+            "time_to_clear": _describe(clears),
+            "step_ms": {
+                **{f"p{q}": round(self.step_percentile(q), 3) for q in (50, 95, 99)},
+                "max": round(self.worst_step * 1000, 3),
+            },
+            "steps_per_second": round(self.steps / self.wall_seconds) if self.wall_seconds else 0,
+        }
+
+    def dump(self, path: str) -> None:
+        data = {"summary": self.summary(), "sessions": [asdict(s) for s in self.sessions]}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+
+def _describe(values: np.ndarray) -> dict:
+    if not len(values):
+        return {}
+    return {
+        "mean": round(float(values.mean()), 3),
+        "p50": round(float(np.percentile(values, 50)), 3),
+        "p95": round(float(np.percentile(values, 95)), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+def run_sessions(
+    game: str,
+    bot,
+    *,
+    sessions: int,
+    envs: int = 64,
+    workers: int | None = None,
+    max_seconds: float = 120.0,
+    frame_skip: int = 1,
+    render: bool = False,
+    seed: int = 0,
+    progress: Callable[[int], None] | None = None,
+) -> Report:
+    """Play `sessions` sessions of `game` with `bot` (see `bots.py`); `progress` gets the count as they finish."""
+    envs = max(1, min(envs, sessions))
+    step_seconds = frame_skip / 60  # every example runs its update at 60 fps
+    max_steps = max(1, round(max_seconds / step_seconds))
+
+    score = np.zeros(envs, np.int64)
+    hits = np.zeros(envs, np.int64)
+    steps = np.zeros(envs, np.int64)
+    since_clear = np.zeros(envs, np.int64)
+    clear_times: list[list[float]] = [[] for _ in range(envs)]
+    active = np.ones(envs, bool)  # playing a session that will be recorded
+    started = envs
+    done: list[Session] = []
+    hist = np.zeros(_BUCKETS, np.int64)
+    worst = 0.0
+    total_steps = 0
+
+    t0 = time.perf_counter()
+    with VectorEnv(game, envs, workers=workers, frame_skip=frame_skip, max_steps=max_steps, render=render) as venv:
+        obs = venv.reset(seed=seed)
+        info = venv.info
+        while active.any():
+            obs, _, terminated, truncated = venv.step(bot.act(obs))
+
+            score += info["coins"]
+            hits += info["hits"]
+            steps += 1
+            since_clear += 1
+            for i in np.flatnonzero(info["cleared"] & active):
+                clear_times[i].append(since_clear[i] * step_seconds)
+            since_clear[info["cleared"]] = 0
+
+            step_times = info["frame_time"][active]
+            buckets = np.minimum((step_times * (1000 / _BUCKET_MS)).astype(np.int64), _BUCKETS - 1)
+            hist += np.bincount(buckets, minlength=_BUCKETS)
+            worst = max(worst, float(step_times.max()))
+            total_steps += int(active.sum())
+
+            for i in np.flatnonzero(terminated | truncated):
+                if active[i]:
+                    died = bool(terminated[i] and info["hp"][i] <= 0)
+                    done.append(Session(int(score[i]), int(hits[i]), died, float(steps[i] * step_seconds), clear_times[i]))
+                    if progress is not None:
+                        progress(len(done))
+                    if started < sessions:
+                        started += 1
+                    else:
+                        active[i] = False  # keeps running, but nothing more is recorded
+                score[i] = hits[i] = steps[i] = since_clear[i] = 0
+                clear_times[i] = []
+
+    return Report(game, type(bot).__name__, done, total_steps, time.perf_counter() - t0, hist, worst)
@@ -0,0 +1,183 @@
+"""Many games at once: `num_envs` `ArcadeEnv`s spread over worker processes.
+
+Each worker runs its share of the games one after another. Nothing per-step is
+pickled: actions, observations, rewards and the episode flags live in
+`multiprocessing.shared_memory` blocks that the parent and every worker map as
+NumPy arrays. A step is just "actions are in, go" to each worker, then waiting
+for each one's "done".
+
+A finished episode (terminated or truncated) starts a new one right away. The
+row then holds the new episode's first observation, and the flags say the
+previous one ended. `info` holds the per-step numbers from each env's info
+(coins, hits, cleared, hp, frame_time), also in shared memory; `hp` is the value
+the step ended with, before any restart.
+
+Workers are started with the "spawn" method, so a script that creates a
+`VectorEnv` needs the usual `if __name__ == "__main__":` guard.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import os
+
+import numpy as np
+
+from arcade_env.env import ArcadeEnv
+
+# Per-step info fields shared with the parent, and their array types.
+INFO_FIELDS = {"coins": np.int16, "hits": np.int16, "cleared": np.bool_, "hp": np.int16, "frame_time": np.float32}
+
+
+class _SharedArray:
+    """A NumPy array in a named shared memory block."""
+
+    def __init__(self, shape: tuple[int, ...], dtype, name: str | None = None) -> None:
+        size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        self.shm = shared_memory.SharedMemory(name=name, create=name is None, size=size)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        self.spec = (self.shm.name, shape, np.dtype(dtype).str)
+
+    @classmethod
+    def attach(cls, spec: tuple[str, tuple[int, ...], str]) -> _SharedArray:
+        name, shape, dtype = spec
+        return cls(shape, dtype, name)
+
+    def close(self) -> None:
+        del self.array
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # the caller still holds a view; the mapping goes away with it
+
+
+class VectorEnv:
+    def __init__(self, game: str, num_envs: int, *, workers: int | None = None, **env_kwargs) -> None:
+        """`env_kwargs` go to each `ArcadeEnv` (obs, nearest, pixel_scale, frame_skip, max_steps, render)."""
+        probe = ArcadeEnv(game, **env_kwargs)  # only for the observation shape; no game is built
+        self.num_envs = num_envs
+        self.observation_shape = probe.observation_shape
+
+        self._obs = _SharedArray((num_envs, *probe.observation_shape), probe.observation_dtype)
+        self._actions = _SharedArray((num_envs,), np.uint8)
+        self._rewards = _SharedArray((num_envs,), np.float32)
+        self._terminated = _SharedArray((num_envs,), np.bool_)
+        self._truncated = _SharedArray((num_envs,), np.bool_)
+        self._info = {name: _SharedArray((num_envs,), dtype) for name, dtype in INFO_FIELDS.items()}
+        self._blocks = [self._obs, self._actions, self._rewards, self._terminated, self._truncated, *self._info.values()]
+
+        # Views the caller can read (and, for actions, write) directly.
+        self.observations = self._obs.array
+        self.actions = self._actions.array
+        self.rewards = self._rewards.array
+        self.terminated = self._terminated.array
+        self.truncated = self._truncated.array
+        self.info = {name: block.array for name, block in self._info.items()}
+
+        workers = max(1, min(num_envs, workers or os.cpu_count() or 1))
+        bounds = [num_envs * i // workers for i in range(workers + 1)]
+        ctx = mp.get_context("spawn")
+        self._conns = []
+        self._procs = []
+        for lo, hi in zip(bounds, bounds[1:]):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(
+                target=_worker,
+                args=(child, game, lo, hi, [block.spec for block in self._blocks], env_kwargs),
+                name=f"arcade-env-{lo}",
+                daemon=True,
+            )
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self._call("ready")
+
+    def reset(self, *, seed: int | None = None) -> np.ndarray:
+        """Start every game over; env `i` gets `seed + i`. Returns the observations (shared; copy to keep)."""
+        self._call("reset", seed)
+        return self.observations
+
+    def step(self, actions=None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Run one step of every game with `actions` (or whatever is in `self.actions`).
+
+        Returns (observations, rewards, terminated, truncated): views into shared
+        memory, overwritten by the next call, like `self.info`.
+        """
+        if actions is not None:
+            self.actions[:] = actions
+        self._call("step")
+        return self.observations, self.rewards, self.terminated, self.truncated
+
+    def close(self) -> None:
+        if not self._procs:
+            return
+        for conn in self._conns:
+            conn.send(("close", None))
+        for proc in self._procs:
+            proc.join()
+        self._procs.clear()
+        for block in self._blocks:
+            block.close()
+            block.shm.unlink()
+        del self.observations, self.actions, self.rewards, self.terminated, self.truncated, self.info
+
+    def __enter__(self) -> VectorEnv:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _call(self, command: str, arg=None) -> None:
+        for conn in self._conns:
+            conn.send((command, arg))
+        errors = [error for error in (conn.recv() for conn in self._conns) if error is not None]
+        if errors:
+            raise RuntimeError(f"arcade env worker failed:\n{errors[0]}")
+
+
+def _worker(conn, game: str, lo: int, hi: int, specs: list, env_kwargs: dict) -> None:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import traceback
+
+    import pygame
+
+    blocks = [_SharedArray.attach(spec) for spec in specs]
+    obs, actions, rewards, terminated, truncated = (block.array for block in blocks[:5])
+    info = {name: block.array for name, block in zip(INFO_FIELDS, blocks[5:])}
+    try:
+        pygame.init()
+        envs = [ArcadeEnv(game, **env_kwargs) for _ in range(lo, hi)]
+        while True:
+            command, arg = conn.recv()
+            if command == "close":
+                break
+            try:
+                if command == "ready":
+                    pass
+                elif command == "reset":
+                    for i, env in enumerate(envs, lo):
+                        _, reset_info = env.reset(seed=None if arg is None else arg + i, out=obs[i])
+                        for name, values in info.items():
+                            values[i] = reset_info[name]
+                    terminated[lo:hi] = False
+                    truncated[lo:hi] = False
+                elif command == "step":
+                    for i, env in enumerate(envs, lo):
+                        _, rewards[i], terminated[i], truncated[i], step_info = env.step(int(actions[i]), out=obs[i])
+                        for name, values in info.items():
+                            values[i] = step_info[name]
+                        if terminated[i] or truncated[i]:
+                            env.reset(out=obs[i])
+            except Exception:
+                conn.send(traceback.format_exc())
+            else:
+                conn.send(None)
+    finally:
+        del obs, actions, rewards, terminated, truncated, info
+        for block in blocks:
+            block.close()
+        pygame.quit()
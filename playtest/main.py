@@ -0,0 +1,59 @@
+import argparse
+
+from arcade_env.bots import BOTS
+from arcade_env.games import SPECS
+from arcade_env.runner import run_sessions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="COMP 323 headless playtests: bots play many sessions of a game")
+    parser.add_argument("--game", choices=list(SPECS), default="anim", help="which example to play (default: anim)")
+    parser.add_argument("--bot", choices=list(BOTS), default="avoid", help="who plays it (default: avoid)")
+    parser.add_argument("--sessions", type=int, default=1000, metavar="N", help="sessions to play (default: 1000)")
+    parser.add_argument("--envs", type=int, default=64, metavar="N", help="games running at once (default: 64)")
+    parser.add_argument("--workers", type=int, metavar="N", help="worker processes (default: one per CPU)")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=120.0,
+        metavar="SECONDS",
+        help="end a session after this much game time (default: 120)",
+    )
+    parser.add_argument("--frame-skip", type=int, default=1, metavar="N", help="game updates per bot decision (default: 1)")
+    parser.add_argument("--render", action="store_true", help="draw every frame too, so step times include drawing")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the games and the bot (default: 0)")
+    parser.add_argument("--report", metavar="PATH", help="write the summary and every session to this JSON file")
+    args = parser.parse_args()
+
+    def progress(done: int) -> None:
+        if done % max(1, args.sessions // 10) == 0:
+            print(f"{done}/{args.sessions} sessions")
+
+    report = run_sessions(
+        args.game,
+        BOTS[args.bot](seed=args.seed),
+        sessions=args.sessions,
+        envs=args.envs,
+        workers=args.workers,
+        max_seconds=args.max_seconds,
+        frame_skip=args.frame_skip,
+        render=args.render,
+        seed=args.seed,
+        progress=progress,
+    )
+
+    summary = report.summary()
+    score, clear, step = summary["score"], summary["time_to_clear"], summary["step_ms"]
+    print(f"{summary['game']} / {summary['bot']}: {summary['sessions']} sessions in {report.wall_seconds:.1f}s ({summary['steps_per_second']} steps/s)")
+    print(f"  score     mean {score.get('mean', 0)}  p50 {score.get('p50', 0)}  p95 {score.get('p95', 0)}  max {score.get('max', 0)}")
+    print(f"  deaths    {summary['deaths']}  hits per session {summary['hits_per_session']}")
+    if clear:
+        print(f"  clears    {summary['levels_cleared']}  time to clear p50 {clear['p50']}s  p95 {clear['p95']}s")
+    print(f"  step ms   p50 {step['p50']}  p95 {step['p95']}  p99 {step['p99']}  max {step['max']}")
+    if args.report:
+        report.dump(args.report)
+        print(f"report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,15 @@ import json
 import random
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pygame
 
+from intro_arcade.timers import TimerWheel
+
+if TYPE_CHECKING:
+    from intro_arcade.swarm import Swarm
+
 
 @dataclass
 class Colors:
@@ -23,21 +29,45 @@ class Colors:
 COLORS = Colors()
 
 
+@dataclass(frozen=True)
+class Snapshot:
+    """Everything `draw` needs for one frame, copied out of the live game state.
+
+    Rects are copies, so the simulation can keep moving the originals (even on another
+    thread, see `threaded.py`) while this frame is drawn.
+    """
+
+    state: str
+    score: int
+    high_score: int
+    lives: int
+    player: pygame.Rect
+    coin: pygame.Rect
+    enemies: tuple[pygame.Rect, ...]
+
+
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, swarm_size: int = 0) -> None:
         self.fps = 60
         self.w = 960
         self.h = 540
         self.screen = pygame.display.set_mode((self.w, self.h))
-        self.font = pygame.font.SysFont(None, 24)
-        self.big_font = pygame.font.SysFont(None, 48)
+        self.font = pygame.font.Font(None, 24)
+        self.big_font = pygame.font.Font(None, 48)
 
         self.save_path = Path(__file__).resolve().parent.parent / "save.json"
         self.high_score = self._load_high_score()
 
+        # Swarm mode (swarm_size > 0): enemies live in NumPy arrays instead of Rect lists.
+        self.swarm_size = swarm_size
+        self.swarm: Swarm | None = None
+
+        # Countdowns run on this wheel in seconds, so they don't depend on the frame rate.
+        self.timers = TimerWheel()
+        self.invincibility = self.timers.timer()  # invincibility after losing a life
+
         self.state: str = "title"  # title | playing | gameover
         self._reset_run()
-        self.invincibility: int = 0  # frames of invincibility after losing a life
 
     def _load_high_score(self) -> int:
         if not self.save_path.exists():
@@ -61,14 +91,21 @@ class Game:
         self.score = 0
         self.alive_time = 0.0
         self.lives = 3
+        self.invincibility.cancel()
 
         self.enemy_rects: list[pygame.Rect] = []
         self.enemy_vs: list[pygame.Vector2] = []
-        for _ in range(3):
-            r = pygame.Rect(random.randrange(40, self.w - 40), random.randrange(80, self.h - 40), 36, 36)
-            v = pygame.Vector2(random.choice([-1, 1]) * 220, random.choice([-1, 1]) * 180)
-            self.enemy_rects.append(r)
-            self.enemy_vs.append(v)
+        if self.swarm_size > 0:
+            # Imported here so NumPy is only needed when swarm mode is used.
+            from intro_arcade.swarm import Swarm
+
+            self.swarm = Swarm.spawn(self.swarm_size, pygame.Rect(0, 60, self.w, self.h - 60))
+        else:
+            for _ in range(3):
+                r = pygame.Rect(random.randrange(40, self.w - 40), random.randrange(80, self.h - 40), 36, 36)
+                v = pygame.Vector2(random.choice([-1, 1]) * 220, random.choice([-1, 1]) * 180)
+                self.enemy_rects.append(r)
+                self.enemy_vs.append(v)
 
         self.coin = self._spawn_coin()
 
@@ -86,16 +123,17 @@ class Game:
                     self._reset_run()
                     self.state = "playing"
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float, keys: pygame.key.ScancodeWrapper | None = None) -> None:
         if self.state != "playing":
             return
 
         self.alive_time += dt
-        if self.invincibility > 0:
-            self.invincibility -= 1
+        self.timers.advance(dt)
 
-        # Input: map keys -> direction.
-        keys = pygame.key.get_pressed()
+        # Input: map keys -> direction. (The threaded runner passes in the key state
+        # read on the main thread.)
+        if keys is None:
+            keys = pygame.key.get_pressed()
         input_x = 0.0
         input_y = 0.0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
@@ -130,6 +168,8 @@ class Game:
 
         # Enemies: bounce around the playfield.
         bounds = pygame.Rect(0, 60, self.w, self.h - 60)
+        if self.swarm is not None:
+            self.swarm.update(dt, bounds)
         for i, r in enumerate(self.enemy_rects):
             v = self.enemy_vs[i]
             r.x += int(v.x * dt)
@@ -153,41 +193,60 @@ class Game:
             self.coin = self._spawn_coin()
 
         # Collision: player with enemies.
-        if self.player.collidelist(self.enemy_rects) != -1:
-            if self.lives == 1 and self.invincibility == 0:
+        if self.swarm is not None:
+            hit = self.swarm.collides(self.player)
+        else:
+            hit = self.player.collidelist(self.enemy_rects) != -1
+        if hit:
+            if self.lives == 1 and not self.invincibility.active:
                 self.state = "gameover"
                 if self.score > self.high_score:
                     self.high_score = self.score
                     self._save_high_score()
-            elif self.invincibility == 0:
+            elif not self.invincibility.active:
                 self.lives -= 1
-                self.invincibility = 180 # invincibility frames after losing a life
+                self.invincibility.start(3.0) # seconds of invincibility after losing a life
+
+    def snapshot(self) -> Snapshot:
+        enemies = [r.copy() for r in self.enemy_rects]
+        if self.swarm is not None:
+            enemies.extend(self.swarm.rects())
+        return Snapshot(
+            state=self.state,
+            score=self.score,
+            high_score=self.high_score,
+            lives=self.lives,
+            player=self.player.copy(),
+            coin=self.coin.copy(),
+            enemies=tuple(enemies),
+        )
 
-    def draw(self) -> None:
+    def draw(self, snap: Snapshot | None = None) -> None:
+        snap = snap or self.snapshot()
         self.screen.fill(COLORS.bg)
 
-        if self.state == "title":
+        if snap.state == "title":
             self._draw_title()
-        elif self.state == "playing":
-            self._draw_playing()
+        elif snap.state == "playing":
+            self._draw_playing(snap)
         else:
-            self._draw_gameover()
+            self._draw_gameover(snap)
 
-    def _draw_hud(self) -> None:
+    def _draw_hud(self, snap: Snapshot) -> None:
         panel = pygame.Rect(12, 12, 420, 40)
         pygame.draw.rect(self.screen, COLORS.panel, panel, border_radius=10)
 
-        text = f"Score: {self.score}    High: {self.high_score}    Lives: {self.lives}"
+        text = f"Score: {snap.score}    High: {snap.high_score}    Lives: {snap.lives}"
         surf = self.font.render(text, True, COLORS.text)
         self.screen.blit(surf, (panel.x + 12, panel.y + 12))
 
-    def _draw_playing(self) -> None:
-        self._draw_hud()
+    def _draw_playing(self, snap: Snapshot) -> None:
+        self._draw_hud(snap)
 
-        pygame.draw.rect(self.screen, COLORS.coin, self.coin, border_radius=7)
-        for r in self.enemy_rects:
+        pygame.draw.rect(self.screen, COLORS.coin, snap.coin, border_radius=7)
+        for r in snap.enemies:
             pygame.draw.rect(self.screen, COLORS.enemy, r, border_radius=8)
-        pygame.draw.rect(self.screen, COLORS.player, self.player, border_radius=8)
+        pygame.draw.rect(self.screen, COLORS.player, snap.player, border_radius=8)
 
     def _draw_title(self) -> None:
         title = self.big_font.render("Intro Arcade", True, COLORS.text)
@@ -198,9 +257,9 @@ class Game:
         self.screen.blit(hint, (self.w / 2 - hint.get_width() / 2, 250))
         self.screen.blit(hint2, (self.w / 2 - hint2.get_width() / 2, 280))
 
-    def _draw_gameover(self) -> None:
+    def _draw_gameover(self, snap: Snapshot) -> None:
         title = self.big_font.render("Game Over", True, COLORS.text)
-        msg = self.font.render(f"Score: {self.score}   High: {self.high_score}", True, COLORS.text)
+        msg = self.font.render(f"Score: {snap.score}   High: {snap.high_score}", True, COLORS.text)
         hint = self.font.render("Press Enter to play again.  Esc to quit.", True, COLORS.text)
 
         self.screen.blit(title, (self.w / 2 - title.get_width() / 2, 190))
@@ -0,0 +1,84 @@
+"""Idle mode for the main loop: stop drawing at full rate when nobody is playing.
+
+`main.py` normally runs update + draw + flip `fps` times a second, even on the
+title screen or with the window in the background. `IdleLoop.tick` replaces the
+`clock.tick(fps)` + `pygame.event.get()` pair at the top of the loop. While the
+game is idle:
+
+- it's on a title or game-over screen (the caller says so),
+- the window has lost focus or is minimized, or
+- there has been no input for `after` seconds (and no key is held down),
+
+each frame first waits in `pygame.event.wait` for up to 1 / `idle_fps` seconds,
+so the process sleeps inside SDL instead of drawing frames nobody is watching.
+Any event ends the wait at once: a key press is handled on the frame it arrives,
+and the frame after that is back at full rate.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+# Events that mean someone is at the controls.
+_INPUT_EVENTS = frozenset(
+    {
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYAXISMOTION,
+        pygame.JOYHATMOTION,
+        pygame.FINGERDOWN,
+        pygame.FINGERMOTION,
+    }
+)
+_WINDOW_INACTIVE = frozenset({pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN})
+
+
+class IdleLoop:
+    def __init__(self, fps: int, *, idle_fps: int = 10, after: float = 60.0, enabled: bool = True) -> None:
+        self.fps = fps  # frame cap while active (0 = none)
+        self.idle_fps = idle_fps
+        self.after = after  # seconds without input before a running game counts as idle
+        self.enabled = enabled  # False = always full rate
+        self.clock = pygame.time.Clock()
+
+        self.idle = False  # whether the last tick waited
+        self.window_active = True
+        self._held: set[int] = set()  # keys down right now (holding one sends no events)
+        self._last_input = pygame.time.get_ticks()
+
+    def tick(self, *, menu: bool = False) -> tuple[float, list[pygame.event.Event]]:
+        """Wait for the next frame; returns (seconds since the last one, events to handle).
+
+        `menu`: the game is on a title or game-over screen.
+        """
+        quiet = not self._held and pygame.time.get_ticks() - self._last_input >= self.after * 1000
+        self.idle = self.enabled and (menu or not self.window_active or quiet)
+
+        first = pygame.event.wait(1000 // self.idle_fps) if self.idle else None
+        dt = self.clock.tick(self.fps) / 1000.0
+        events = pygame.event.get()
+        if first is not None and first.type != pygame.NOEVENT:
+            events.insert(0, first)
+
+        for event in events:
+            self._observe(event)
+        return dt, events
+
+    def _observe(self, event: pygame.event.Event) -> None:
+        if event.type in _INPUT_EVENTS:
+            self._last_input = pygame.time.get_ticks()
+            if event.type == pygame.KEYDOWN:
+                self._held.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self._held.discard(event.key)
+        elif event.type in _WINDOW_INACTIVE:
+            self.window_active = False
+            self._held.clear()  # the key-ups go to whichever window has focus now
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.window_active = True
+            self._last_input = pygame.time.get_ticks()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+
+class Swarm:
+    """Many bouncing enemies stored as NumPy arrays instead of Rect/Vector2 lists.
+
+    Row ``i`` of ``pos`` is the top-left corner of enemy ``i``; row ``i`` of ``vel``
+    is its velocity in pixels per second. Every enemy is a ``size`` x ``size`` square.
+    """
+
+    def __init__(self, pos: np.ndarray, vel: np.ndarray, size: int) -> None:
+        self.pos = pos
+        self.vel = vel
+        self.size = size
+
+    @classmethod
+    def spawn(cls, count: int, area: pygame.Rect, *, size: int = 36, rng: np.random.Generator | None = None) -> Swarm:
+        rng = rng if rng is not None else np.random.default_rng()
+
+        pos = np.empty((count, 2), dtype=np.float64)
+        pos[:, 0] = rng.integers(area.left, area.right - size, size=count)
+        pos[:, 1] = rng.integers(area.top, area.bottom - size, size=count)
+
+        # Same speeds as the classic enemies: +/-220 horizontally, +/-180 vertically.
+        vel = rng.choice([-1.0, 1.0], size=(count, 2)) * np.array([220.0, 180.0])
+        return cls(pos, vel, size)
+
+    def __len__(self) -> int:
+        return len(self.pos)
+
+    def update(self, dt: float, bounds: pygame.Rect) -> None:
+        self.pos += self.vel * dt
+
+        # Bounce: push back inside the bounds and flip the velocity on that axis.
+        lo = np.array([bounds.left, bounds.top], dtype=np.float64)
+        hi = np.array([bounds.right - self.size, bounds.bottom - self.size], dtype=np.float64)
+        out = (self.pos < lo) | (self.pos > hi)
+        np.clip(self.pos, lo, hi, out=self.pos)
+        self.vel[out] *= -1
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        # AABB overlap test against every enemy at once (same rule as Rect.colliderect).
+        x = self.pos[:, 0]
+        y = self.pos[:, 1]
+        hit = (x < rect.right) & (x + self.size > rect.left) & (y < rect.bottom) & (y + self.size > rect.top)
+        return bool(hit.any())
+
+    def rects(self) -> list[pygame.Rect]:
+        s = self.size
+        return [pygame.Rect(x, y, s, s) for x, y in self.pos.astype(np.int32).tolist()]
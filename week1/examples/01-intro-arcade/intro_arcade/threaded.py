@@ -0,0 +1,105 @@
+"""Run the simulation on its own thread, and draw on the main thread.
+
+The simulation thread calls `update` at a fixed rate and after each step publishes
+a `Snapshot` (copied positions and HUD values) into a `DoubleBuffer`. The main thread
+handles window events, draws the newest published snapshot and flips. Neither side
+waits for the other: a slow flip no longer delays the simulation, and pygame releases
+the GIL during blits and flips, so the two really do overlap.
+
+Only the main thread touches the window, the event queue and the fonts (SDL wants
+that); events and the keyboard state are handed to the simulation.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+
+import pygame
+
+from intro_arcade.game import Game, Snapshot
+from intro_arcade.idle import IdleLoop
+
+
+class DoubleBuffer:
+    """Two snapshot slots: the simulation fills the back one, then swaps it to the front."""
+
+    def __init__(self, first: Snapshot) -> None:
+        self._slots: list[Snapshot] = [first, first]
+        self._front = 0
+        self._lock = threading.Lock()
+        self.published = 0  # how many snapshots have been swapped in
+
+    def publish(self, snap: Snapshot) -> None:
+        back = 1 - self._front
+        self._slots[back] = snap
+        with self._lock:
+            self._front = back
+            self.published += 1
+
+    def latest(self) -> Snapshot:
+        with self._lock:
+            return self._slots[self._front]
+
+
+class Simulation(threading.Thread):
+    def __init__(self, game: Game, buffer: DoubleBuffer, *, rate: float = 60.0) -> None:
+        super().__init__(name="simulation", daemon=True)
+        self.game = game
+        self.buffer = buffer
+        self.step = 1.0 / rate
+
+        self.events: queue.SimpleQueue[pygame.event.Event] = queue.SimpleQueue()
+        self.keys = pygame.key.get_pressed()  # replaced by the main thread every frame
+        self._stopping = threading.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def run(self) -> None:
+        next_tick = time.perf_counter()
+        while not self._stopping.is_set():
+            while True:
+                try:
+                    event = self.events.get_nowait()
+                except queue.Empty:
+                    break
+                self.game.handle_event(event)
+
+            self.game.update(self.step, keys=self.keys)
+            self.buffer.publish(self.game.snapshot())
+
+            next_tick += self.step
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stopping.wait(delay)
+            elif delay < -0.25:
+                next_tick = time.perf_counter()  # far behind (e.g. a debugger pause): don't try to catch up
+
+
+def run_threaded(game: Game, loop: IdleLoop) -> None:
+    """Main loop for `--threaded`: events + drawing here, `update` on a `Simulation` thread.
+
+    `loop` paces the drawing (and slows it down when idle); the simulation keeps its own rate.
+    """
+    buffer = DoubleBuffer(game.snapshot())
+    sim = Simulation(game, buffer, rate=game.fps)
+    sim.start()
+
+    running = True
+    while running:
+        _, events = loop.tick(menu=game.state != "playing")
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            else:
+                sim.events.put(event)
+        sim.keys = pygame.key.get_pressed()
+
+        game.draw(buffer.latest())
+        pygame.display.flip()
+
+    sim.stop()
+    sim.join()
@@ -1,19 +1,56 @@
+import argparse
+
 import pygame
 
 from intro_arcade.game import Game
+from intro_arcade.idle import IdleLoop
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Week 1 Intro Arcade")
+    parser.add_argument(
+        "--swarm",
+        type=int,
+        default=0,
+        metavar="N",
+        help="swarm mode: N enemies stored in NumPy arrays (load test; needs numpy)",
+    )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="run the simulation on its own thread; the main thread only draws",
+    )
+    parser.add_argument(
+        "--no-idle",
+        action="store_true",
+        help="always run at the full frame rate, even on the title screen or in the background",
+    )
+    parser.add_argument(
+        "--idle-after",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="slow the loop down after this long without input (default: 60)",
+    )
+    args = parser.parse_args()
+
     pygame.init()
     pygame.display.set_caption("Week 1 Intro Arcade (Pygame)")
 
-    game = Game()
-    clock = pygame.time.Clock()
+    game = Game(swarm_size=args.swarm)
+    loop = IdleLoop(game.fps, after=args.idle_after, enabled=not args.no_idle)
+
+    if args.threaded:
+        from intro_arcade.threaded import run_threaded
+
+        run_threaded(game, loop)
+        pygame.quit()
+        return
 
     running = True
     while running:
-        dt = clock.tick(game.fps) / 1000.0
+        dt, events = loop.tick(menu=game.state != "playing")
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             else:
@@ -1,20 +1,38 @@
+import argparse
+
 import pygame
 
 from movement_bounds.game import Game
+from movement_bounds.idle import IdleLoop
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Week 2 Movement + Boundaries")
+    parser.add_argument(
+        "--no-idle",
+        action="store_true",
+        help="always run at the full frame rate, even on the title screen or in the background",
+    )
+    parser.add_argument(
+        "--idle-after",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="slow the loop down after this long without input (default: 60)",
+    )
+    args = parser.parse_args()
+
     pygame.init()
     pygame.display.set_caption("Week 2 Movement + Boundaries (Pygame)")
 
     game = Game()
-    clock = pygame.time.Clock()
+    loop = IdleLoop(game.fps, after=args.idle_after, enabled=not args.no_idle)
 
     running = True
     while running:
-        dt = clock.tick(game.fps) / 1000.0
+        dt, events = loop.tick(menu=game.state != "play")
         dt = min(dt, 0.05)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             else:
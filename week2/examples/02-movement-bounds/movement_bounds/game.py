@@ -6,6 +6,9 @@ from enum import Enum
 
 import pygame
 
+from movement_bounds.integrate import advance, fall
+from movement_bounds.timers import TimerWheel
+
 class BoundaryMode(str, Enum):
     CLAMP = "clamp"
     WRAP = "wrap"
@@ -40,8 +43,8 @@ class Game:
 
     def __init__(self) -> None:
         self.screen = pygame.display.set_mode((self.SCREEN_W, self.SCREEN_H))
-        self.font = pygame.font.SysFont(None, 22)
-        self.big_font = pygame.font.SysFont(None, 48)
+        self.font = pygame.font.Font(None, 22)
+        self.big_font = pygame.font.Font(None, 48)
 
         self.screen_rect = pygame.Rect(0, 0, self.SCREEN_W, self.SCREEN_H)
         self.playfield = pygame.Rect(
@@ -63,7 +66,9 @@ class Game:
         self.on_ground = True
         self.jump_requested = False
 
-        self.time_left = self.TIMER_SECONDS
+        # Countdowns (the level timer) run on this wheel; it only advances while playing.
+        self.timers = TimerWheel()
+        self.level_timer = self.timers.timer(self._time_up)
         self.goal_counter = 0
 
         self.stage = 0
@@ -90,11 +95,15 @@ class Game:
         tp_center = self._random_point_in_playfield(margin=70)
         self.teleporter.rect.center = (int(tp_center.x), int(tp_center.y))
 
-        self.time_left = self.TIMER_SECONDS
+        self.level_timer.start(self.TIMER_SECONDS)
 
         if not keep_state:
             self.state = "play"
 
+    def _time_up(self) -> None:
+        if self.state == "play":
+            self.state = "lose"
+
     def _cycle_boundary_mode(self) -> None:
         modes = list(BoundaryMode)
         idx = modes.index(self.boundary_mode)
@@ -173,35 +182,51 @@ class Game:
         # Treat the bottom of the playfield as "ground".
         if self.player_rect.bottom >= self.playfield.bottom:
             self.player_rect.bottom = self.playfield.bottom
+            self.player_pos.y = self.player_rect.centery
             self.player_vel.y = 0
             self.on_ground = True
 
         # Prevent leaving the top of the playfield.
         if self.player_rect.top < self.playfield.top:
             self.player_rect.top = self.playfield.top
+            self.player_pos.y = self.player_rect.centery
             if self.player_vel.y < 0:
                 self.player_vel.y = 0
 
-        self.player_pos.update(self.player_rect.center)
+    def _sync_moved_axes(self, before: tuple[int, int]) -> None:
+        # Copy the rect back into the float position only along the axes a rule
+        # moved it, so sub-pixel movement on the other axis isn't truncated away.
+        if self.player_rect.centerx != before[0]:
+            self.player_pos.x = self.player_rect.centerx
+        if self.player_rect.centery != before[1]:
+            self.player_pos.y = self.player_rect.centery
 
     def _apply_bounds_player(self) -> None:
+        before = self.player_rect.center
         if self.boundary_mode == BoundaryMode.CLAMP:
-            self.player_rect.clamp_ip(self.playfield)
-            self.player_pos.update(self.player_rect.center)
+            if not self.playfield.contains(self.player_rect):
+                self.player_rect.clamp_ip(self.playfield)
+                self._sync_moved_axes(before)
             return
 
         if self.boundary_mode == BoundaryMode.WRAP:
+            wrapped = False
             if self.player_rect.right < self.playfield.left:
                 self.player_rect.left = self.playfield.right
+                wrapped = True
             elif self.player_rect.left > self.playfield.right:
                 self.player_rect.right = self.playfield.left
+                wrapped = True
 
             if self.player_rect.bottom < self.playfield.top:
                 self.player_rect.top = self.playfield.bottom
+                wrapped = True
             elif self.player_rect.top > self.playfield.bottom:
                 self.player_rect.bottom = self.playfield.top
+                wrapped = True
 
-            self.player_pos.update(self.player_rect.center)
+            if wrapped:
+                self._sync_moved_axes(before)
             return
 
         # BOUNCE
@@ -229,7 +254,7 @@ class Game:
             bounced = True
 
         if bounced:
-            self.player_pos.update(self.player_rect.center)
+            self._sync_moved_axes(before)
 
     def _player_reaches_goal(self) -> bool:
         # Circle-vs-rect (approx): check rect center distance to goal.
@@ -241,20 +266,18 @@ class Game:
         if self.state != "play":
             return
 
-        self.time_left -= dt
-        if self.time_left <= 0:
-            self.time_left = 0
-            self.state = "lose"
+        self.timers.advance(dt)
+        if self.state != "play":
             return
 
         if self.platformer_mode:
             x = self._read_horizontal()
 
-            # Horizontal accel; no vertical input (gravity handles Y).
-            self.player_vel.x += x * self.PLAYER_ACCEL * dt
-            if x == 0:
-                self.player_vel.x -= self.player_vel.x * min(1.0, self.PLAYER_FRICTION * dt)
-            self.player_vel.x = max(-self.PLAYER_MAX_SPEED, min(self.PLAYER_MAX_SPEED, self.player_vel.x))
+            # Horizontal accel/friction; no vertical input (gravity handles Y).
+            # Closed-form steps are exact for any dt, so coarse ticks follow the same path.
+            vel_x = pygame.Vector2(self.player_vel.x, 0)
+            moved_x = advance(vel_x, pygame.Vector2(x * self.PLAYER_ACCEL, 0), friction=self.PLAYER_FRICTION, max_speed=self.PLAYER_MAX_SPEED, dt=dt)
+            self.player_vel.x = vel_x.x
 
             # Jump is a discrete action.
             if self.jump_requested and self.on_ground:
@@ -263,33 +286,30 @@ class Game:
             self.jump_requested = False
 
             # Gravity.
-            self.player_vel.y += self.GRAVITY * dt
+            moved_y, self.player_vel.y = fall(self.player_vel.y, self.GRAVITY, dt)
 
-            self.player_pos += self.player_vel * dt
+            self.player_pos += (moved_x.x, moved_y)
             self.player_rect.center = (int(self.player_pos.x), int(self.player_pos.y))
 
             # Use the existing boundary mode for horizontal bounds.
-            prev_y = self.player_rect.centery
+            prev_y = self.player_pos.y
             self._apply_bounds_player()
-            self.player_rect.centery = prev_y
             self.player_pos.y = prev_y
+            self.player_rect.centery = int(prev_y)
 
             # Then apply platformer-specific vertical bounds.
             self._apply_platformer_vertical_bounds()
         else:
             direction = self._read_direction()
 
-            # Accelerate toward direction.
-            self.player_vel += direction * self.PLAYER_ACCEL * dt
-
-            # Friction: nudge velocity toward zero.
-            if direction.length_squared() == 0:
-                self.player_vel -= self.player_vel * min(1.0, self.PLAYER_FRICTION * dt)
-
-            if self.player_vel.length() > self.PLAYER_MAX_SPEED:
-                self.player_vel.scale_to_length(self.PLAYER_MAX_SPEED)
-
-            self.player_pos += self.player_vel * dt
+            # Accelerate toward direction (capped at max speed); friction when there's no input.
+            self.player_pos += advance(
+                self.player_vel,
+                direction * self.PLAYER_ACCEL,
+                friction=self.PLAYER_FRICTION,
+                max_speed=self.PLAYER_MAX_SPEED,
+                dt=dt,
+            )
             self.player_rect.center = (int(self.player_pos.x), int(self.player_pos.y))
 
             self._apply_bounds_player()
@@ -317,7 +337,7 @@ class Game:
 
         control = "PLATFORMER" if self.platformer_mode else "TOPDOWN"
         left = f"Level {self.level}   Bounds: {self.boundary_mode.value.upper()}   Control: {control}"
-        right = f"Time: {self.time_left:0.1f}s"
+        right = f"Time: {self.level_timer.remaining:0.1f}s"
 
         left_surf = self.font.render(left, True, (216, 222, 233))
         right_surf = self.font.render(right, True, (216, 222, 233))
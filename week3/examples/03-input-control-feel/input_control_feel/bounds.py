@@ -0,0 +1,99 @@
+"""Boundary rules for many bodies at once (NumPy).
+
+Same rules as `Game._apply_bounds_player` / `Game._apply_platformer_vertical_bounds`,
+but for arrays of bodies instead of one player rect:
+
+- `pos`:  (N, 2) float array of centers (modified in place)
+- `vel`:  (N, 2) float array of velocities (modified in place)
+- `half`: half-extents, (N, 2) or a single (w/2, h/2) pair shared by every body
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+from input_control_feel.game import BoundaryMode
+
+
+def apply_bounds(
+    mode: BoundaryMode,
+    pos: np.ndarray,
+    vel: np.ndarray,
+    half: np.ndarray | tuple[float, float],
+    field: pygame.Rect,
+    *,
+    bounce_jump_speed: float | None = None,
+) -> np.ndarray:
+    """Apply one boundary mode to every body; returns a mask of the bodies it moved.
+
+    `bounce_jump_speed` is the platformer twist on BOUNCE: hitting a side wall also
+    launches the body upward, and the ceiling stops it instead of reflecting it.
+    """
+    half = np.broadcast_to(np.asarray(half, dtype=pos.dtype), pos.shape)
+    lo = np.array([field.left, field.top], dtype=pos.dtype)
+    hi = np.array([field.right, field.bottom], dtype=pos.dtype)
+
+    if mode == BoundaryMode.CLAMP:
+        before = pos.copy()
+        np.clip(pos, lo + half, hi - half, out=pos)
+        return (pos != before).any(axis=1)
+
+    if mode == BoundaryMode.WRAP:
+        # Fully off one side -> reappear just outside the opposite side.
+        off_lo = pos + half < lo
+        off_hi = pos - half > hi
+        pos[:] = np.where(off_lo, hi + half, np.where(off_hi, lo - half, pos))
+        return (off_lo | off_hi).any(axis=1)
+
+    # BOUNCE
+    hit_lo = pos - half < lo
+    hit_hi = ~hit_lo & (pos + half > hi)
+    pos[:] = np.where(hit_lo, lo + half, np.where(hit_hi, hi - half, pos))
+
+    hit_x = hit_lo[:, 0] | hit_hi[:, 0]
+    vel[hit_x, 0] *= -1
+    if bounce_jump_speed is None:
+        vel[hit_lo[:, 1] | hit_hi[:, 1], 1] *= -1
+    else:
+        vel[hit_x, 1] = -bounce_jump_speed
+        vel[hit_hi[:, 1], 1] *= -1
+
+    return hit_lo.any(axis=1) | hit_hi.any(axis=1)
+
+
+def apply_platformer_vertical_bounds(
+    pos: np.ndarray,
+    vel: np.ndarray,
+    half: np.ndarray | tuple[float, float],
+    field: pygame.Rect,
+) -> np.ndarray:
+    """Bottom of the field is ground, top is a ceiling; returns the on-ground mask."""
+    half = np.broadcast_to(np.asarray(half, dtype=pos.dtype), pos.shape)
+    hy = half[:, 1]
+
+    on_ground = pos[:, 1] + hy >= field.bottom
+    pos[on_ground, 1] = field.bottom - hy[on_ground]
+    vel[on_ground, 1] = 0
+
+    ceiling = pos[:, 1] - hy < field.top
+    pos[ceiling, 1] = field.top + hy[ceiling]
+    vel[ceiling & (vel[:, 1] < 0), 1] = 0
+
+    return on_ground
+
+
+def apply_platformer_bounds(
+    mode: BoundaryMode,
+    pos: np.ndarray,
+    vel: np.ndarray,
+    half: np.ndarray | tuple[float, float],
+    field: pygame.Rect,
+    *,
+    bounce_jump_speed: float | None = None,
+) -> np.ndarray:
+    """Platformer update order: boundary mode for X only, then ground/ceiling for Y."""
+    y = pos[:, 1].copy()
+    apply_bounds(mode, pos, vel, half, field, bounce_jump_speed=bounce_jump_speed)
+    pos[:, 1] = y
+    return apply_platformer_vertical_bounds(pos, vel, half, field)
@@ -5,6 +5,9 @@ from enum import Enum
 
 import pygame
 
+from input_control_feel.integrate import advance, fall
+from input_control_feel.timers import TimerWheel
+
 
 class BoundaryMode(str, Enum):
     CLAMP = "clamp"
@@ -46,8 +49,8 @@ class Game:
 
     def __init__(self) -> None:
         self.screen = pygame.display.set_mode((self.SCREEN_W, self.SCREEN_H))
-        self.font = pygame.font.SysFont(None, 22)
-        self.big_font = pygame.font.SysFont(None, 48)
+        self.font = pygame.font.Font(None, 22)
+        self.big_font = pygame.font.Font(None, 48)
 
         self.screen_rect = pygame.Rect(0, 0, self.SCREEN_W, self.SCREEN_H)
         self.playfield = pygame.Rect(
@@ -116,7 +119,9 @@ class Game:
         ]
         self.preset_idx = 0
 
-        self.dash_cooldown_left = 0.0
+        # Countdowns (dash cooldown) run on this wheel; it only advances while playing.
+        self.timers = TimerWheel()
+        self.dash_cooldown = self.timers.timer()
         self.last_move_dir = pygame.Vector2(1, 0)
 
     @property
@@ -139,7 +144,7 @@ class Game:
         self.player_rect.center = self.player_pos
         self.on_ground = True
         self.jump_requested = False
-        self.dash_cooldown_left = 0.0
+        self.dash_cooldown.cancel()
         self.last_move_dir = pygame.Vector2(1, 0)
 
         if not keep_state:
@@ -294,35 +299,51 @@ class Game:
         # Treat the bottom of the playfield as "ground".
         if self.player_rect.bottom >= self.playfield.bottom:
             self.player_rect.bottom = self.playfield.bottom
+            self.player_pos.y = self.player_rect.centery
             self.player_vel.y = 0
             self.on_ground = True
 
         # Prevent leaving the top of the playfield.
         if self.player_rect.top < self.playfield.top:
             self.player_rect.top = self.playfield.top
+            self.player_pos.y = self.player_rect.centery
             if self.player_vel.y < 0:
                 self.player_vel.y = 0
 
-        self.player_pos.update(self.player_rect.center)
+    def _sync_moved_axes(self, before: tuple[int, int]) -> None:
+        # Copy the rect back into the float position only along the axes a rule
+        # moved it, so sub-pixel movement on the other axis isn't truncated away.
+        if self.player_rect.centerx != before[0]:
+            self.player_pos.x = self.player_rect.centerx
+        if self.player_rect.centery != before[1]:
+            self.player_pos.y = self.player_rect.centery
 
     def _apply_bounds_player(self) -> None:
+        before = self.player_rect.center
         if self.boundary_mode == BoundaryMode.CLAMP:
-            self.player_rect.clamp_ip(self.playfield)
-            self.player_pos.update(self.player_rect.center)
+            if not self.playfield.contains(self.player_rect):
+                self.player_rect.clamp_ip(self.playfield)
+                self._sync_moved_axes(before)
             return
 
         if self.boundary_mode == BoundaryMode.WRAP:
+            wrapped = False
             if self.player_rect.right < self.playfield.left:
                 self.player_rect.left = self.playfield.right
+                wrapped = True
             elif self.player_rect.left > self.playfield.right:
                 self.player_rect.right = self.playfield.left
+                wrapped = True
 
             if self.player_rect.bottom < self.playfield.top:
                 self.player_rect.top = self.playfield.bottom
+                wrapped = True
             elif self.player_rect.top > self.playfield.bottom:
                 self.player_rect.bottom = self.playfield.top
+                wrapped = True
 
-            self.player_pos.update(self.player_rect.center)
+            if wrapped:
+                self._sync_moved_axes(before)
             return
 
         # BOUNCE
@@ -346,10 +367,10 @@ class Game:
             bounced = True
 
         if bounced:
-            self.player_pos.update(self.player_rect.center)
+            self._sync_moved_axes(before)
 
     def _try_dash(self) -> None:
-        if self.dash_cooldown_left > 0:
+        if self.dash_cooldown.active:
             return
 
         dash_dir = pygame.Vector2(self.last_move_dir)
@@ -359,25 +380,24 @@ class Game:
 
         # Impulse dash: a discrete action that modifies velocity once.
         self.player_vel += dash_dir * self.DASH_IMPULSE
-        self.dash_cooldown_left = self.DASH_COOLDOWN
+        self.dash_cooldown.start(self.DASH_COOLDOWN)
 
     def update(self, dt: float) -> None:
         if self.state != "play":
             return
 
-        if self.dash_cooldown_left > 0:
-            self.dash_cooldown_left = max(0.0, self.dash_cooldown_left - dt)
+        self.timers.advance(dt)
 
         p = self.preset
 
         if self.platformer_mode:
             x = self._read_horizontal()
 
-            # Horizontal accel; no vertical input (gravity handles Y).
-            self.player_vel.x += x * p.accel * dt
-            if x == 0:
-                self.player_vel.x -= self.player_vel.x * min(1.0, p.friction * dt)
-            self.player_vel.x = max(-p.max_speed, min(p.max_speed, self.player_vel.x))
+            # Horizontal accel/friction; no vertical input (gravity handles Y).
+            # Closed-form steps are exact for any dt, so coarse ticks follow the same path.
+            vel_x = pygame.Vector2(self.player_vel.x, 0)
+            moved_x = advance(vel_x, pygame.Vector2(x * p.accel, 0), friction=p.friction, max_speed=p.max_speed, dt=dt)
+            self.player_vel.x = vel_x.x
 
             # Jump is a discrete action.
             if self.jump_requested and self.on_ground:
@@ -386,33 +406,30 @@ class Game:
             self.jump_requested = False
 
             # Gravity.
-            self.player_vel.y += p.gravity * dt
+            moved_y, self.player_vel.y = fall(self.player_vel.y, p.gravity, dt)
 
-            self.player_pos += self.player_vel * dt
+            self.player_pos += (moved_x.x, moved_y)
             self.player_rect.center = (int(self.player_pos.x), int(self.player_pos.y))
 
             # Use the existing boundary mode for horizontal bounds.
-            prev_y = self.player_rect.centery
+            prev_y = self.player_pos.y
             self._apply_bounds_player()
-            self.player_rect.centery = prev_y
             self.player_pos.y = prev_y
+            self.player_rect.centery = int(prev_y)
 
             # Then apply platformer-specific vertical bounds.
             self._apply_platformer_vertical_bounds()
         else:
             direction = self._read_direction()
 
-            # Accelerate toward direction.
-            self.player_vel += direction * p.accel * dt
-
-            # Friction: nudge velocity toward zero when no input.
-            if direction.length_squared() == 0:
-                self.player_vel -= self.player_vel * min(1.0, p.friction * dt)
-
-            if self.player_vel.length() > p.max_speed:
-                self.player_vel.scale_to_length(p.max_speed)
-
-            self.player_pos += self.player_vel * dt
+            # Accelerate toward direction (capped at max speed); friction when there's no input.
+            self.player_pos += advance(
+                self.player_vel,
+                direction * p.accel,
+                friction=p.friction,
+                max_speed=p.max_speed,
+                dt=dt,
+            )
             self.player_rect.center = (int(self.player_pos.x), int(self.player_pos.y))
 
             self._apply_bounds_player()
@@ -426,7 +443,7 @@ class Game:
             f"Scheme: {self.control_scheme.value}   Feel: {self.preset.name}"
         )
 
-        dash = "READY" if self.dash_cooldown_left <= 0 else f"CD {self.dash_cooldown_left:0.2f}s"
+        dash = "READY" if not self.dash_cooldown.active else f"CD {self.dash_cooldown.remaining:0.2f}s"
         right = f"Dash: {dash}"
 
         left_surf = self.font.render(left, True, (216, 222, 233))
@@ -0,0 +1,77 @@
+"""Closed-form movement steps (exact for any dt).
+
+Updating with `vel += accel * dt` / `vel -= vel * friction * dt` (Euler steps) gives a
+slightly different path at 20 FPS than at 60 FPS. These helpers use the exact
+formulas for a whole tick instead:
+
+- constant acceleration:  v = v0 + a t,          x = v0 t + a t^2 / 2
+- friction (exp. decay):  v = v0 e^(-k t),       x = v0 (1 - e^(-k t)) / k
+
+so a coarse tick lands on (almost) the same trajectory as a fine one.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pygame
+
+
+def fall(v0: float, gravity: float, dt: float) -> tuple[float, float]:
+    """Constant acceleration along one axis; returns (displacement, new velocity)."""
+    return v0 * dt + 0.5 * gravity * dt * dt, v0 + gravity * dt
+
+
+def glide(vel: pygame.Vector2, friction: float, dt: float) -> pygame.Vector2:
+    """Friction only: decay `vel` in place and return the displacement."""
+    if friction <= 0:
+        return vel * dt
+    k = math.exp(-friction * dt)
+    moved = vel * ((1.0 - k) / friction)
+    vel *= k
+    return moved
+
+
+def accelerate(vel: pygame.Vector2, accel: pygame.Vector2, max_speed: float, dt: float) -> pygame.Vector2:
+    """Constant acceleration capped at `max_speed`: update `vel` in place, return displacement."""
+    end = vel + accel * dt
+    if end.length_squared() <= max_speed * max_speed:
+        moved = vel * dt + accel * (0.5 * dt * dt)
+        vel.update(end)
+        return moved
+
+    # Time `t` when the speed reaches the cap: solve |vel + accel t| = max_speed.
+    a = accel.length_squared()
+    b = 2.0 * vel.dot(accel)
+    c = vel.length_squared() - max_speed * max_speed
+    if c >= 0 or a == 0:
+        t = 0.0
+    else:
+        t = (-b + math.sqrt(b * b - 4.0 * a * c)) / (2.0 * a)
+
+    # Accelerate up to the cap, then cruise at max speed for the rest of the tick.
+    capped = end
+    capped.scale_to_length(max_speed)
+    moved = vel * t + accel * (0.5 * t * t) + capped * (dt - t)
+    vel.update(capped)
+    return moved
+
+
+def advance(
+    vel: pygame.Vector2,
+    accel: pygame.Vector2,
+    *,
+    friction: float,
+    max_speed: float,
+    dt: float,
+) -> pygame.Vector2:
+    """One movement tick: accelerate while there is input, otherwise slide to a stop.
+
+    Updates `vel` in place and returns the displacement to add to the position.
+    """
+    if accel.length_squared() > 0:
+        return accelerate(vel, accel, max_speed, dt)
+
+    if vel.length_squared() > max_speed * max_speed:
+        vel.scale_to_length(max_speed)
+    return glide(vel, friction, dt)
@@ -5,6 +5,8 @@ import random
 
 import pygame
 
+from live_build_collision_loop.timers import TimerWheel
+
 
 @dataclass(frozen=True)
 class Palette:
@@ -19,7 +21,7 @@ class Palette:
 
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, center: tuple[int, int], *, color: pygame.Color) -> None:
+    def __init__(self, center: tuple[int, int], *, color: pygame.Color, timers: TimerWheel) -> None:
         super().__init__()
         self.rect = pygame.Rect(0, 0, 28, 28)
         self.rect.center = center
@@ -28,12 +30,12 @@ class Player(pygame.sprite.Sprite):
         self.color = color
 
         self.speed = 320.0
-        self.invincible_for = 0.0
-        self.hit_flash_for = 0.0
+        self.invincible = timers.timer()
+        self.hit_flash = timers.timer()
 
     @property
     def is_invincible(self) -> bool:
-        return self.invincible_for > 0
+        return self.invincible.active
 
 
 class Coin(pygame.sprite.Sprite):
@@ -84,12 +86,13 @@ class Game:
 
     COINS_TO_WIN = 10
 
-    def __init__(self) -> None:
+    def __init__(self, seed: int = 4) -> None:
         self.palette = Palette()
+        self.seed = seed  # coin layout
 
         self.screen = pygame.display.set_mode((self.SCREEN_W, self.SCREEN_H))
-        self.font = pygame.font.SysFont(None, 22)
-        self.big_font = pygame.font.SysFont(None, 44)
+        self.font = pygame.font.Font(None, 22)
+        self.big_font = pygame.font.Font(None, 44)
 
         self.screen_rect = pygame.Rect(0, 0, self.SCREEN_W, self.SCREEN_H)
         self.playfield = pygame.Rect(
@@ -106,13 +109,20 @@ class Game:
         self.coins: pygame.sprite.Group[Coin] = pygame.sprite.Group()
         self.hazards: pygame.sprite.Group[Hazard] = pygame.sprite.Group()
 
-        self.player = Player(self.playfield.center, color=self.palette.player)
+        # Every countdown (i-frames, hit flash, shake) runs on this wheel.
+        self.timers = TimerWheel()
+
+        self.player = Player(self.playfield.center, color=self.palette.player, timers=self.timers)
         self.all_sprites.add(self.player)
 
         self.score = 0
         self.hp = 3
 
-        self._shake_for = 0.0
+        self._shake = self.timers.timer()
+
+        # Win/lose overlay: built once per message, see `_draw_center_message`.
+        self._overlay_key: tuple | None = None
+        self._overlay: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
         self._spawn_level()
 
@@ -120,7 +130,7 @@ class Game:
         self.coins.empty()
         self.hazards.empty()
 
-        rng = random.Random(4)
+        rng = random.Random(self.seed)
 
         def rand_point() -> tuple[int, int]:
             return (
@@ -154,6 +164,37 @@ class Game:
                 self.all_sprites.add(c)
                 break
 
+    def take_over(self, old: Game) -> None:
+        """Continue the run `old` was playing (used by hot reload, where `old` runs the previous code).
+
+        Progress carries over (score, HP, player position, coins still out, hazard
+        positions, running timers); layout and tuning come from the new code.
+        """
+        self.state = old.state
+        self.score = old.score
+        self.hp = old.hp
+        self.debug = old.debug
+
+        self.player.rect.center = old.player.rect.center
+        for new_timer, old_timer in (
+            (self.player.invincible, old.player.invincible),
+            (self.player.hit_flash, old.player.hit_flash),
+            (self._shake, old._shake),
+        ):
+            if old_timer.active:
+                new_timer.start(old_timer.remaining)
+
+        for coin in self.coins:
+            coin.kill()
+        for old_coin in old.coins:
+            coin = Coin(old_coin.rect.center, color=self.palette.coin)
+            self.coins.add(coin)
+            self.all_sprites.add(coin)
+
+        for hazard, old_hazard in zip(self.hazards, old.hazards):
+            hazard.rect.center = old_hazard.rect.center
+            hazard.direction = old_hazard.direction
+
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type != pygame.KEYDOWN:
             return
@@ -176,8 +217,8 @@ class Game:
         self.hp = 3
 
         self.player.rect.center = self.playfield.center
-        self.player.invincible_for = 0.0
-        self.player.hit_flash_for = 0.0
+        self.player.invincible.cancel()
+        self.player.hit_flash.cancel()
 
         self._spawn_level()
 
@@ -205,22 +246,15 @@ class Game:
             return
 
         self.hp -= 1
-        self.player.invincible_for = 0.8
-        self.player.hit_flash_for = 0.12
-        self._shake_for = 0.16
+        self.player.invincible.start(0.8)
+        self.player.hit_flash.start(0.12)
+        self._shake.start(0.16)
 
         if self.hp <= 0:
             self.state = "lose"
 
     def update(self, dt: float) -> None:
-        if self._shake_for > 0:
-            self._shake_for = max(0.0, self._shake_for - dt)
-
-        if self.player.invincible_for > 0:
-            self.player.invincible_for = max(0.0, self.player.invincible_for - dt)
-
-        if self.player.hit_flash_for > 0:
-            self.player.hit_flash_for = max(0.0, self.player.hit_flash_for - dt)
+        self.timers.advance(dt)
 
         if self.state != "play":
             self.hazards.update(dt)
@@ -246,10 +280,10 @@ class Game:
         self.hazards.update(dt)
 
     def _camera_offset(self) -> pygame.Vector2:
-        if self._shake_for <= 0:
+        if not self._shake.active:
             return pygame.Vector2(0, 0)
 
-        strength = 8.0 * (self._shake_for / 0.16)
+        strength = 8.0 * (self._shake.remaining / 0.16)
         return pygame.Vector2(
             random.uniform(-strength, strength),
             random.uniform(-strength, strength),
@@ -301,9 +335,9 @@ class Game:
         visual.center = pr.center
 
         player_color = self.player.color
-        if self.player.hit_flash_for > 0:
+        if self.player.hit_flash.active:
             player_color = pygame.Color("#d08770")
-        elif self.player.is_invincible and int(self.player.invincible_for * 18) % 2 == 0:
+        elif self.player.is_invincible and int(self.player.invincible.remaining * 18) % 2 == 0:
             player_color = pygame.Color("#d8dee9")
 
         pygame.draw.circle(self.screen, player_color, visual.center, visual.width // 2)
@@ -330,16 +364,26 @@ class Game:
         )
 
     def _draw_center_message(self, message: str, cam: pygame.Vector2) -> None:
+        # The dimming layer and the rendered lines only change with the message.
+        key = (message, self.playfield.size)
+        if self._overlay_key != key:
+            self._overlay_key = key
+            self._overlay = self._build_overlay(message)
+
+        self.screen.blits([(surf, pos + cam) for surf, pos in self._overlay], doreturn=False)
+
+    def _build_overlay(self, message: str) -> list[tuple[pygame.Surface, tuple[int, int]]]:
         lines = message.split("\n")
         total_h = len(lines) * 52
         y = self.playfield.centery - total_h // 2
 
         overlay = pygame.Surface((self.playfield.width, self.playfield.height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, self.playfield.topleft + cam)
+        layers = [(overlay, self.playfield.topleft)]
 
         for line in lines:
             surf = self.big_font.render(line, True, self.palette.text)
             x = self.playfield.centerx - surf.get_width() // 2
-            self.screen.blit(surf, (x, y) + cam)
+            layers.append((surf, (x, y)))
             y += 52
+        return layers
@@ -0,0 +1,57 @@
+"""Hot reload: pick up code changes without restarting the game.
+
+`Reloader` watches the package's `.py` files (a cheap mtime check a few times a
+second). When one changes, it reloads the changed modules and then the game module,
+so `module.Game` is the edited class. `main.py --reload` builds a new `Game` from
+it and calls `take_over(old_game)` to carry the run over. The window stays open:
+the new game's `set_mode` call gets the same display surface back.
+
+If the edited code fails to import or start, the old game simply keeps running.
+"""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+import sys
+from types import ModuleType
+
+
+class Reloader:
+    def __init__(self, module: ModuleType, *, interval: float = 0.25) -> None:
+        self.module = module
+        self.package = module.__package__ or ""
+        self.folder = Path(module.__file__ or "").resolve().parent
+        self.interval = interval
+
+        self._next_check = 0.0
+        self._mtimes = self._scan()
+
+    def _scan(self) -> dict[str, int]:
+        mtimes: dict[str, int] = {}
+        for path in self.folder.glob("*.py"):
+            try:
+                mtimes[path.stem] = path.stat().st_mtime_ns
+            except OSError:
+                pass  # deleted or being replaced by the editor right now
+        return mtimes
+
+    def changed(self, now: float) -> list[str]:
+        """Modules (file stems) changed since the last check; checks at most every `interval` s."""
+        if now < self._next_check:
+            return []
+        self._next_check = now + self.interval
+
+        mtimes = self._scan()
+        changed = [stem for stem, mtime in mtimes.items() if self._mtimes.get(stem) != mtime]
+        self._mtimes = mtimes
+        return changed
+
+    def reload(self, changed: list[str]) -> ModuleType:
+        """Reload the changed helper modules, then the watched module (which imports them)."""
+        for stem in changed:
+            name = f"{self.package}.{stem}" if self.package else stem
+            if name != self.module.__name__ and name in sys.modules:
+                importlib.reload(sys.modules[name])
+        self.module = importlib.reload(self.module)
+        return self.module
@@ -1,27 +1,71 @@
+import argparse
+import time
+import traceback
+
 import pygame
 
+import live_build_collision_loop.game
 from live_build_collision_loop.game import Game
+from live_build_collision_loop.hotreload import Reloader
+from live_build_collision_loop.idle import IdleLoop
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Week 4 Live Build Collision Loop")
+    parser.add_argument(
+        "--reload",
+        action="store_true",
+        help="hot reload: apply edits to the game code while it runs, keeping the current run",
+    )
+    parser.add_argument(
+        "--no-idle",
+        action="store_true",
+        help="always run at the full frame rate, even on the title screen or in the background",
+    )
+    parser.add_argument(
+        "--idle-after",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="slow the loop down after this long without input (default: 60)",
+    )
+    args = parser.parse_args()
+
     pygame.init()
     pygame.display.set_caption("Week 4 — Live Build Collision Loop")
 
-    clock = pygame.time.Clock()
+    loop = IdleLoop(60, after=args.idle_after, enabled=not args.no_idle)
     running = True
 
     game = Game()
+    reloader = Reloader(live_build_collision_loop.game) if args.reload else None
 
     while running:
-        dt = clock.tick(60) / 1000.0
+        # The hazards keep moving on the win/lose screens, just at the idle rate.
+        dt, events = loop.tick(menu=game.state != "play")
         dt = min(dt, 0.05)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 break
             game.handle_event(event)
 
+        if reloader is not None:
+            changed = reloader.changed(time.perf_counter())
+            if changed:
+                t0 = time.perf_counter()
+                try:
+                    module = reloader.reload(changed)
+                    new_game = module.Game()
+                    new_game.take_over(game)
+                    game = new_game
+                except Exception:
+                    traceback.print_exc()
+                    print("Reload failed; still running the previous code.")
+                else:
+                    print(f"Reloaded {', '.join(changed)} in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
         game.update(dt)
         game.draw()
         pygame.display.flip()
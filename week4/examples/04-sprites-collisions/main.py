@@ -1,30 +1,61 @@
+import argparse
+
 import pygame # type: ignore
 
 from sprites_collisions.game import Game
+from sprites_collisions.idle import IdleLoop
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Week 4 Sprites + Collisions")
+    parser.add_argument(
+        "--level",
+        metavar="PATH",
+        help="play a compiled .lvl level (build one with sprites_collisions.levelbuild; needs numpy)",
+    )
+    parser.add_argument(
+        "--stage-cache",
+        metavar="DIR",
+        help="also keep generated stages on disk in DIR (default: memory only)",
+    )
+    parser.add_argument(
+        "--no-idle",
+        action="store_true",
+        help="always run at the full frame rate, even on the title screen or in the background",
+    )
+    parser.add_argument(
+        "--idle-after",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="slow the loop down after this long without input (default: 60)",
+    )
+    args = parser.parse_args()
+
     pygame.init()
     pygame.display.set_caption("Week 4 Sprites + Collisions (Pygame)")
 
-    game = Game()
-    clock = pygame.time.Clock()
+    game = Game(level_path=args.level, stage_cache_dir=args.stage_cache)
+    loop = IdleLoop(game.fps, after=args.idle_after, enabled=not args.no_idle)
 
     running = True
     while running:
-        dt = clock.tick(game.fps) / 1000.0
+        dt, events = loop.tick(menu=game.state != "play")
         dt = min(dt, 0.05)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             else:
                 game.handle_event(event)
 
         game.update(dt)
-        game.draw()
-        pygame.display.flip()
+        # Title and game-over screens are only redrawn when something changed.
+        if game.needs_redraw():
+            game.draw()
+            pygame.display.flip()
 
+    game.close()
     pygame.quit()
 
 
@@ -0,0 +1,75 @@
+"""Follow camera: which part of the world is on screen, and where.
+
+World coordinates are where things *are*; screen coordinates are where they're
+*drawn*. The camera keeps `pos` (the world point shown at the top-left of the
+viewport) and converts between the two with a single offset.
+"""
+
+from __future__ import annotations
+
+import pygame # type: ignore
+
+
+class Camera:
+    def __init__(
+        self,
+        viewport: pygame.Rect,
+        bounds: pygame.Rect,
+        *,
+        deadzone: tuple[int, int] = (160, 120),
+    ) -> None:
+        self.viewport = viewport.copy()  # screen area the world is drawn into
+        self.bounds = bounds.copy()  # world area the camera may show
+        self.deadzone = deadzone  # target can move this much around the center freely
+        self.pos = pygame.Vector2(bounds.topleft)
+        self._clamp()
+
+    @property
+    def view(self) -> pygame.Rect:
+        """The world rect currently visible."""
+        return pygame.Rect(int(self.pos.x), int(self.pos.y), self.viewport.width, self.viewport.height)
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        """Add to a world position to get its screen position."""
+        return (self.viewport.x - int(self.pos.x), self.viewport.y - int(self.pos.y))
+
+    def to_screen(self, rect: pygame.Rect) -> pygame.Rect:
+        return rect.move(self.offset)
+
+    def to_world(self, point: tuple[float, float]) -> pygame.Vector2:
+        ox, oy = self.offset
+        return pygame.Vector2(point[0] - ox, point[1] - oy)
+
+    def center_on(self, point: tuple[float, float]) -> None:
+        self.pos.update(point[0] - self.viewport.width / 2, point[1] - self.viewport.height / 2)
+        self._clamp()
+
+    def follow(self, point: tuple[float, float]) -> None:
+        """Scroll just enough to keep `point` inside the deadzone box at the view center."""
+        dz = pygame.Rect(0, 0, *self.deadzone)
+        dz.center = (int(self.pos.x + self.viewport.width / 2), int(self.pos.y + self.viewport.height / 2))
+
+        x, y = point
+        if x < dz.left:
+            self.pos.x -= dz.left - x
+        elif x > dz.right:
+            self.pos.x += x - dz.right
+        if y < dz.top:
+            self.pos.y -= dz.top - y
+        elif y > dz.bottom:
+            self.pos.y += y - dz.bottom
+
+        self._clamp()
+
+    def _clamp(self) -> None:
+        # Keep the view inside the world; a world smaller than the view is centered.
+        b = self.bounds
+        if b.width <= self.viewport.width:
+            self.pos.x = b.centerx - self.viewport.width / 2
+        else:
+            self.pos.x = max(b.left, min(b.right - self.viewport.width, self.pos.x))
+        if b.height <= self.viewport.height:
+            self.pos.y = b.centery - self.viewport.height / 2
+        else:
+            self.pos.y = max(b.top, min(b.bottom - self.viewport.height, self.pos.y))
@@ -2,10 +2,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-import random
+import os
+from typing import TYPE_CHECKING, Sequence
 
 import pygame # type: ignore
 
+from sprites_collisions.camera import Camera
+from sprites_collisions.renderqueue import RenderQueue
+from sprites_collisions.rng import RandomStreams
+from sprites_collisions.stages import Stage, StageCache, generate_stage
+from sprites_collisions.stamps import StampCache
+from sprites_collisions.sweep import sweep_move
+from sprites_collisions.tilemap import WALL, TileMap
+from sprites_collisions.timers import TimerWheel
+
+if TYPE_CHECKING:
+    from sprites_collisions.levelfile import Level
+
+
+# Events after which a static screen is drawn again.
+_REDRAW_EVENTS = frozenset({pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED})
+
+# Draw order (see `RenderQueue`).
+LAYER_TILES = 0
+LAYER_COINS = 1
+LAYER_HAZARDS = 2
+LAYER_PLAYER = 3
+
 
 @dataclass(frozen=True)
 class Palette:
@@ -19,18 +42,14 @@ class Palette:
     hazard: pygame.Color = field(default_factory=lambda: pygame.Color("#bf616a"))
     wall: pygame.Color = field(default_factory=lambda: pygame.Color("#4c566a"))
 
+    player_blink: pygame.Color = field(default_factory=lambda: pygame.Color("#d8dee9"))
+    player_golden: pygame.Color = field(default_factory=lambda: pygame.Color("#fcb830"))
+
 
 def _clamp(value: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, value))
 
 
-class Wall(pygame.sprite.Sprite):
-    def __init__(self, rect: pygame.Rect, color: pygame.Color) -> None:
-        super().__init__()
-        self.rect = rect.copy()
-        self.color = color
-
-
 class Coin(pygame.sprite.Sprite):
     def __init__(
         self,
@@ -89,6 +108,7 @@ class Player(pygame.sprite.Sprite):
         hitbox_size: int = 28,
         visual_size: int = 38,
         color: pygame.Color,
+        timers: TimerWheel,
     ) -> None:
         super().__init__()
         self.rect = pygame.Rect(0, 0, hitbox_size, hitbox_size)
@@ -101,16 +121,16 @@ class Player(pygame.sprite.Sprite):
         self.speed = 320.0
 
         self.hp = 3
-        self.invincible_for = 0.0
-        self.golden_for = 0.0
+        self.invincible = timers.timer()
+        self.golden = timers.timer()
 
     @property
     def is_invincible(self) -> bool:
-        return self.invincible_for > 0
+        return self.invincible.active
     
     @property
     def is_golden(self) -> bool:
-        return self.golden_for > 0
+        return self.golden.active
 
 
 class Game:
@@ -119,14 +139,17 @@ class Game:
     SCREEN_W, SCREEN_H = 960, 540
     HUD_H = 56
     PADDING = 12
+    TILE = 16
 
-    def __init__(self) -> None:
+    def __init__(self, level_path: str | None = None, stage_cache_dir: str | None = None, seed: int = 0) -> None:
         self.score = 0
+        # Run seed: stage layouts and shake derive from it, so another seed is another game.
+        self.seed = seed
         self.palette = Palette()
 
         self.screen = pygame.display.set_mode((self.SCREEN_W, self.SCREEN_H))
-        self.font = pygame.font.SysFont(None, 22)
-        self.big_font = pygame.font.SysFont(None, 40)
+        self.font = pygame.font.Font(None, 22)
+        self.big_font = pygame.font.Font(None, 40)
 
         self.stage = 0 # level progression
 
@@ -138,36 +161,133 @@ class Game:
             self.SCREEN_H - self.HUD_H - 2 * self.PADDING,
         )
 
+        # Level layout (walls + spawn points) is the same every stage; only the coins
+        # change. An optional compiled level (see levelbuild.py) needs NumPy, so it is
+        # imported only when used.
+        self.level: Level | None = None
+        self._open_tiles: Sequence[int] | None = None
+        self._fixed_coins: tuple[tuple[int, int], ...] = ()
+        if level_path is not None:
+            from sprites_collisions.levelfile import load_level
+
+            self.level = load_level(level_path)
+            self._load_layout(self.level)
+            namespace = f"{os.path.splitext(os.path.basename(level_path))[0]}-{self.level.checksum():08x}"
+        else:
+            self._build_layout()
+            namespace = "arena"
+
+        # The world is the tilemap; the camera shows the playfield-sized part of it
+        # around the player (the whole thing, so no scrolling, when the map fits).
+        self.camera = Camera(self.playfield, bounds=self.tiles.rect)
+
+        # Stages are generated from the stage number and run seed, cached, and the next
+        # one is prefetched in the background while this one is played.
+        self.stages = StageCache(self._generate_stage, directory=stage_cache_dir, namespace=namespace)
+
         self.debug = False
         self.state = "title"  # title | play | gameover
 
         self.all_sprites: pygame.sprite.Group[pygame.sprite.Sprite] = pygame.sprite.Group()
-        self.walls: pygame.sprite.Group[Wall] = pygame.sprite.Group()
         self.coins: pygame.sprite.Group[Coin] = pygame.sprite.Group()
         self.hazards: pygame.sprite.Group[Hazard] = pygame.sprite.Group()
 
-        self.player = Player(self.playfield.center, color=self.palette.player)
+        # Every countdown (i-frames, gold flash, shake) runs on this wheel.
+        self.timers = TimerWheel()
+
+        self.player = Player(self._player_spawn, color=self.palette.player, timers=self.timers)
         self.all_sprites.add(self.player)
 
-        self._shake = 0.0
+        self._shake = self.timers.timer()
+        # Shake has its own random stream (stage layouts use streams keyed by stage).
+        self._shake_rng = RandomStreams(seed=seed).stream("shake")
         self._reset_level(keep_state=True)
 
+        # Sprite shapes are baked into stamps up front (every player color included),
+        # then each frame is just blits, submitted per layer.
+        self.stamps = StampCache()
+        for coin in self.coins:
+            self.stamps.get(_make_circle_stamp, coin.visual_size, coin.color)
+        for hazard in self.hazards:
+            self.stamps.get(_make_triangle_stamp, hazard.rect.size, hazard.color)
+        for color in (self.palette.player, self.palette.player_blink, self.palette.player_golden):
+            self.stamps.get(_make_circle_stamp, self.player.visual_size, color)
+        self.render_queue = RenderQueue()
+
+        # Title/game-over overlay: built once per message, see `_draw_center_message`.
+        self._overlay_key: tuple | None = None
+        self._overlay: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        # Static screens are only redrawn when something changed, see `needs_redraw`.
+        self._redraw = True
+
     def _reset_level(self, *, keep_state: bool = False) -> None:
         self.stage += 1
+        stage = self.stages.get(self._stage_seed(self.stage))
+        self.stages.prefetch(self._stage_seed(self.stage + 1))
+
         self.all_sprites.empty()
-        self.walls.empty()
         self.coins.empty()
         self.hazards.empty()
 
-        self.player = Player(self.playfield.center, color=self.palette.player)
+        self.player.invincible.cancel()
+        self.player.golden.cancel()
+        self.player = Player(stage.player, color=self.palette.player, timers=self.timers)
         self.all_sprites.add(self.player)
+        self.camera.center_on(self.player.rect.center)
 
-        rng = random.Random(self.stage)
+        # Hazards (damage)
+        for x, y, patrol_dx, speed in stage.hazards:
+            hz = Hazard((x, y), color=self.palette.hazard, patrol_dx=patrol_dx, speed=speed)
+            self.hazards.add(hz)
+            self.all_sprites.add(hz)
+
+        # Coins (trigger)
+        for center in stage.coins:
+            coin = Coin(center, color=self.palette.coin)
+            self.coins.add(coin)
+            self.all_sprites.add(coin)
+
+        if not keep_state:
+            self.state = "play"
+
+    def _stage_seed(self, stage: int) -> int:
+        # Run seed 0 keeps the plain stage numbers (and any stages already cached on disk).
+        return stage + self.seed * 1_000_000
+
+    def _generate_stage(self, seed: int) -> Stage:
+        # May run on the prefetch thread: only reads the layout, never touches sprites.
+        if self._fixed_coins:
+            return Stage(seed, self._player_spawn, self._hazard_spawns, self._fixed_coins)
+        return generate_stage(
+            seed,
+            tiles=self.tiles,
+            area=self.playfield,
+            player=self._player_spawn,
+            hazards=self._hazard_spawns,
+            open_tiles=self._open_tiles,
+        )
+
+    def _map_origin(self, cols: int, rows: int, tile_size: int) -> tuple[int, int]:
+        # Maps are centered in the playfield.
+        return (
+            self.playfield.left + (self.playfield.width - cols * tile_size) // 2,
+            self.playfield.top + (self.playfield.height - rows * tile_size) // 2,
+        )
+
+    def _build_layout(self) -> None:
+        # Level geometry is a tilemap centered in the playfield; walls snap to tiles.
+        cols = self.playfield.width // self.TILE
+        rows = self.playfield.height // self.TILE
+        self.tiles = TileMap(
+            cols,
+            rows,
+            tile_size=self.TILE,
+            origin=self._map_origin(cols, rows, self.TILE),
+            colors={WALL: self.palette.wall},
+        )
 
         def add_wall(r: pygame.Rect) -> None:
-            wall = Wall(r, self.palette.wall)
-            self.walls.add(wall)
-            self.all_sprites.add(wall)
+            self.tiles.fill(r, WALL)
 
         t = 16
         # Arena boundary (solid)
@@ -181,39 +301,32 @@ class Game:
         add_wall(pygame.Rect(self.playfield.left + 380, self.playfield.top + 40, 18, 240))
         add_wall(pygame.Rect(self.playfield.left + 540, self.playfield.top + 220, 240, 18))
 
-        # Hazards (damage)
-        h1 = Hazard((self.playfield.centerx + 180, self.playfield.centery - 80), color=self.palette.hazard)
-        h2 = Hazard(
-            (self.playfield.centerx - 140, self.playfield.centery + 140),
-            color=self.palette.hazard,
-            patrol_dx=110,
-            speed=220.0,
+        self._player_spawn = self.playfield.center
+        # Hazards: center x, center y, patrol_dx, speed
+        self._hazard_spawns = (
+            (self.playfield.centerx + 180, self.playfield.centery - 80, 140, 180.0),
+            (self.playfield.centerx - 140, self.playfield.centery + 140, 110, 220.0),
         )
-        self.hazards.add(h1, h2)
-        self.all_sprites.add(h1, h2)
 
-        # Coins (trigger)
-        for _ in range(8):
-            for __ in range(100):
-                x = rng.randint(self.playfield.left + 40, self.playfield.right - 40)
-                y = rng.randint(self.playfield.top + 40, self.playfield.bottom - 40)
-                candidate = Coin((x, y), color=self.palette.coin)
-
-                if pygame.sprite.spritecollideany(candidate, self.walls):
-                    continue
-                if pygame.sprite.spritecollideany(candidate, self.coins):
-                    continue
-                if candidate.rect.colliderect(self.player.rect):
-                    continue
-
-                self.coins.add(candidate)
-                self.all_sprites.add(candidate)
-                break
+    def _load_layout(self, level: Level) -> None:
+        # Geometry, spawns and the collision bitmap all come straight from the file.
+        from sprites_collisions.levelfile import UNREACHABLE
 
-        if not keep_state:
-            self.state = "play"
+        origin = self._map_origin(level.cols, level.rows, level.tile_size)
+        self.tiles = TileMap.from_level(level, origin=origin, colors={WALL: self.palette.wall})
+
+        ox, oy = origin
+        self._player_spawn = (ox + int(level.player[0]), oy + int(level.player[1]))
+        self._hazard_spawns = tuple(
+            (ox + int(x), oy + int(y), int(patrol_dx), speed) for x, y, patrol_dx, speed in level.hazards.tolist()
+        )
+        self._fixed_coins = tuple((ox + x, oy + y) for x, y in level.coins.tolist())
+        # Random coins only go on tiles the player can walk to (the file's navigation data).
+        self._open_tiles = (level.nav.ravel() != UNREACHABLE).nonzero()[0]
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type in _REDRAW_EVENTS:
+            self._redraw = True  # the window needs repainting, or input may change the picture
         if event.type != pygame.KEYDOWN:
             return
 
@@ -253,34 +366,24 @@ class Game:
             v = v.normalize()
         return v
 
-    def _move_player_axis(self, axis: str, amount: float) -> None:
-        if axis == "x":
-            self.player.rect.x += int(round(amount))
-        else:
-            self.player.rect.y += int(round(amount))
-
-        hits = pygame.sprite.spritecollide(self.player, self.walls, dokill=False)
-        if not hits:
-            return
-
-        for wall in hits:
-            if axis == "x":
-                if amount > 0:
-                    self.player.rect.right = wall.rect.left
-                elif amount < 0:
-                    self.player.rect.left = wall.rect.right
-            else:
-                if amount > 0:
-                    self.player.rect.bottom = wall.rect.top
-                elif amount < 0:
-                    self.player.rect.top = wall.rect.bottom
+    def _move_player(self, dx: float, dy: float) -> None:
+        # Swept collision: stop at the first wall along the whole move, then slide.
+        # A fast move can't skip over a thin wall, so no substeps are needed.
+        # Broadphase: only the solid tiles under the box swept over the whole move.
+        start = self.player.rect
+        area = start.union(start.move(int(dx), int(dy))).inflate(2, 2)
+        hit_x, hit_y = sweep_move(self.player.rect, dx, dy, self.tiles.solid_rects(area))
+        if hit_x:
+            self.player.vel.x = 0
+        if hit_y:
+            self.player.vel.y = 0
 
     def _apply_damage(self, source_rect: pygame.Rect) -> None:
         if self.player.is_invincible:
             return
 
         self.player.hp -= 1
-        self.player.invincible_for = 0.85
+        self.player.invincible.start(0.85)
 
         push = pygame.Vector2(self.player.rect.center) - pygame.Vector2(source_rect.center)
         if push.length_squared() == 0:
@@ -288,15 +391,29 @@ class Game:
         push = push.normalize() * 520.0
         self.player.vel.update(push)
 
-        self._shake = 0.18
+        self._shake.start(0.18)
 
         if self.player.hp <= 0:
             self.state = "gameover"
             self.score = 0
 
+    @property
+    def is_static(self) -> bool:
+        """True while nothing on screen moves: title or game over, with no timer (shake, blink) running."""
+        return self.state != "play" and len(self.timers) == 0
+
+    def needs_redraw(self) -> bool:
+        """Whether the next frame could look different from the last one drawn."""
+        return self._redraw or not self.is_static
+
+    def close(self) -> None:
+        """Stop the stage prefetch thread; call when done with the game."""
+        self.stages.close()
+
     def update(self, dt: float) -> None:
-        if self._shake > 0:
-            self._shake = max(0.0, self._shake - dt)
+        if len(self.timers):
+            self._redraw = True  # something is counting down, so the picture still changes
+        self.timers.advance(dt)
 
         if self.state != "play":
             return
@@ -304,15 +421,15 @@ class Game:
         move = self._read_move()
         self.player.vel.update(move * self.player.speed)
 
-        # Axis-separated movement against solid walls
-        self._move_player_axis("x", self.player.vel.x * dt)
-        self._move_player_axis("y", self.player.vel.y * dt)
+        # Movement against solid walls
+        self._move_player(self.player.vel.x * dt, self.player.vel.y * dt)
+        self.camera.follow(self.player.rect.center)
 
         # Triggers: coin pickup
         picked = pygame.sprite.spritecollide(self.player, self.coins, dokill=True)
         if picked:
             self.score += len(picked)
-            self.player.golden_for = 0.3 # 1/3 second
+            self.player.golden.start(0.3) # 1/3 second
 
         # Hazards: damage + response
         for hz in pygame.sprite.spritecollide(self.player, self.hazards, dokill=False):
@@ -320,25 +437,19 @@ class Game:
 
         self.hazards.update(dt)
 
-        if self.player.invincible_for > 0:
-            self.player.invincible_for = max(0.0, self.player.invincible_for - dt)
-
-        if self.player.golden_for > 0:
-            self.player.golden_for = max(0.0, self.player.golden_for - dt)
-
         if len(self.coins) == 0:
             # Quick win condition: respawn coins + hazards to keep playing
             self._reset_level(keep_state=True)
             self.state = "play"
 
     def _camera_offset(self) -> pygame.Vector2:
-        if self._shake <= 0:
+        if not self._shake.active:
             return pygame.Vector2(0, 0)
 
-        strength = 9.0 * (self._shake / 0.18)
+        strength = 9.0 * (self._shake.remaining / 0.18)
         return pygame.Vector2(
-            random.uniform(-strength, strength),
-            random.uniform(-strength, strength),
+            self._shake_rng.uniform(-strength, strength),
+            self._shake_rng.uniform(-strength, strength),
         )
 
     def draw(self) -> None:
@@ -363,50 +474,58 @@ class Game:
             (14, 36),
         )
 
-        cam = self._camera_offset()
+        shake = self._camera_offset()
+        cam = pygame.Vector2(self.camera.offset) + shake
+
+        # A map bigger than the playfield scrolls under it: keep it off the HUD.
+        view = self.screen_rect
+        if not self.playfield.contains(self.tiles.rect):
+            view = self.playfield
+            self.screen.set_clip(view)
+
+        queue = self.render_queue
 
-        # Draw walls
-        for wall in self.walls:
-            pygame.draw.rect(self.screen, wall.color, wall.rect.move(cam))
+        # Walls (pre-rendered tilemap chunks)
+        queue.extend(LAYER_TILES, self.tiles.visible_chunks(cam, view))
 
-        # Draw coins (bigger art than hitbox)
+        # Coins (bigger art than hitbox)
         for coin in self.coins:
-            visual = pygame.Rect(0, 0, coin.visual_size, coin.visual_size)
-            visual.center = coin.rect.center
-            pygame.draw.circle(self.screen, coin.color, visual.center + cam, visual.width // 2)
-            pygame.draw.circle(self.screen, pygame.Color("#000000"), visual.center + cam, visual.width // 2, 2)
+            r = coin.visual_size // 2
+            stamp = self.stamps.get(_make_circle_stamp, coin.visual_size, coin.color)
+            queue.add(LAYER_COINS, stamp, (coin.rect.centerx + cam.x - r, coin.rect.centery + cam.y - r))
 
-        # Draw hazards
+        # Hazards
         for hazard in self.hazards:
+            stamp = self.stamps.get(_make_triangle_stamp, hazard.rect.size, hazard.color)
             r = hazard.rect.move(cam)
-            pts = [(r.centerx, r.top), (r.right, r.bottom), (r.left, r.bottom)]
-            pygame.draw.polygon(self.screen, hazard.color, pts)
-            pygame.draw.polygon(self.screen, pygame.Color("#000000"), pts, 2)
+            queue.add(LAYER_HAZARDS, stamp, (r.left - _STAMP_MARGIN, r.top - _STAMP_MARGIN))
 
-        # Draw player (bigger art than hitbox)
+        # Player (bigger art than hitbox)
         pr = self.player.rect.move(cam)
-        visual = pygame.Rect(0, 0, self.player.visual_size, self.player.visual_size)
-        visual.center = pr.center
         player_color = self.player.color
         if self.player.is_invincible:
             # Simple blink while invincible
-            if int(self.player.invincible_for * 16) % 2 == 0:
-                player_color = pygame.Color("#d8dee9")
-        elif self.player.golden_for > 0:
+            if int(self.player.invincible.remaining * 16) % 2 == 0:
+                player_color = self.palette.player_blink
+        elif self.player.is_golden:
             # Flash gold briefly after picking up a coin
-            player_color = pygame.Color("#fcb830")
-        else:
-            player_color = self.player.color
-        pygame.draw.circle(self.screen, player_color, visual.center, visual.width // 2)
-        pygame.draw.circle(self.screen, pygame.Color("#000000"), visual.center, visual.width // 2, 2)
+            player_color = self.palette.player_golden
+        r = self.player.visual_size // 2
+        stamp = self.stamps.get(_make_circle_stamp, self.player.visual_size, player_color)
+        queue.add(LAYER_PLAYER, stamp, (pr.centerx - r, pr.centery - r))
+
+        queue.flush(self.screen)
 
         if self.debug:
             self._draw_debug(cam)
+        self.screen.set_clip(None)
 
         if self.state == "title":
-            self._draw_center_message("Sprites + Collisions\nPress Space to start", cam)
+            self._draw_center_message("Sprites + Collisions\nPress Space to start", shake)
         elif self.state == "gameover":
-            self._draw_center_message("Game over\nPress Space to restart", cam)
+            self._draw_center_message("Game over\nPress Space to restart", shake)
+
+        self._redraw = False
 
     def _draw_debug(self, cam: pygame.Vector2) -> None:
         # Hitboxes
@@ -416,23 +535,59 @@ class Game:
         for hazard in self.hazards:
             pygame.draw.rect(self.screen, pygame.Color("#bf616a"), hazard.rect.move(cam), 2)
 
-        # Help text
+        # Help text (in the HUD, outside the playfield clip)
+        self.screen.set_clip(None)
         self.screen.blit(
-            self.font.render(f"DEBUG: Golden status: {self.player.golden_for}", True, self.palette.text),
+            self.font.render(f"DEBUG: Golden status: {self.player.golden.remaining}", True, self.palette.text),
             (self.SCREEN_W - 320, 18),
         )
 
     def _draw_center_message(self, message: str, cam: pygame.Vector2) -> None:
+        # The dimming layer and the rendered lines only change with the message.
+        key = (message, self.playfield.size)
+        if self._overlay_key != key:
+            self._overlay_key = key
+            self._overlay = self._build_overlay(message)
+
+        self.screen.blits([(surf, pos + cam) for surf, pos in self._overlay], doreturn=False)
+
+    def _build_overlay(self, message: str) -> list[tuple[pygame.Surface, tuple[int, int]]]:
         lines = message.split("\n")
         total_h = len(lines) * 44
         y = self.playfield.centery - total_h // 2
 
         overlay = pygame.Surface((self.playfield.width, self.playfield.height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, self.playfield.topleft + cam)
+        layers = [(overlay, self.playfield.topleft)]
 
         for line in lines:
             surf = self.big_font.render(line, True, self.palette.text)
             x = self.playfield.centerx - surf.get_width() // 2
-            self.screen.blit(surf, (x, y) + cam)
+            layers.append((surf, (x, y)))
             y += 44
+        return layers
+
+
+_STAMP_MARGIN = 2
+
+
+def _make_circle_stamp(size: int, color: pygame.Color) -> pygame.Surface:
+    # Filled circle with a black outline; blit it at (center - size // 2).
+    r = size // 2
+    surf = pygame.Surface((2 * r, 2 * r), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (r, r), r)
+    pygame.draw.circle(surf, pygame.Color("#000000"), (r, r), r, 2)
+    return surf
+
+
+def _make_triangle_stamp(size: tuple[int, int], color: pygame.Color) -> pygame.Surface:
+    # Upward triangle filling a w x h rect. Its right and bottom corners sit on
+    # rect.right / rect.bottom and the outline spills a pixel past them, so there's
+    # a margin all round: blit it at (rect.left - _STAMP_MARGIN, rect.top - _STAMP_MARGIN).
+    w, h = size
+    m = _STAMP_MARGIN
+    surf = pygame.Surface((w + 1 + 2 * m, h + 1 + 2 * m), pygame.SRCALPHA)
+    pts = [(m + w // 2, m), (m + w, m + h), (m, m + h)]
+    pygame.draw.polygon(surf, color, pts)
+    pygame.draw.polygon(surf, pygame.Color("#000000"), pts, 2)
+    return surf
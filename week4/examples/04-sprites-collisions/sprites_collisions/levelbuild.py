@@ -0,0 +1,71 @@
+"""Compile an authored JSON level into a binary `.lvl` file.
+
+    python3 -m sprites_collisions.levelbuild levels/arena.json levels/arena.lvl
+
+JSON layout (walls in tiles, spawns in pixels from the map's top-left):
+
+    {
+      "cols": 58, "rows": 28, "tile_size": 16,
+      "walls": [[col, row, w, h], ...],
+      "player": [x, y],
+      "hazards": [{"pos": [x, y], "patrol_dx": 140, "speed": 180}, ...],
+      "coins": [[x, y], ...]          (optional; otherwise placed randomly per stage)
+    }
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any
+
+import numpy as np
+
+from sprites_collisions.levelfile import UNREACHABLE, load_level, write_level
+from sprites_collisions.tilemap import SOLID_TILES, WALL
+
+
+def build(data: dict[str, Any], out_path: str) -> None:
+    cols, rows = int(data["cols"]), int(data["rows"])
+    tile_size = int(data.get("tile_size", 16))
+
+    grid = np.zeros((rows, cols), dtype=np.uint8)
+    walls = np.asarray(data.get("walls", []), dtype=np.int32).reshape(-1, 4)
+    for col, row, w, h in walls:
+        grid[max(0, row) : row + h, max(0, col) : col + w] = WALL
+
+    hazards = [
+        (h["pos"][0], h["pos"][1], h.get("patrol_dx", 140), h.get("speed", 180.0))
+        for h in data.get("hazards", [])
+    ]
+
+    write_level(
+        out_path,
+        grid,
+        tile_size=tile_size,
+        chunk_size=int(data.get("chunk_size", 16)),
+        solid_tiles=SOLID_TILES,
+        walls=walls,
+        player=tuple(data["player"]),
+        hazards=np.asarray(hazards, dtype=np.float32).reshape(-1, 4),
+        coins=np.asarray(data.get("coins", []), dtype=np.int32).reshape(-1, 2),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile a JSON level into a .lvl file.")
+    parser.add_argument("source", help="authored level (.json)")
+    parser.add_argument("output", help="compiled level (.lvl)")
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8") as f:
+        data = json.load(f)
+    build(data, args.output)
+
+    level = load_level(args.output)
+    reachable = int((level.nav != UNREACHABLE).sum())
+    print(f"{args.output}: {level.cols}x{level.rows} tiles, {len(level.walls)} walls, {reachable} reachable tiles")
+
+
+if __name__ == "__main__":
+    main()
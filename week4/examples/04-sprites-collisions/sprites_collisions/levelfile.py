@@ -0,0 +1,209 @@
+"""Binary level files, loaded with `mmap` as zero-copy NumPy views.
+
+A `.lvl` file is a small header, a table of sections, then the sections themselves
+(each 8-byte aligned, little-endian):
+
+    tiles        uint8   (chunk_rows, chunk_cols, chunk_size * chunk_size)  tile IDs, chunk by chunk
+    solid        uint32  (chunk_rows, chunk_cols, chunk_size)               collision bitmap rows
+    chunk_flags  uint8   (chunk_rows, chunk_cols)                           CHUNK_EMPTY if no tiles
+    walls        int32   (n, 4)   authored wall rects (tile units: col, row, w, h)
+    player       int32   (2,)     player spawn (pixels, relative to the map origin)
+    hazards      float32 (n, 4)   hazard spawns: x, y, patrol_dx, speed
+    coins        int32   (n, 2)   fixed coin spawns (may be empty)
+    nav          uint16  (rows, cols)  steps from the player spawn; UNREACHABLE for walls/sealed tiles
+
+Everything the game needs at load time is precomputed by the build tool
+(`python3 -m sprites_collisions.levelbuild`), so loading is: map the file, slice
+views. The tile data is laid out chunk by chunk, so a `TileMap` can use the views
+directly as its chunks. The file is mapped copy-on-write: editing tiles in game
+changes memory, never the file.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import mmap
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"LVL1"
+VERSION = 1
+
+UNREACHABLE = 0xFFFF
+CHUNK_EMPTY = 1
+
+# magic, version, cols, rows, tile_size, chunk_size, section count
+_HEADER = struct.Struct("<4sHHHHHH")
+_SECTION = struct.Struct("<II")  # byte offset, byte length
+
+SECTIONS: tuple[tuple[str, type[np.generic]], ...] = (
+    ("tiles", np.uint8),
+    ("solid", np.uint32),
+    ("chunk_flags", np.uint8),
+    ("walls", np.int32),
+    ("player", np.int32),
+    ("hazards", np.float32),
+    ("coins", np.int32),
+    ("nav", np.uint16),
+)
+
+
+class LevelFormatError(ValueError):
+    pass
+
+
+class Level:
+    """A mapped level file. Arrays are views into the mapping; keep the Level alive while using them."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        if len(self._map) < _HEADER.size:
+            raise LevelFormatError(f"{path}: too short for a level file")
+        magic, version, cols, rows, tile_size, chunk_size, count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise LevelFormatError(f"{path}: not a level file")
+        if version != VERSION:
+            raise LevelFormatError(f"{path}: level format v{version}, expected v{VERSION}")
+        if count != len(SECTIONS):
+            raise LevelFormatError(f"{path}: expected {len(SECTIONS)} sections, found {count}")
+
+        self.path = path
+        self.cols = cols
+        self.rows = rows
+        self.tile_size = tile_size
+        self.chunk_size = chunk_size
+        self.chunk_cols = -(-cols // chunk_size)
+        self.chunk_rows = -(-rows // chunk_size)
+
+        shapes = {
+            "tiles": (self.chunk_rows, self.chunk_cols, chunk_size * chunk_size),
+            "solid": (self.chunk_rows, self.chunk_cols, chunk_size),
+            "chunk_flags": (self.chunk_rows, self.chunk_cols),
+            "walls": (-1, 4),
+            "player": (2,),
+            "hazards": (-1, 4),
+            "coins": (-1, 2),
+            "nav": (rows, cols),
+        }
+        for i, (name, dtype) in enumerate(SECTIONS):
+            offset, length = _SECTION.unpack_from(self._map, _HEADER.size + i * _SECTION.size)
+            if offset + length > len(self._map):
+                raise LevelFormatError(f"{path}: section {name!r} runs past the end of the file")
+            view = np.frombuffer(self._map, dtype=dtype, count=length // np.dtype(dtype).itemsize, offset=offset)
+            setattr(self, name, view.reshape(shapes[name]))
+
+    tiles: np.ndarray
+    solid: np.ndarray
+    chunk_flags: np.ndarray
+    walls: np.ndarray
+    player: np.ndarray
+    hazards: np.ndarray
+    coins: np.ndarray
+    nav: np.ndarray
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Map size in pixels."""
+        return self.cols * self.tile_size, self.rows * self.tile_size
+
+    def checksum(self) -> int:
+        """CRC32 of the file, e.g. to tell apart caches built from different versions of a level."""
+        return zlib.crc32(self._map)
+
+
+def load_level(path: str) -> Level:
+    return Level(path)
+
+
+def navigation(solid: np.ndarray, start: tuple[int, int]) -> np.ndarray:
+    """Breadth-first step counts over non-solid tiles from `start` (col, row)."""
+    rows, cols = solid.shape
+    # Plain lists: element access on Python ints is much faster than on arrays.
+    blocked = solid.ravel().tolist()
+    steps = [UNREACHABLE] * (rows * cols)
+    c0, r0 = start
+    if 0 <= c0 < cols and 0 <= r0 < rows and not blocked[r0 * cols + c0]:
+        steps[r0 * cols + c0] = 0
+        queue = deque([r0 * cols + c0])
+        while queue:
+            i = queue.popleft()
+            step = min(steps[i] + 1, UNREACHABLE - 1)
+            c = i % cols
+            for j, ok in (
+                (i + 1, c + 1 < cols),
+                (i - 1, c > 0),
+                (i + cols, i + cols < len(steps)),
+                (i - cols, i >= cols),
+            ):
+                if ok and not blocked[j] and steps[j] == UNREACHABLE:
+                    steps[j] = step
+                    queue.append(j)
+    return np.array(steps, dtype=np.uint16).reshape(rows, cols)
+
+
+def write_level(
+    path: str,
+    grid: np.ndarray,
+    *,
+    tile_size: int,
+    chunk_size: int = 16,
+    solid_tiles: frozenset[int],
+    walls: np.ndarray,
+    player: tuple[int, int],
+    hazards: np.ndarray,
+    coins: np.ndarray,
+) -> None:
+    """Write a level file from a (rows, cols) grid of tile IDs plus spawn tables."""
+    if not 1 <= chunk_size <= 32:
+        raise ValueError("chunk_size must fit a uint32 bitmap row (1..32)")
+    rows, cols = grid.shape
+    chunk_rows = -(-rows // chunk_size)
+    chunk_cols = -(-cols // chunk_size)
+
+    # Pad to whole chunks, then reorder so each chunk's tiles are contiguous.
+    padded = np.zeros((chunk_rows * chunk_size, chunk_cols * chunk_size), dtype=np.uint8)
+    padded[:rows, :cols] = grid
+    blocks = padded.reshape(chunk_rows, chunk_size, chunk_cols, chunk_size).transpose(0, 2, 1, 3)
+    tiles = np.ascontiguousarray(blocks).reshape(chunk_rows, chunk_cols, chunk_size * chunk_size)
+
+    solid_grid = np.isin(padded, sorted(solid_tiles))
+    bits = (1 << np.arange(chunk_size, dtype=np.uint64)).astype(np.uint32)
+    solid_blocks = solid_grid.reshape(chunk_rows, chunk_size, chunk_cols, chunk_size).transpose(0, 2, 1, 3)
+    solid = (solid_blocks * bits).sum(axis=3, dtype=np.uint64).astype(np.uint32)
+
+    chunk_flags = np.where(tiles.any(axis=2), 0, CHUNK_EMPTY).astype(np.uint8)
+
+    start = (player[0] // tile_size, player[1] // tile_size)
+    nav = navigation(solid_grid[:rows, :cols], start)
+
+    arrays = {
+        "tiles": tiles,
+        "solid": solid,
+        "chunk_flags": chunk_flags,
+        "walls": np.asarray(walls, dtype=np.int32).reshape(-1, 4),
+        "player": np.asarray(player, dtype=np.int32),
+        "hazards": np.asarray(hazards, dtype=np.float32).reshape(-1, 4),
+        "coins": np.asarray(coins, dtype=np.int32).reshape(-1, 2),
+        "nav": nav,
+    }
+
+    table_end = _HEADER.size + len(SECTIONS) * _SECTION.size
+    offset = -(-table_end // 8) * 8
+    header = bytearray(offset)
+    _HEADER.pack_into(header, 0, MAGIC, VERSION, cols, rows, tile_size, chunk_size, len(SECTIONS))
+
+    body: list[bytes] = []
+    for i, (name, dtype) in enumerate(SECTIONS):
+        data = np.ascontiguousarray(arrays[name], dtype=np.dtype(dtype).newbyteorder("<")).tobytes()
+        _SECTION.pack_into(header, _HEADER.size + i * _SECTION.size, offset, len(data))
+        pad = -len(data) % 8
+        body.append(data + bytes(pad))
+        offset += len(data) + pad
+
+    with open(path, "wb") as f:
+        f.write(header)
+        f.writelines(body)
@@ -0,0 +1,207 @@
+"""Stages as data: generate from a seed once, cache, and prefetch the next one.
+
+`generate_stage(seed, ...)` turns a seed into a frozen `Stage` (spawn points only, no
+sprites or surfaces), so it is safe to run on a worker thread. `StageCache` keeps the
+most recently used stages in memory, optionally saves them to disk as JSON, and can
+start generating a stage in the background before it's needed: while stage N is
+played, stage N + 1 is already being built, so clearing the coins doesn't stall.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+import json
+import os
+import threading
+from typing import Callable, Sequence
+
+import pygame # type: ignore
+
+from sprites_collisions.rng import RandomStreams
+from sprites_collisions.tilemap import TileMap
+
+# Bump when generation changes, so old stages on disk aren't reused.
+GENERATOR_VERSION = 2
+
+
+@dataclass(frozen=True)
+class Stage:
+    seed: int
+    player: tuple[int, int]
+    hazards: tuple[tuple[int, int, int, float], ...]  # center x, center y, patrol_dx, speed
+    coins: tuple[tuple[int, int], ...]  # coin centers
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Stage:
+        return cls(
+            seed=data["seed"],
+            player=tuple(data["player"]),
+            hazards=tuple(tuple(h) for h in data["hazards"]),
+            coins=tuple(tuple(c) for c in data["coins"]),
+        )
+
+
+def generate_stage(
+    seed: int,
+    *,
+    tiles: TileMap,
+    area: pygame.Rect,
+    player: tuple[int, int],
+    hazards: Sequence[tuple[int, int, int, float]],
+    coin_count: int = 8,
+    coin_size: int = 18,
+    player_size: int = 28,
+    open_tiles: Sequence[int] | None = None,
+) -> Stage:
+    """Place coins for stage `seed` (same seed, same stage).
+
+    Coins are rejected if they overlap a wall, another coin or the player spawn.
+    With `open_tiles` (flat tile indices the player can reach), coins are put on
+    those tiles; otherwise anywhere in `area`.
+    """
+    rng = RandomStreams(seed).stream("coins")
+    player_rect = pygame.Rect(0, 0, player_size, player_size)
+    player_rect.center = player
+
+    coins: list[pygame.Rect] = []
+    for _ in range(coin_count):
+        for __ in range(100):
+            if open_tiles is None:
+                x = rng.randint(area.left + 40, area.right - 40)
+                y = rng.randint(area.top + 40, area.bottom - 40)
+            else:
+                row, col = divmod(int(open_tiles[rng.randrange(len(open_tiles))]), tiles.cols)
+                ts = tiles.tile_size
+                x = tiles.origin[0] + col * ts + ts // 2
+                y = tiles.origin[1] + row * ts + ts // 2
+
+            candidate = pygame.Rect(0, 0, coin_size, coin_size)
+            candidate.center = (x, y)
+
+            if tiles.collides(candidate):
+                continue
+            if candidate.collidelist(coins) != -1:
+                continue
+            if candidate.colliderect(player_rect):
+                continue
+
+            coins.append(candidate)
+            break
+
+    return Stage(
+        seed=seed,
+        player=player,
+        hazards=tuple(hazards),
+        coins=tuple(c.center for c in coins),
+    )
+
+
+class StageCache:
+    def __init__(
+        self,
+        generate: Callable[[int], Stage],
+        *,
+        capacity: int = 8,
+        directory: str | None = None,
+        namespace: str = "stage",
+    ) -> None:
+        self.generate = generate
+        self.capacity = capacity
+        self.directory = directory  # None = memory only
+        self.namespace = namespace  # what the stages belong to (level, generator version)
+
+        self._stages: OrderedDict[int, Stage] = OrderedDict()
+        self._pending: dict[int, Future[Stage]] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, seed: int) -> Stage:
+        """The stage for `seed`: from memory, a finished prefetch, disk, or generated now."""
+        with self._lock:
+            stage = self._stages.get(seed)
+            if stage is not None:
+                self._stages.move_to_end(seed)
+                return stage
+            pending = self._pending.get(seed)
+
+        if pending is not None:
+            stage = pending.result()
+        else:
+            stage = self._load_or_generate(seed)
+        self._remember(stage)
+        return stage
+
+    def prefetch(self, seed: int) -> None:
+        """Start building `seed` on a background thread (no-op if cached or in flight)."""
+        with self._lock:
+            if seed in self._stages or seed in self._pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stage-prefetch")
+            future = self._executor.submit(self._load_or_generate, seed)
+            self._pending[seed] = future
+        future.add_done_callback(lambda f: self._prefetched(seed, f))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __contains__(self, seed: int) -> bool:
+        with self._lock:
+            return seed in self._stages
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._stages)
+
+    def _prefetched(self, seed: int, future: Future[Stage]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            # Leave it to `get`, which will generate it (and raise) on the main thread.
+            with self._lock:
+                self._pending.pop(seed, None)
+            return
+        self._remember(future.result())
+
+    def _remember(self, stage: Stage) -> None:
+        with self._lock:
+            self._pending.pop(stage.seed, None)
+            self._stages[stage.seed] = stage
+            self._stages.move_to_end(stage.seed)
+            while len(self._stages) > self.capacity:
+                self._stages.popitem(last=False)
+
+    def _path(self, seed: int) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, f"{self.namespace}-v{GENERATOR_VERSION}-{seed}.json")
+
+    def _load_or_generate(self, seed: int) -> Stage:
+        if self.directory is not None:
+            try:
+                with open(self._path(seed), encoding="utf-8") as f:
+                    return Stage.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # missing or unreadable: regenerate
+
+        stage = self.generate(seed)
+
+        if self.directory is not None:
+            # Write then rename, so a half-written file is never read back.
+            path = self._path(seed)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(asdict(stage), f)
+                os.replace(tmp, path)
+            except OSError:
+                # Read-only or full disk: the copy on disk is only a cache, so play on without it.
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+        return stage
@@ -0,0 +1,34 @@
+"""Shapes baked once into stamps.
+
+Coins, hazards and the player are plain shapes that never change, but drawing them
+with `pygame.draw` rasterizes every circle and polygon again each frame.
+`StampCache.get(make, *args)` calls `make(*args)` once per argument set (e.g. size
+and color) and returns the same SRCALPHA surface after that, so a frame is just
+blits.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pygame # type: ignore
+
+
+class StampCache:
+    def __init__(self) -> None:
+        self._stamps: dict[tuple, pygame.Surface] = {}
+
+    def get(self, make: Callable[..., pygame.Surface], *args) -> pygame.Surface:
+        """`make(*args)`, baked on first use. The returned surface is shared; don't draw on it."""
+        # pygame.Color isn't hashable; its RGBA tuple is.
+        key = (make, *(tuple(a) if isinstance(a, pygame.Color) else a for a in args))
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            stamp = make(*args)
+            if pygame.display.get_surface() is not None:
+                stamp = stamp.convert_alpha()
+            self._stamps[key] = stamp
+        return stamp
+
+    def __len__(self) -> int:
+        return len(self._stamps)
@@ -0,0 +1,97 @@
+"""Swept AABB collision: move a box by (dx, dy) without tunneling through walls.
+
+Checking only the end position (like moving then calling `spritecollide`) misses a
+wall when one frame's movement is bigger than the wall is thick. Instead we find the
+*time of impact* along the whole move, stop there, and slide along the wall with
+the rest of the movement.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pygame # type: ignore
+
+
+def time_of_impact(
+    x: float, y: float, w: float, h: float, dx: float, dy: float, wall: pygame.Rect
+) -> tuple[float, str] | None:
+    """When does box (x, y, w, h) moving by (dx, dy) first touch `wall`?
+
+    Returns (t, axis) with t in [0, 1] as a fraction of the move, and the axis
+    ("x" or "y") of the wall face that was hit. None if it never hits this move.
+    Boxes that only touch edges don't count as overlapping (same as `Rect.colliderect`).
+    """
+    if dx > 0:
+        tx_entry = (wall.left - (x + w)) / dx
+        tx_exit = (wall.right - x) / dx
+    elif dx < 0:
+        tx_entry = (wall.right - x) / dx
+        tx_exit = (wall.left - (x + w)) / dx
+    elif x < wall.right and x + w > wall.left:
+        tx_entry, tx_exit = -math.inf, math.inf
+    else:
+        return None
+
+    if dy > 0:
+        ty_entry = (wall.top - (y + h)) / dy
+        ty_exit = (wall.bottom - y) / dy
+    elif dy < 0:
+        ty_entry = (wall.bottom - y) / dy
+        ty_exit = (wall.top - (y + h)) / dy
+    elif y < wall.bottom and y + h > wall.top:
+        ty_entry, ty_exit = -math.inf, math.inf
+    else:
+        return None
+
+    entry = max(tx_entry, ty_entry)
+    exit_ = min(tx_exit, ty_exit)
+    # No overlap in time, hit is beyond this move, or we started inside the wall.
+    if entry >= exit_ or entry > 1.0 or entry < 0.0:
+        return None
+    return entry, ("x" if tx_entry >= ty_entry else "y")
+
+
+def sweep_move(rect: pygame.Rect, dx: float, dy: float, walls: list[pygame.Rect]) -> tuple[bool, bool]:
+    """Move `rect` in place by (dx, dy), stopping at walls and sliding along them.
+
+    Broadphase: only walls overlapping the box swept over the whole move are tested.
+    Returns (hit_x, hit_y): whether movement was blocked on each axis.
+    """
+    x, y = float(rect.x), float(rect.y)
+    w, h = rect.width, rect.height
+    hit_x = hit_y = False
+
+    # At most one wall stop per axis: after a stop we only slide along the other axis.
+    for _ in range(2):
+        if dx == 0 and dy == 0:
+            break
+
+        left, top = math.floor(min(x, x + dx)), math.floor(min(y, y + dy))
+        right, bottom = math.ceil(max(x, x + dx) + w), math.ceil(max(y, y + dy) + h)
+        swept = pygame.Rect(left, top, right - left, bottom - top)
+
+        first: tuple[float, str] | None = None
+        for i in swept.collidelistall(walls):
+            hit = time_of_impact(x, y, w, h, dx, dy, walls[i])
+            if hit is not None and (first is None or hit[0] < first[0]):
+                first = hit
+
+        if first is None:
+            x += dx
+            y += dy
+            break
+
+        t, axis = first
+        x += dx * t
+        y += dy * t
+        if axis == "x":
+            hit_x = True
+            dx, dy = 0.0, dy * (1.0 - t)
+        else:
+            hit_y = True
+            dx, dy = dx * (1.0 - t), 0.0
+
+    rect.x = int(round(x))
+    rect.y = int(round(y))
+    return hit_x, hit_y
@@ -0,0 +1,226 @@
+"""Chunked tilemap: level geometry as a grid of tile IDs.
+
+The map is split into square chunks of `chunk_size` x `chunk_size` tiles. Each chunk
+keeps three things:
+
+- `tiles`: the tile IDs (a `bytearray`, one byte per tile)
+- `solid`: a collision bitmap, one int per tile row with bit `c` set if column `c`
+  is solid, so "is anything solid here?" is a mask test instead of a loop
+- `surface`: the chunk's tiles pre-rendered once and redrawn only after an edit
+
+Collision queries and drawing only visit the chunks that overlap the area asked
+about, so a world much larger than the screen costs the same per frame.
+"""
+
+from __future__ import annotations
+
+import pygame # type: ignore
+
+EMPTY = 0
+WALL = 1
+
+# Tiles that block movement.
+SOLID_TILES = frozenset({WALL})
+
+# Pre-rendered chunks use this as their transparent color.
+_COLORKEY = (255, 0, 255)
+
+
+class Chunk:
+    def __init__(self, size: int, tiles=None, solid=None, *, empty: bool = True) -> None:
+        # `tiles`/`solid` may be any mutable int sequences, e.g. views into a level file.
+        self.size = size
+        self.tiles = bytearray(size * size) if tiles is None else tiles
+        self.solid = [0] * size if solid is None else solid
+        self.surface: pygame.Surface | None = None  # None = needs a redraw
+        self.empty = empty
+
+
+class TileMap:
+    def __init__(
+        self,
+        cols: int,
+        rows: int,
+        *,
+        tile_size: int = 16,
+        chunk_size: int = 16,
+        origin: tuple[int, int] = (0, 0),
+        colors: dict[int, pygame.Color] | None = None,
+        chunks: list[list[Chunk]] | None = None,
+    ) -> None:
+        self.cols = cols
+        self.rows = rows
+        self.tile_size = tile_size
+        self.chunk_size = chunk_size
+        self.origin = origin
+        self.colors = colors or {}
+
+        self.chunk_cols = -(-cols // chunk_size)
+        self.chunk_rows = -(-rows // chunk_size)
+        self.chunks = chunks or [[Chunk(chunk_size) for _ in range(self.chunk_cols)] for _ in range(self.chunk_rows)]
+
+    @classmethod
+    def from_level(cls, level, *, origin: tuple[int, int] = (0, 0), colors: dict[int, pygame.Color] | None = None) -> TileMap:
+        """A map over a loaded `levelfile.Level`: its chunks use the file's arrays in place."""
+        from sprites_collisions.levelfile import CHUNK_EMPTY
+
+        cs = level.chunk_size
+        chunks = [
+            [
+                Chunk(cs, level.tiles[cy, cx], level.solid[cy, cx], empty=bool(level.chunk_flags[cy, cx] & CHUNK_EMPTY))
+                for cx in range(level.chunk_cols)
+            ]
+            for cy in range(level.chunk_rows)
+        ]
+        return cls(
+            level.cols,
+            level.rows,
+            tile_size=level.tile_size,
+            chunk_size=cs,
+            origin=origin,
+            colors=colors,
+            chunks=chunks,
+        )
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """The whole map in pixels."""
+        return pygame.Rect(self.origin, (self.cols * self.tile_size, self.rows * self.tile_size))
+
+    # --- editing -------------------------------------------------------------
+
+    def get(self, col: int, row: int) -> int:
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return EMPTY
+        cs = self.chunk_size
+        chunk = self.chunks[row // cs][col // cs]
+        return chunk.tiles[(row % cs) * cs + col % cs]
+
+    def set(self, col: int, row: int, tile: int) -> None:
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return
+        cs = self.chunk_size
+        chunk = self.chunks[row // cs][col // cs]
+        r, c = row % cs, col % cs
+        chunk.tiles[r * cs + c] = tile
+        bit = 1 << c
+        if tile in SOLID_TILES:
+            chunk.solid[r] |= bit
+        elif chunk.solid[r] & bit:
+            chunk.solid[r] ^= bit
+        chunk.surface = None
+        if tile != EMPTY:
+            chunk.empty = False
+
+    def fill(self, rect: pygame.Rect, tile: int) -> None:
+        """Set every tile under a pixel rect (snapped to the nearest tile edges)."""
+        c0, r0, c1, r1 = self._snap(rect)
+        for row in range(r0, r1):
+            for col in range(c0, c1):
+                self.set(col, row, tile)
+
+    def _snap(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        ts = self.tile_size
+        ox, oy = self.origin
+        c0 = round((rect.left - ox) / ts)
+        r0 = round((rect.top - oy) / ts)
+        c1 = max(c0 + 1, round((rect.right - ox) / ts))
+        r1 = max(r0 + 1, round((rect.bottom - oy) / ts))
+        return c0, r0, c1, r1
+
+    # --- collision -----------------------------------------------------------
+
+    def _tile_range(self, area: pygame.Rect) -> tuple[int, int, int, int]:
+        # Tiles overlapping `area` (touching edges don't count), clamped to the map.
+        ts = self.tile_size
+        ox, oy = self.origin
+        c0 = max(0, (area.left - ox) // ts)
+        r0 = max(0, (area.top - oy) // ts)
+        c1 = min(self.cols, -(-(area.right - ox) // ts))
+        r1 = min(self.rows, -(-(area.bottom - oy) // ts))
+        return c0, r0, c1, r1
+
+    def solid_rects(self, area: pygame.Rect) -> list[pygame.Rect]:
+        """Pixel rects of the solid tiles overlapping `area`.
+
+        Neighbouring solid tiles in a row are merged into one rect.
+        """
+        c0, r0, c1, r1 = self._tile_range(area)
+        if c0 >= c1 or r0 >= r1:
+            return []
+
+        ts = self.tile_size
+        cs = self.chunk_size
+        ox, oy = self.origin
+        rects: list[pygame.Rect] = []
+        for row in range(r0, r1):
+            chunk_row = self.chunks[row // cs]
+            r = row % cs
+            run_start = -1
+            for col in range(c0, c1 + 1):
+                solid = False
+                if col < c1:
+                    solid = bool(chunk_row[col // cs].solid[r] >> (col % cs) & 1)
+                if solid and run_start < 0:
+                    run_start = col
+                elif not solid and run_start >= 0:
+                    rects.append(pygame.Rect(ox + run_start * ts, oy + row * ts, (col - run_start) * ts, ts))
+                    run_start = -1
+        return rects
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        c0, r0, c1, r1 = self._tile_range(rect)
+        cs = self.chunk_size
+        for row in range(r0, r1):
+            chunk_row = self.chunks[row // cs]
+            r = row % cs
+            # Mask test per chunk: columns c0..c1 that fall inside this chunk.
+            for chunk_col in range(c0 // cs, (c1 - 1) // cs + 1):
+                lo = max(c0, chunk_col * cs) - chunk_col * cs
+                hi = min(c1, (chunk_col + 1) * cs) - chunk_col * cs
+                if chunk_row[chunk_col].solid[r] & ((1 << hi) - (1 << lo)):
+                    return True
+        return False
+
+    # --- drawing -------------------------------------------------------------
+
+    def _render_chunk(self, chunk: Chunk) -> pygame.Surface:
+        ts = self.tile_size
+        surf = pygame.Surface((self.chunk_size * ts, self.chunk_size * ts)).convert()
+        surf.fill(_COLORKEY)
+        surf.set_colorkey(_COLORKEY)
+        for i, tile in enumerate(chunk.tiles):
+            color = self.colors.get(tile)
+            if tile != EMPTY and color is not None:
+                r, c = divmod(i, self.chunk_size)
+                surf.fill(color, pygame.Rect(c * ts, r * ts, ts, ts))
+        return surf
+
+    def draw(self, surface: pygame.Surface, offset: tuple[float, float] = (0, 0), view: pygame.Rect | None = None) -> None:
+        """Blit the pre-rendered chunks that overlap `view` (default: the whole target surface).
+
+        `offset` is added to world positions to get screen positions; `view` is in
+        screen space.
+        """
+        surface.blits(self.visible_chunks(offset, view or surface.get_rect()), doreturn=False)
+
+    def visible_chunks(self, offset: tuple[float, float], view: pygame.Rect) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """(pre-rendered chunk, screen position) for every non-empty chunk overlapping `view`."""
+        visible = []
+        ox = self.origin[0] + int(offset[0])
+        oy = self.origin[1] + int(offset[1])
+        span = self.chunk_size * self.tile_size
+
+        cx0 = max(0, (view.left - ox) // span)
+        cy0 = max(0, (view.top - oy) // span)
+        cx1 = min(self.chunk_cols, -(-(view.right - ox) // span))
+        cy1 = min(self.chunk_rows, -(-(view.bottom - oy) // span))
+        for cy in range(cy0, cy1):
+            for cx in range(cx0, cx1):
+                chunk = self.chunks[cy][cx]
+                if chunk.empty:
+                    continue
+                if chunk.surface is None:
+                    chunk.surface = self._render_chunk(chunk)
+                visible.append((chunk.surface, (ox + cx * span, oy + cy * span)))
+        return visible
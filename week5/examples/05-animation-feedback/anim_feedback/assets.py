@@ -0,0 +1,110 @@
+"""Baked procedural frames, kept in memory and (optionally) on disk.
+
+The sprites here are drawn with `pygame.draw` at startup instead of loaded from
+image files. `FrameCache.frames(builder, *args)` runs a builder once per argument
+set and hands every later caller the same surfaces. With a `directory`, the baked
+pixels are also saved there, so the next start loads them instead of drawing.
+
+Disk entries are keyed by a hash of the builder's name, its arguments and the
+source file it's defined in: edit the drawing code and the old entries are
+simply never looked up again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+from typing import Callable
+
+import pygame
+
+
+class FrameCache:
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = directory  # None = memory only
+        self._frames: dict[str, list[pygame.Surface]] = {}
+        self._source_hashes: dict[str, str] = {}
+
+        self.hits = 0  # served from memory
+        self.loads = 0  # read from disk
+        self.bakes = 0  # drawn from scratch
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def frames(self, builder: Callable[..., list[pygame.Surface] | pygame.Surface], *args, **kwargs) -> list[pygame.Surface]:
+        """`builder(*args, **kwargs)` as a list of frames, baked at most once.
+
+        The returned surfaces are shared; don't draw on them.
+        """
+        key = self._key(builder, args, kwargs)
+        frames = self._frames.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        frames = self._load(key)
+        if frames is not None:
+            self.loads += 1
+        else:
+            baked = builder(*args, **kwargs)
+            frames = [baked] if isinstance(baked, pygame.Surface) else list(baked)
+            self.bakes += 1
+            self._save(key, frames)
+
+        self._frames[key] = frames
+        return frames
+
+    def _key(self, builder: Callable, args: tuple, kwargs: dict) -> str:
+        module = inspect.getmodule(builder)
+        path = getattr(module, "__file__", None) or ""
+        source = self._source_hashes.get(path)
+        if source is None:
+            try:
+                with open(path, "rb") as f:
+                    source = hashlib.sha1(f.read()).hexdigest()
+            except OSError:
+                source = ""
+            self._source_hashes[path] = source
+
+        desc = repr((builder.__qualname__, source, args, sorted(kwargs.items())))
+        return hashlib.sha1(desc.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, f"{key}.frames")
+
+    def _load(self, key: str) -> list[pygame.Surface] | None:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                sizes = json.loads(f.readline())
+                frames = []
+                for w, h in sizes:
+                    data = f.read(w * h * 4)
+                    if len(data) != w * h * 4:
+                        return None
+                    frames.append(pygame.image.frombytes(data, (w, h), "RGBA"))
+        except (OSError, ValueError):
+            return None
+
+        if pygame.display.get_surface() is not None:
+            frames = [frame.convert_alpha() for frame in frames]
+        return frames
+
+    def _save(self, key: str, frames: list[pygame.Surface]) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(json.dumps([frame.get_size() for frame in frames]).encode("utf-8") + b"\n")
+                for frame in frames:
+                    f.write(pygame.image.tobytes(frame, "RGBA"))
+            os.replace(tmp, path)
+        except OSError:
+            pass  # a read-only disk just means no warm cache
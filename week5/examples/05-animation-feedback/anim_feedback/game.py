@@ -1,10 +1,34 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-import random
+import math
+import time
+import weakref
 
 import pygame
 
+from anim_feedback.assets import FrameCache
+from anim_feedback.camera import Camera
+from anim_feedback.governor import QualityGovernor
+from anim_feedback.pacing import FrameStats
+from anim_feedback.renderqueue import RenderQueue
+from anim_feedback.rng import RandomStreams
+from anim_feedback.spatial import SpatialGroup
+from anim_feedback.startup import NO_PROFILE, StartupProfile
+from anim_feedback.tilemap import WALL, TileMap
+from anim_feedback.timers import TimerWheel
+
+
+# Events after which a static screen is drawn again.
+_REDRAW_EVENTS = frozenset({pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED})
+
+# Draw order of the playfield layers (see `RenderQueue`).
+LAYER_TILES = 0
+LAYER_COINS = 1
+LAYER_HAZARDS = 2
+LAYER_PLAYER = 3
+LAYER_PARTICLES = 4
+
 
 @dataclass(frozen=True)
 class Palette:
@@ -56,6 +80,7 @@ class Particle:
     color: pygame.Color
     life: float
     ttl: float
+    burst: int = 0  # which burst it came from
 
     def update(self, dt: float) -> None:
         self.life = max(0.0, self.life - dt)
@@ -65,12 +90,11 @@ class Particle:
     def alive(self) -> bool:
         return self.life > 0
 
-
-class Wall(pygame.sprite.Sprite):
-    def __init__(self, rect: pygame.Rect, color: pygame.Color) -> None:
-        super().__init__()
-        self.rect = rect.copy()
-        self.color = color
+    def appearance(self) -> tuple[int, int]:
+        """Drawn radius and alpha: particles shrink and fade out over their life."""
+        a = _clamp(self.life / self.ttl, 0.0, 1.0)
+        radius = max(1, int(round(self.radius * (0.8 + 0.6 * a))))
+        return radius, int(255 * a)
 
 
 class Coin(pygame.sprite.Sprite):
@@ -79,9 +103,10 @@ class Coin(pygame.sprite.Sprite):
         center: tuple[int, int],
         *,
         color: pygame.Color,
+        frames: FrameCache,
     ) -> None:
         super().__init__()
-        self.anim = Animation(_make_coin_frames(color), fps=10.0)
+        self.anim = Animation(frames.frames(_make_coin_frames, color), fps=10.0)
         self.image = self.anim.image
         self.rect = self.image.get_rect(center=center)
 
@@ -98,22 +123,32 @@ class Hazard(pygame.sprite.Sprite):
         center: tuple[int, int],
         *,
         color: pygame.Color,
+        frames: FrameCache,
         size: int = 34,
         spin_speed_dps: float = 210.0,
     ) -> None:
         super().__init__()
-        self.base = _make_hazard_surface(size, color)
+        self.base = frames.frames(_make_hazard_surface, size, color)[0]
         self.angle = 0.0
         self.spin_speed_dps = spin_speed_dps
 
-        self.image = self.base
-        self.rect = self.image.get_rect(center=center)
+        self._image: pygame.Surface | None = self.base
+        self.rect = self.base.get_rect(center=center)
+
+    @property
+    def image(self) -> pygame.Surface:
+        # Rotated on demand: the texture renderer rotates `base` itself and never asks.
+        if self._image is None:
+            self._image = pygame.transform.rotate(self.base, self.angle)
+        return self._image
 
     def update(self, dt: float) -> None:
         self.angle = (self.angle + self.spin_speed_dps * dt) % 360.0
         center = self.rect.center
-        self.image = pygame.transform.rotate(self.base, self.angle)
-        self.rect = self.image.get_rect(center=center)
+        self._image = None
+        # The size `transform.rotate` would give, without rotating any pixels yet.
+        self.rect = pygame.Rect((0, 0), _rotated_size(self.base.get_size(), self.angle))
+        self.rect.center = center
 
 
 class Player(pygame.sprite.Sprite):
@@ -122,10 +157,12 @@ class Player(pygame.sprite.Sprite):
         center: tuple[int, int],
         *,
         color: pygame.Color,
+        timers: TimerWheel,
+        frames: FrameCache,
     ) -> None:
         super().__init__()
 
-        self.anims = _make_player_anims(color)
+        self.anims = _make_player_anims(color, frames)
         self.state = "idle"
         self.prev_state = "idle"
 
@@ -137,15 +174,15 @@ class Player(pygame.sprite.Sprite):
         self.speed = 320.0
 
         self.hp = 3
-        self.invincible_for = 0.0
+        self.invincible = timers.timer()
 
         self.score = 0
 
-        self.flash_for = 0.0
+        self.flash = timers.timer()
 
     @property
     def is_invincible(self) -> bool:
-        return self.invincible_for > 0
+        return self.invincible.active
 
     def set_state(self, new_state: str) -> None:
         if new_state == self.state:
@@ -160,12 +197,6 @@ class Player(pygame.sprite.Sprite):
         self.image = self.anims[self.state].image
         self.rect = self.image.get_rect(center=center)
 
-        if self.invincible_for > 0:
-            self.invincible_for = max(0.0, self.invincible_for - dt)
-
-        if self.flash_for > 0:
-            self.flash_for = max(0.0, self.flash_for - dt)
-
 
 class Game:
     fps = 60
@@ -173,13 +204,51 @@ class Game:
     SCREEN_W, SCREEN_H = 960, 540
     HUD_H = 56
     PADDING = 12
+    TILE = 16
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        profile: StartupProfile | None = None,
+        asset_cache_dir: str | None = None,
+        screen: pygame.Surface | None = None,
+        render_scale: int = 1,
+        native_hud: bool = True,
+        governor: QualityGovernor | None = None,
+        pacing: FrameStats | None = None,
+        seed: int = 5,
+    ) -> None:
+        if render_scale < 1 or self.SCREEN_W % render_scale or self.SCREEN_H % render_scale:
+            raise ValueError(f"render_scale must divide {self.SCREEN_W}x{self.SCREEN_H}, got {render_scale}")
+        profile = profile or NO_PROFILE
         self.palette = Palette()
 
-        self.screen = pygame.display.set_mode((self.SCREEN_W, self.SCREEN_H))
-        self.font = pygame.font.SysFont(None, 22)
-        self.big_font = pygame.font.SysFont(None, 40)
+        with profile.phase("display"):
+            # `screen` is for drawing somewhere other than the display window (the
+            # texture renderer in `anim_feedback/textures.py` doesn't use `draw` at all).
+            self.screen = screen or pygame.display.set_mode((self.SCREEN_W, self.SCREEN_H))
+        with profile.phase("fonts"):
+            # Font(None) is pygame's bundled font: what SysFont(None) returns, minus
+            # the scan of every installed system font first.
+            self.font = pygame.font.Font(None, 22)
+            self.big_font = pygame.font.Font(None, 40)
+
+        # render_scale > 1: the frame is drawn at 1/render_scale resolution into
+        # `canvas` and scaled up to the window once; with `native_hud` the HUD text
+        # is drawn afterwards at full resolution so it stays sharp.
+        self.render_scale = render_scale
+        self.native_hud = native_hud
+        self.canvas = pygame.Surface((self.SCREEN_W // render_scale, self.SCREEN_H // render_scale), 0, self.screen)
+        self._small_images: weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface] = weakref.WeakKeyDictionary()
+        self._hud_fonts: tuple[pygame.font.Font, pygame.font.Font] | None = None
+        self.render_queue = RenderQueue()
+
+        # Procedural sprite frames are baked once (and kept on disk if a directory is given).
+        self.frames = FrameCache(asset_cache_dir)
+        with profile.phase("assets"):
+            self.frames.frames(_make_coin_frames, self.palette.coin)
+            self.frames.frames(_make_hazard_surface, 34, self.palette.hazard)
+            self.frames.frames(_bake_player_frames, self.palette.player)
 
         self.screen_rect = pygame.Rect(0, 0, self.SCREEN_W, self.SCREEN_H)
         self.playfield = pygame.Rect(
@@ -197,37 +266,73 @@ class Game:
         self.cue_hitstop = True
         self.cue_particles = True
 
-        self.rng = random.Random(5)
+        # Turns particles and shake down further when frames take too long.
+        self.governor = governor or QualityGovernor(1.0 / self.fps)
+        self._frame_started = time.perf_counter()
+        self._frame_dt = 0.0
+        # Frame interval stats from main.py's `FramePacer`, shown in the debug overlay.
+        self.pacing = pacing
+        # Static screens (title, game over) are only redrawn when something changed.
+        self._redraw = True
+
+        # Independent random streams: level layout, shake and each particle burst
+        # draw from their own keyed stream, so none of them shifts the others.
+        self.random = RandomStreams(seed=seed)
+        self._shake_rng = self.random.stream("shake")
+        self._levels = 0
+        self._bursts = 0
 
         self.all_sprites: pygame.sprite.Group[pygame.sprite.Sprite] = pygame.sprite.Group()
-        self.walls: pygame.sprite.Group[Wall] = pygame.sprite.Group()
-        self.coins: pygame.sprite.Group[Coin] = pygame.sprite.Group()
-        self.hazards: pygame.sprite.Group[Hazard] = pygame.sprite.Group()
+        # Spatially indexed so drawing can ask for just the sprites on screen.
+        self.coins = SpatialGroup()
+        self.hazards = SpatialGroup()
+
+        # Gameplay countdowns (i-frames, flash) run on `timers`, which hitstop pauses.
+        # Shake and hitstop itself run on `fx_timers`, which keeps going during hitstop.
+        self.timers = TimerWheel()
+        self.fx_timers = TimerWheel()
 
-        self.player = Player(self.playfield.center, color=self.palette.player)
+        self.player = Player(self.playfield.center, color=self.palette.player, timers=self.timers, frames=self.frames)
         self.all_sprites.add(self.player)
 
         self.particles: list[Particle] = []
 
-        self._shake_for = 0.0
-        self._hitstop_for = 0.0
+        self._shake = self.fx_timers.timer()
+        self._hitstop = self.fx_timers.timer(self.timers.resume)
 
-        self._reset_level(keep_state=True)
+        with profile.phase("level"):
+            self._reset_level(keep_state=True)
 
     def _reset_level(self, *, keep_state: bool = False) -> None:
         self.all_sprites.empty()
-        self.walls.empty()
         self.coins.empty()
         self.hazards.empty()
         self.particles.clear()
 
-        self.player = Player(self.playfield.center, color=self.palette.player)
+        self.player.invincible.cancel()
+        self.player.flash.cancel()
+        self.player = Player(self.playfield.center, color=self.palette.player, timers=self.timers, frames=self.frames)
         self.all_sprites.add(self.player)
 
+        self._levels += 1
+        rng = self.random.stream("layout", self._levels)
+
+        # Level geometry is a tilemap centered in the playfield; walls snap to tiles.
+        cols = self.playfield.width // self.TILE
+        rows = self.playfield.height // self.TILE
+        self.tiles = TileMap(
+            cols,
+            rows,
+            tile_size=self.TILE,
+            origin=(
+                self.playfield.left + (self.playfield.width - cols * self.TILE) // 2,
+                self.playfield.top + (self.playfield.height - rows * self.TILE) // 2,
+            ),
+            colors={WALL: self.palette.wall},
+        )
+
         def add_wall(r: pygame.Rect) -> None:
-            wall = Wall(r, self.palette.wall)
-            self.walls.add(wall)
-            self.all_sprites.add(wall)
+            self.tiles.fill(r, WALL)
 
         t = 16
         add_wall(pygame.Rect(self.playfield.left, self.playfield.top, self.playfield.width, t))
@@ -239,18 +344,27 @@ class Game:
         add_wall(pygame.Rect(self.playfield.left + 420, self.playfield.top + 40, 18, 240))
         add_wall(pygame.Rect(self.playfield.left + 560, self.playfield.top + 240, 260, 18))
 
-        hz1 = Hazard((self.playfield.centerx + 190, self.playfield.centery - 80), color=self.palette.hazard)
-        hz2 = Hazard((self.playfield.centerx - 150, self.playfield.centery + 140), color=self.palette.hazard, spin_speed_dps=260)
+        hz1 = Hazard(
+            (self.playfield.centerx + 190, self.playfield.centery - 80),
+            color=self.palette.hazard,
+            frames=self.frames,
+        )
+        hz2 = Hazard(
+            (self.playfield.centerx - 150, self.playfield.centery + 140),
+            color=self.palette.hazard,
+            frames=self.frames,
+            spin_speed_dps=260,
+        )
         self.hazards.add(hz1, hz2)
         self.all_sprites.add(hz1, hz2)
 
         for _ in range(10):
             for __ in range(120):
-                x = self.rng.randint(self.playfield.left + 50, self.playfield.right - 50)
-                y = self.rng.randint(self.playfield.top + 50, self.playfield.bottom - 50)
-                candidate = Coin((x, y), color=self.palette.coin)
+                x = rng.randint(self.playfield.left + 50, self.playfield.right - 50)
+                y = rng.randint(self.playfield.top + 50, self.playfield.bottom - 50)
+                candidate = Coin((x, y), color=self.palette.coin, frames=self.frames)
 
-                if pygame.sprite.spritecollideany(candidate, self.walls):
+                if self.tiles.collides(candidate.rect):
                     continue
                 if pygame.sprite.spritecollideany(candidate, self.coins):
                     continue
@@ -261,10 +375,17 @@ class Game:
                 self.all_sprites.add(candidate)
                 break
 
+        # The world is the tilemap; the camera shows the playfield-sized part of it
+        # around the player (the whole thing, when the world fits on screen).
+        self.camera = Camera(self.playfield, bounds=self.tiles.rect)
+        self.camera.center_on(self.player.rect.center)
+
         if not keep_state:
             self.state = "play"
 
     def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type in _REDRAW_EVENTS:
+            self._redraw = True  # the window needs repainting, or input may change the picture
         if event.type != pygame.KEYDOWN:
             return
 
@@ -328,55 +449,73 @@ class Game:
             self.player.pos.y += amount
             self.player.rect.centery = int(round(self.player.pos.y))
 
-        hits = pygame.sprite.spritecollide(self.player, self.walls, dokill=False)
+        # Collision bitmap lookup: only the solid tiles under the player rect.
+        hits = self.tiles.solid_rects(self.player.rect)
         if not hits:
             return
 
         for wall in hits:
             if axis == "x":
                 if amount > 0:
-                    self.player.rect.right = wall.rect.left
+                    self.player.rect.right = wall.left
                 elif amount < 0:
-                    self.player.rect.left = wall.rect.right
+                    self.player.rect.left = wall.right
                 self.player.pos.x = self.player.rect.centerx
             else:
                 if amount > 0:
-                    self.player.rect.bottom = wall.rect.top
+                    self.player.rect.bottom = wall.top
                 elif amount < 0:
-                    self.player.rect.top = wall.rect.bottom
+                    self.player.rect.top = wall.bottom
                 self.player.pos.y = self.player.rect.centery
 
     def _spawn_particles(self, center: tuple[int, int], *, color: pygame.Color, count: int) -> None:
-        for _ in range(count):
-            angle = self.rng.random() * 6.2831853
-            speed = self.rng.uniform(80.0, 240.0)
+        self._bursts += 1
+        quality = self.governor.quality
+        if quality.max_bursts is not None and len({p.burst for p in self.particles}) >= quality.max_bursts:
+            self.governor.skipped_bursts += 1
+            return
+        count = max(1, int(count * quality.particle_scale))
+
+        rng = self.random.stream("particles", self._bursts)
+        angles = rng.uniforms(count, 0.0, math.tau)
+        speeds = rng.uniforms(count, 80.0, 240.0)
+        radii = rng.uniforms(count, 2.0, 5.0)
+
+        for angle, speed, radius in zip(angles, speeds, radii):
             vel = pygame.Vector2(speed, 0).rotate_rad(angle)
             p = Particle(
                 pos=pygame.Vector2(center),
                 vel=vel,
-                radius=self.rng.uniform(2.0, 5.0),
+                radius=radius,
                 color=color,
                 life=0.35,
                 ttl=0.35,
+                burst=self._bursts,
             )
             self.particles.append(p)
 
+    @property
+    def shake_enabled(self) -> bool:
+        return self.cue_shake and self.governor.quality.shake
+
     def _cue_coin(self, coin_rect: pygame.Rect) -> None:
-        if self.cue_shake:
-            self._shake_for = max(self._shake_for, 0.10)
+        if self.shake_enabled:
+            self._shake.extend(0.10)
 
         if self.cue_particles:
             self._spawn_particles(coin_rect.center, color=self.palette.particle, count=18)
 
     def _cue_hit(self, source_rect: pygame.Rect) -> None:
         if self.cue_flash:
-            self.player.flash_for = 0.18
+            self.player.flash.start(0.18)
 
         if self.cue_hitstop:
-            self._hitstop_for = max(self._hitstop_for, 0.06)
+            # Freeze gameplay timers until the hitstop timer fires and resumes them.
+            self._hitstop.extend(0.06)
+            self.timers.pause()
 
-        if self.cue_shake:
-            self._shake_for = max(self._shake_for, 0.18)
+        if self.shake_enabled:
+            self._shake.extend(0.18)
 
         if self.cue_particles:
             self._spawn_particles(self.player.rect.center, color=self.palette.hazard, count=26)
@@ -386,7 +525,7 @@ class Game:
             return
 
         self.player.hp -= 1
-        self.player.invincible_for = 0.85
+        self.player.invincible.start(0.85)
 
         push = pygame.Vector2(self.player.rect.center) - pygame.Vector2(source_rect.center)
         if push.length_squared() == 0:
@@ -399,14 +538,27 @@ class Game:
         if self.player.hp <= 0:
             self.state = "gameover"
 
+    @property
+    def is_static(self) -> bool:
+        """True while nothing on screen moves: title or game over, with no particles or timers left."""
+        return self.state != "play" and not self.particles and len(self.timers) == 0 and len(self.fx_timers) == 0
+
+    def needs_redraw(self) -> bool:
+        """Whether the next frame could look different from the last one drawn."""
+        return self._redraw or not self.is_static
+
     def update(self, dt: float) -> None:
-        if self._shake_for > 0:
-            self._shake_for = max(0.0, self._shake_for - dt)
+        self._frame_started = time.perf_counter()
+        self._frame_dt = dt
+        if not self.is_static:
+            self._redraw = True  # still settling (last particles, shake), so draw once more after
+        self.fx_timers.advance(dt)
 
-        if self._hitstop_for > 0:
-            self._hitstop_for = max(0.0, self._hitstop_for - dt)
+        if self._hitstop.active:
             return
 
+        self.timers.advance(dt)
+
         for p in list(self.particles):
             p.update(dt)
         self.particles = [p for p in self.particles if p.alive]
@@ -427,6 +579,7 @@ class Game:
 
         self._move_player_axis("x", self.player.vel.x * dt)
         self._move_player_axis("y", self.player.vel.y * dt)
+        self.camera.follow(self.player.rect.center)
 
         picked = pygame.sprite.spritecollide(self.player, self.coins, dokill=True)
         if picked:
@@ -445,72 +598,208 @@ class Game:
             self.state = "play"
 
     def _camera_offset(self) -> tuple[int, int]:
-        if not self.cue_shake or self._shake_for <= 0:
+        if not self.shake_enabled or not self._shake.active:
             return (0, 0)
-        strength = _clamp(self._shake_for / 0.18, 0.0, 1.0)
+        strength = _clamp(self._shake.remaining / 0.18, 0.0, 1.0)
         max_px = 10 * strength
-        ox = int(self.rng.uniform(-max_px, max_px))
-        oy = int(self.rng.uniform(-max_px, max_px))
+        ox = int(self._shake_rng.uniform(-max_px, max_px))
+        oy = int(self._shake_rng.uniform(-max_px, max_px))
         return (ox, oy)
 
-    def draw(self) -> None:
-        self.screen.fill(self.palette.bg)
+    def frame_view(self) -> tuple[tuple[int, int], pygame.Rect]:
+        """This frame's camera offset (shake included) and the world area it shows.
+
+        Call once per drawn frame: the shake is random per call.
+        """
+        shake = self._camera_offset()
+        cam = (self.camera.offset[0] + shake[0], self.camera.offset[1] + shake[1])
 
-        hud_rect = pygame.Rect(0, 0, self.SCREEN_W, self.HUD_H)
-        pygame.draw.rect(self.screen, self.palette.panel, hud_rect)
+        # Only what's on screen gets drawn; the margin covers the shake.
+        view = self.camera.view.inflate(2 * abs(shake[0]), 2 * abs(shake[1]))
+        return cam, view
 
+    def hud_lines(self) -> list[tuple[str, tuple[int, int], pygame.Color]]:
         cues = f"Cues: [1]flash={'on' if self.cue_flash else 'off'}  [2]shake={'on' if self.cue_shake else 'off'}  [3]hitstop={'on' if self.cue_hitstop else 'off'}  [4]particles={'on' if self.cue_particles else 'off'}"
-        self._draw_text(f"HP {self.player.hp}   Score {self.player.score}", (12, 10), self.palette.text)
-        self._draw_text(cues, (12, 32), self.palette.subtle)
+        return [
+            (f"HP {self.player.hp}   Score {self.player.score}", (12, 10), self.palette.text),
+            (cues, (12, 32), self.palette.subtle),
+        ]
 
-        cam = self._camera_offset()
+    def center_message(self) -> str | None:
+        if self.state == "title":
+            return "Press Space to Start"
+        if self.state == "gameover":
+            return "Game Over — Press Space"
+        return None
+
+    def quality_line(self) -> str:
+        g = self.governor
+        line = f"quality: {g.quality.name}  frame work {g.average * 1000:.1f}/{g.budget * 1000:.1f} ms"
+        if g.skipped_bursts:
+            line += f"  skipped bursts {g.skipped_bursts}"
+        if g.log:
+            line += f"  | last: {g.log[-1].strip()}"
+        return line
+
+    def pacing_line(self) -> str | None:
+        p = self.pacing
+        if p is None or not p.frames:
+            return None
+        return (
+            f"pacing: p50 {p.percentile(50) * 1000:.1f}  p99 {p.percentile(99) * 1000:.1f}  "
+            f"worst {p.worst * 1000:.1f} ms  missed {p.missed}/{p.frames}"
+        )
 
-        pygame.draw.rect(self.screen, self.palette.panel, self.playfield)
+    def pacing_bars(self) -> list[pygame.Rect]:
+        """The jitter histogram as bars in the playfield's bottom-right corner (low jitter on the left)."""
+        if self.pacing is None or not self.pacing.frames:
+            return []
+        counts = self.pacing.jitter_counts
+        tallest = max(counts)
+        width = 14
+        area = pygame.Rect(0, 0, width * len(counts), 40)
+        area.bottomright = (self.playfield.right - 8, self.playfield.bottom - 8)
+        bars = []
+        for i, count in enumerate(counts):
+            h = max(1, area.height * count // tallest)  # empty buckets stay visible as a 1 px stub
+            bars.append(pygame.Rect(area.left + i * width, area.bottom - h, width - 2, h))
+        return bars
+
+    def frame_done(self) -> None:
+        """Call once the frame is drawn: tells the governor how long update + draw took."""
+        self.governor.observe(time.perf_counter() - self._frame_started, self._frame_dt)
+        self._redraw = False
 
-        for wall in self.walls:
-            pygame.draw.rect(self.screen, wall.color, wall.rect.move(cam))
+    @property
+    def player_flashing(self) -> bool:
+        return self.cue_flash and self.player.flash.active
 
-        for coin in self.coins:
-            self.screen.blit(coin.image, coin.rect.move(cam))
+    def draw(self) -> None:
+        s = self.render_scale
+        if s == 1:
+            drawn = self._draw_world(self.screen, 1)
+            self._draw_hud(self.screen, 1, drawn)
+            self.frame_done()
+            return
+
+        # Low-res: draw into the small canvas, then scale it up to the window in one go.
+        drawn = self._draw_world(self.canvas, s)
+        if not self.native_hud:
+            self._draw_hud(self.canvas, s, drawn)
+        pygame.transform.scale(self.canvas, self.screen.get_size(), self.screen)
+        if self.native_hud:
+            self._draw_hud(self.screen, 1, drawn)
+        self.frame_done()
+
+    def _draw_world(self, target: pygame.Surface, s: int) -> int:
+        """Background and playfield, at 1/`s` of the screen resolution; returns sprites drawn."""
+        target.fill(self.palette.bg)
+
+        cam, view = self.frame_view()
+        coins = self.coins.query(view)
+        hazards = self.hazards.query(view)
+
+        field = _scaled_rect(self.playfield, s)
+        pygame.draw.rect(target, self.palette.panel, field)
+        target.set_clip(field)
+
+        # Everything is queued by layer and drawn with one `blits` call per layer.
+        queue = self.render_queue
+        queue.extend(
+            LAYER_TILES,
+            [(self._at_scale(image, s), (x // s, y // s)) for image, (x, y) in self.tiles.visible_chunks(cam, self.playfield)],
+        )
+        queue.extend(LAYER_COINS, [(self._at_scale(c.image, s), _scaled_rect(c.rect.move(cam), s)) for c in coins])
 
-        for hz in self.hazards:
-            self.screen.blit(hz.image, hz.rect.move(cam))
+        for hz in hazards:
+            # At low res, rotate the small base rather than shrink a rotated one.
+            image = hz.image if s == 1 else pygame.transform.rotate(self._at_scale(hz.base, s), hz.angle)
+            center = hz.rect.move(cam).center
+            queue.add(LAYER_HAZARDS, image, image.get_rect(center=(center[0] // s, center[1] // s)))
 
-        player_image = self.player.image
-        if self.cue_flash and self.player.flash_for > 0:
+        player_image = self._at_scale(self.player.image, s)
+        if self.player_flashing:
             player_image = player_image.copy()
             player_image.fill((255, 255, 255, 120), special_flags=pygame.BLEND_RGBA_ADD)
-        self.screen.blit(player_image, self.player.rect.move(cam))
+        queue.add(LAYER_PLAYER, player_image, _scaled_rect(self.player.rect.move(cam), s))
 
+        particle_view = view.inflate(16, 16)  # particles are at most ~7 px in radius
         for p in self.particles:
-            a = _clamp(p.life / p.ttl, 0.0, 1.0)
-            radius = max(1, int(round(p.radius * (0.8 + 0.6 * a))))
+            if not particle_view.collidepoint(p.pos):
+                continue
+            radius, alpha = p.appearance()
             col = pygame.Color(p.color)
-            col.a = int(255 * a)
-            surf = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, col, (radius + 1, radius + 1), radius)
-            self.screen.blit(surf, (p.pos.x - radius + cam[0], p.pos.y - radius + cam[1]))
+            col.a = alpha
+            r = max(1, round(radius / s))
+            surf = pygame.Surface((r * 2 + 2, r * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, col, (r + 1, r + 1), r)
+            queue.add(LAYER_PARTICLES, surf, ((p.pos.x + cam[0]) / s - r, (p.pos.y + cam[1]) / s - r))
+
+        queue.flush(target)
 
         if self.debug:
-            pygame.draw.rect(self.screen, pygame.Color("#d08770"), self.player.rect.move(cam), 2)
-            for coin in self.coins:
-                pygame.draw.rect(self.screen, pygame.Color("#ebcb8b"), coin.rect.move(cam), 2)
-            for hz in self.hazards:
-                pygame.draw.rect(self.screen, pygame.Color("#bf616a"), hz.rect.move(cam), 2)
+            width = max(1, 2 // s)
+            pygame.draw.rect(target, pygame.Color("#d08770"), _scaled_rect(self.player.rect.move(cam), s), width)
+            for coin in coins:
+                pygame.draw.rect(target, pygame.Color("#ebcb8b"), _scaled_rect(coin.rect.move(cam), s), width)
+            for hz in hazards:
+                pygame.draw.rect(target, pygame.Color("#bf616a"), _scaled_rect(hz.rect.move(cam), s), width)
 
-        if self.state == "title":
-            self._draw_centered("Press Space to Start", y=self.playfield.centery, color=self.palette.text)
-        elif self.state == "gameover":
-            self._draw_centered("Game Over — Press Space", y=self.playfield.centery, color=self.palette.text)
+        target.set_clip(None)
+        return len(coins) + len(hazards)
+
+    def _draw_hud(self, target: pygame.Surface, s: int, drawn: int) -> None:
+        """HUD panel, debug line and centered message, at 1/`s` of the screen resolution."""
+        font, big_font = (self.font, self.big_font) if s == 1 else self._small_fonts(s)
+
+        pygame.draw.rect(target, self.palette.panel, pygame.Rect(0, 0, self.SCREEN_W // s, self.HUD_H // s))
+        for text, (x, y), color in self.hud_lines():
+            target.blit(font.render(text, True, color), (x // s, y // s))
+
+        if self.debug:
+            total = len(self.coins) + len(self.hazards)
+            pos = ((self.playfield.left + 8) // s, (self.playfield.bottom - 26) // s)
+            target.blit(font.render(f"drawn {drawn}/{total} sprites", True, self.palette.subtle), pos)
+            pos = (pos[0], pos[1] - font.get_linesize())
+            target.blit(font.render(self.quality_line(), True, self.palette.subtle), pos)
+            pacing = self.pacing_line()
+            if pacing is not None:
+                pos = (pos[0], pos[1] - font.get_linesize())
+                target.blit(font.render(pacing, True, self.palette.subtle), pos)
+                for bar in self.pacing_bars():
+                    pygame.draw.rect(target, self.palette.subtle, _scaled_rect(bar, s))
+
+        message = self.center_message()
+        if message is not None:
+            text = big_font.render(message, True, self.palette.text)
+            target.blit(text, text.get_rect(center=(self.playfield.centerx // s, self.playfield.centery // s)))
+
+    def _at_scale(self, image: pygame.Surface, s: int) -> pygame.Surface:
+        """`image` shrunk to 1/`s`, made once per source surface."""
+        if s == 1:
+            return image
+        small = self._small_images.get(image)
+        if small is None:
+            if image.get_flags() & pygame.SRCALPHA:
+                small = pygame.transform.smoothscale_by(image, 1 / s)
+            else:
+                # Colorkeyed (tile chunks): no smoothing, which would blend in the key
+                # color, and round up so neighbouring chunks don't leave a 1 px seam.
+                w, h = image.get_size()
+                small = pygame.transform.scale(image, (-(-w // s), -(-h // s)))
+            self._small_images[image] = small
+        return small
+
+    def _small_fonts(self, s: int) -> tuple[pygame.font.Font, pygame.font.Font]:
+        if self._hud_fonts is None:
+            self._hud_fonts = (pygame.font.Font(None, max(8, 22 // s)), pygame.font.Font(None, max(8, 40 // s)))
+        return self._hud_fonts
 
-    def _draw_text(self, text: str, pos: tuple[int, int], color: pygame.Color) -> None:
-        s = self.font.render(text, True, color)
-        self.screen.blit(s, pos)
 
-    def _draw_centered(self, text: str, *, y: int, color: pygame.Color) -> None:
-        s = self.big_font.render(text, True, color)
-        r = s.get_rect(center=(self.playfield.centerx, y))
-        self.screen.blit(s, r)
+def _scaled_rect(rect: pygame.Rect, s: int) -> pygame.Rect:
+    if s == 1:
+        return rect
+    return pygame.Rect(rect.x // s, rect.y // s, rect.w // s, rect.h // s)
 
 
 def _make_coin_frames(color: pygame.Color) -> list[pygame.Surface]:
@@ -537,6 +826,19 @@ def _make_coin_frames(color: pygame.Color) -> list[pygame.Surface]:
     return frames
 
 
+def _rotated_size(size: tuple[int, int], angle: float) -> tuple[int, int]:
+    # Bounding box of a w x h surface rotated by `angle` degrees, computed the way
+    # pygame's C rotate does (truncated, not rounded).
+    w, h = size
+    rad = math.radians(angle)
+    cx, cy = math.cos(rad) * w, math.cos(rad) * h
+    sx, sy = math.sin(rad) * w, math.sin(rad) * h
+    return (
+        int(max(abs(cx + sy), abs(cx - sy))),
+        int(max(abs(sx + cy), abs(sx - cy))),
+    )
+
+
 def _make_hazard_surface(size: int, color: pygame.Color) -> pygame.Surface:
     surf = pygame.Surface((size, size), pygame.SRCALPHA)
     cx, cy = size // 2, size // 2
@@ -551,27 +853,27 @@ def _make_hazard_surface(size: int, color: pygame.Color) -> pygame.Surface:
     return surf
 
 
-def _make_player_anims(color: pygame.Color) -> dict[str, Animation]:
-    idle = [_draw_player_frame(color, leg_phase=0, eye_open=True)]
+def _make_player_anims(color: pygame.Color, frames: FrameCache) -> dict[str, Animation]:
+    baked = frames.frames(_bake_player_frames, color)
+    return {
+        "idle": Animation(baked[:1], fps=1.0),
+        "run": Animation(baked[1:5], fps=10.0),
+        "hurt": Animation(baked[5:], fps=8.0),
+    }
 
-    run_frames = [
+
+def _bake_player_frames(color: pygame.Color) -> list[pygame.Surface]:
+    # idle, run x4, hurt x2
+    return [
+        _draw_player_frame(color, leg_phase=0, eye_open=True),
         _draw_player_frame(color, leg_phase=0, eye_open=True),
         _draw_player_frame(color, leg_phase=1, eye_open=True),
         _draw_player_frame(color, leg_phase=2, eye_open=True),
         _draw_player_frame(color, leg_phase=3, eye_open=True),
-    ]
-
-    hurt_frames = [
         _draw_player_frame(pygame.Color("#d08770"), leg_phase=0, eye_open=False),
         _draw_player_frame(pygame.Color("#bf616a"), leg_phase=2, eye_open=False),
     ]
 
-    return {
-        "idle": Animation(idle, fps=1.0),
-        "run": Animation(run_frames, fps=10.0),
-        "hurt": Animation(hurt_frames, fps=8.0),
-    }
-
 
 def _draw_player_frame(color: pygame.Color, *, leg_phase: int, eye_open: bool) -> pygame.Surface:
     w, h = 44, 44
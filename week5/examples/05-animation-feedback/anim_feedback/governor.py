@@ -0,0 +1,109 @@
+"""Adaptive quality: trade feedback polish for frame time when the game falls behind.
+
+The game reports how long each frame's work took (update + draw, not the time
+spent waiting for the next frame). `QualityGovernor` smooths that and compares it
+to the frame budget (1 / fps):
+
+- above `high` x budget, it steps down one `Quality` level (fewer particles, fewer
+  simultaneous bursts, then no screen shake), at most once per `cooldown` seconds
+- below `low` x budget for `recover_after` seconds, it steps back up one level
+
+The gap between `high` and `low` keeps it from flipping back and forth. The cue
+keys (1-4) still work: the governor only ever turns effects down further.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Quality:
+    name: str
+    particle_scale: float  # fraction of each burst's particles to spawn
+    max_bursts: int | None  # particle bursts alive at once (None = no limit)
+    shake: bool
+
+
+LEVELS = (
+    Quality("full", particle_scale=1.0, max_bursts=None, shake=True),
+    Quality("half particles", particle_scale=0.5, max_bursts=None, shake=True),
+    Quality("quarter particles", particle_scale=0.25, max_bursts=3, shake=True),
+    Quality("minimal", particle_scale=0.25, max_bursts=1, shake=False),
+)
+
+
+class QualityGovernor:
+    def __init__(
+        self,
+        budget: float,
+        *,
+        levels: tuple[Quality, ...] = LEVELS,
+        high: float = 0.8,
+        low: float = 0.4,
+        smoothing: float = 0.1,
+        cooldown: float = 0.5,
+        recover_after: float = 2.0,
+        warmup: float = 1.0,
+        enabled: bool = True,
+        echo: bool = False,
+    ) -> None:
+        self.budget = budget  # seconds per frame
+        self.levels = levels
+        self.high = high
+        self.low = low
+        self.smoothing = smoothing
+        self.cooldown = cooldown
+        self.recover_after = recover_after
+        self.warmup = warmup  # seconds to just measure: the first frames are always slow
+        self.enabled = enabled  # False = only measure
+        self.echo = echo  # also print each decision
+
+        self.level = 0
+        self.average = 0.0  # smoothed work per frame, seconds
+        self.skipped_bursts = 0
+        self.log: deque[str] = deque(maxlen=20)
+
+        self._time = 0.0
+        self._last_change = float("-inf")
+        self._calm = 0.0  # how long there has been headroom
+
+    @property
+    def quality(self) -> Quality:
+        return self.levels[self.level]
+
+    def observe(self, work: float, dt: float) -> None:
+        """Record one frame: `work` seconds of update + draw, `dt` seconds of game time."""
+        self._time += dt
+        if self.average == 0.0:
+            self.average = work
+        else:
+            self.average += (work - self.average) * self.smoothing
+
+        if not self.enabled or self._time < self.warmup:
+            return
+
+        if self.average > self.high * self.budget:
+            self._calm = 0.0
+            if self.level < len(self.levels) - 1 and self._time - self._last_change >= self.cooldown:
+                self._set(self.level + 1, "over budget")
+        elif self.average < self.low * self.budget:
+            self._calm += dt
+            if self.level > 0 and self._calm >= self.recover_after:
+                self._calm = 0.0
+                self._set(self.level - 1, "headroom")
+        else:
+            self._calm = 0.0
+
+    def _set(self, level: int, reason: str) -> None:
+        old = self.quality
+        self.level = level
+        self._last_change = self._time
+        entry = (
+            f"{self._time:7.2f}s  {old.name} -> {self.quality.name}  "
+            f"({reason}: {self.average * 1000:.1f} of {self.budget * 1000:.1f} ms)"
+        )
+        self.log.append(entry)
+        if self.echo:
+            print(f"quality: {entry}")
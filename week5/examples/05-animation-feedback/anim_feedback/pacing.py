@@ -0,0 +1,131 @@
+"""Frame pacing: start each frame on time, and measure how close it got.
+
+`Clock.tick(fps)` waits with `SDL_Delay`, which can overshoot by a millisecond
+or more depending on the OS timer, and `main.py` then clamps dt to 50 ms, so a
+stutter never shows up anywhere. `FramePacer` keeps an absolute deadline for
+each frame, 1 / fps apart. In "sleep-spin" mode it sleeps until `spin` seconds
+before the deadline and busy-waits the rest on `time.perf_counter`; in "clock"
+mode it waits with `Clock.tick` as before and only measures.
+
+Either way `FrameStats` records every frame interval, before any clamping:
+
+- jitter: how far each interval was from the target period, as a histogram
+- missed deadlines: frames whose update + draw ran past the deadline, so the
+  next frame could only start late
+- percentiles of the last few seconds of intervals
+
+`Game.pacing_line()` / `Game.pacing_bars()` show them in the debug overlay (F1)
+and `main.py --pacing-report PATH` writes them as JSON on exit.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import json
+import time
+
+import pygame
+
+# Upper edges (ms) of the jitter histogram buckets; one more bucket holds the rest.
+JITTER_BUCKETS_MS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+
+
+class FrameStats:
+    def __init__(self, *, window: int = 600) -> None:
+        self.frames = 0
+        self.missed = 0
+        self.period = 0.0  # target seconds per frame, from the last recorded frame
+        self.worst = 0.0  # longest interval, seconds
+        self.jitter_counts = [0] * (len(JITTER_BUCKETS_MS) + 1)
+        self.recent: deque[float] = deque(maxlen=window)  # last intervals, seconds
+
+    def record(self, interval: float, period: float, *, missed: bool) -> None:
+        self.frames += 1
+        self.period = period
+        self.worst = max(self.worst, interval)
+        self.recent.append(interval)
+        if missed:
+            self.missed += 1
+
+        jitter_ms = abs(interval - period) * 1000
+        bucket = 0
+        while bucket < len(JITTER_BUCKETS_MS) and jitter_ms > JITTER_BUCKETS_MS[bucket]:
+            bucket += 1
+        self.jitter_counts[bucket] += 1
+
+    def percentile(self, q: float) -> float:
+        """The `q`-th percentile (0-100) of the recent intervals, in seconds."""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+    def histogram(self) -> list[tuple[str, int]]:
+        """(bucket label, frames) for each jitter bucket."""
+        labels = [f"<={edge:g} ms" for edge in JITTER_BUCKETS_MS] + [f">{JITTER_BUCKETS_MS[-1]:g} ms"]
+        return list(zip(labels, self.jitter_counts))
+
+    def to_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "target_ms": round(self.period * 1000, 3),
+            "missed_deadlines": self.missed,
+            "worst_ms": round(self.worst * 1000, 3),
+            "recent_ms": {f"p{q}": round(self.percentile(q) * 1000, 3) for q in (50, 95, 99)},
+            "jitter_histogram": dict(self.histogram()),
+        }
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+
+class FramePacer:
+    MODES = ("clock", "sleep-spin")
+
+    def __init__(self, *, mode: str = "clock", spin: float = 0.002, stats: FrameStats | None = None) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, got {mode!r}")
+        self.mode = mode
+        self.spin = spin  # seconds before the deadline to stop sleeping and spin instead
+        self.stats = stats or FrameStats()
+        self._clock = pygame.time.Clock()
+        self._last: float | None = None  # when the previous frame started
+        self._deadline: float | None = None  # when the next one should; None = no schedule yet
+
+    def tick(self, fps: float, *, measure: bool = True) -> float:
+        """Wait for the next frame's deadline; returns seconds since the previous frame started.
+
+        `measure=False` (e.g. after an idle wait) leaves the frame out of the stats and
+        restarts the schedule from now.
+        """
+        period = 1.0 / fps if fps > 0 else 0.0
+        start = time.perf_counter()
+        deadline = self._deadline if measure and self._deadline is not None else start
+        late = start - deadline
+
+        if self.mode == "sleep-spin":
+            self._wait_until(deadline)
+        else:
+            self._clock.tick(fps)
+
+        now = time.perf_counter()
+        interval = 0.0 if self._last is None else now - self._last
+        if measure and self._deadline is not None and period > 0:
+            self.stats.record(interval, period, missed=late > 0)
+
+        # More than a frame behind: start a new schedule instead of rushing to catch up.
+        if self.mode == "clock" or late > period:
+            self._deadline = now + period
+        else:
+            self._deadline = deadline + period
+        self._last = now
+        return interval
+
+    def _wait_until(self, deadline: float) -> None:
+        remaining = deadline - time.perf_counter()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.perf_counter() < deadline:
+            pass
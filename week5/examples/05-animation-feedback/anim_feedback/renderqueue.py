@@ -0,0 +1,53 @@
+"""Batched drawing: collect blits per layer, submit each layer with one call.
+
+`screen.blit(image, pos)` in a Python loop pays for a method call, argument
+parsing and a returned Rect per sprite. `RenderQueue` just appends
+(image, dest) pairs while the frame is built and hands each layer to
+`Surface.blits(..., doreturn=False)`, which loops in C.
+
+Layers are drawn in ascending order, so the order things are queued in only
+matters within a layer. Layers listed in `sort_by_surface` are also sorted so
+blits of the same image run back to back (good for caches when many sprites
+share a few frames); only list layers whose sprites don't overlap, since sorting
+changes which one ends up on top.
+"""
+
+from __future__ import annotations
+
+from typing import Collection, Iterable, Union
+
+import pygame
+
+Dest = Union[pygame.Rect, tuple[float, float]]
+
+
+class RenderQueue:
+    def __init__(self, *, sort_by_surface: Collection[int] = ()) -> None:
+        self.sort_by_surface = frozenset(sort_by_surface)  # layers to sort by source image
+        self._layers: dict[int, list[tuple[pygame.Surface, Dest]]] = {}
+        self.submitted = 0  # blits in the last flush
+
+    def add(self, layer: int, image: pygame.Surface, dest: Dest) -> None:
+        self._layer(layer).append((image, dest))
+
+    def extend(self, layer: int, blits: Iterable[tuple[pygame.Surface, Dest]]) -> None:
+        self._layer(layer).extend(blits)
+
+    def flush(self, target: pygame.Surface) -> None:
+        """Draw every queued layer onto `target` (bottom layer first) and empty the queue."""
+        self.submitted = 0
+        for layer in sorted(self._layers):
+            blits = self._layers[layer]
+            if not blits:
+                continue
+            if layer in self.sort_by_surface:
+                blits.sort(key=lambda blit: id(blit[0]))
+            target.blits(blits, doreturn=False)
+            self.submitted += len(blits)
+            blits.clear()  # keep the list for next frame
+
+    def _layer(self, layer: int) -> list[tuple[pygame.Surface, Dest]]:
+        blits = self._layers.get(layer)
+        if blits is None:
+            blits = self._layers[layer] = []
+        return blits
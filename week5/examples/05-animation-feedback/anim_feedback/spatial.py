@@ -0,0 +1,65 @@
+"""Spatial index: a sprite group that can answer "which sprites are near here?".
+
+`SpatialGroup` is a normal `pygame.sprite.Group` (so `spritecollide`, `kill()`,
+`update()` all still work) that also files each sprite into the cells of a uniform
+grid. `query(rect)` only looks at the cells under `rect`, so asking for the
+sprites on screen costs the same no matter how big the world is.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+
+class SpatialGroup(pygame.sprite.Group):
+    def __init__(self, *sprites: pygame.sprite.Sprite, cell_size: int = 128, margin: int = 16) -> None:
+        self.cell_size = cell_size
+        # Sprites whose rect changes size in place (animation, rotation) may grow this
+        # much past the rect they were filed with; queries look that far around.
+        self.margin = margin
+        self._cells: dict[tuple[int, int], dict[pygame.sprite.Sprite, None]] = {}
+        self._sprite_cells: dict[pygame.sprite.Sprite, list[tuple[int, int]]] = {}
+        super().__init__(*sprites)
+
+    def _cells_for(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        cs = self.cell_size
+        return [
+            (cx, cy)
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1)
+            for cx in range(rect.left // cs, (rect.right - 1) // cs + 1)
+        ]
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int | None = None) -> None:
+        super().add_internal(sprite, layer)
+        self._file(sprite)
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        self._unfile(sprite)
+        super().remove_internal(sprite)
+
+    def reindex(self, sprite: pygame.sprite.Sprite) -> None:
+        """Call after moving a sprite so it's filed under its new cells."""
+        self._unfile(sprite)
+        self._file(sprite)
+
+    def _file(self, sprite: pygame.sprite.Sprite) -> None:
+        cells = self._cells_for(sprite.rect)
+        for cell in cells:
+            self._cells.setdefault(cell, {})[sprite] = None
+        self._sprite_cells[sprite] = cells
+
+    def _unfile(self, sprite: pygame.sprite.Sprite) -> None:
+        for cell in self._sprite_cells.pop(sprite, ()):
+            bucket = self._cells[cell]
+            del bucket[sprite]
+            if not bucket:
+                del self._cells[cell]
+
+    def query(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Sprites whose current rect overlaps `rect`."""
+        found: dict[pygame.sprite.Sprite, None] = {}
+        for cell in self._cells_for(rect.inflate(2 * self.margin, 2 * self.margin)):
+            bucket = self._cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        return [s for s in found if s.rect.colliderect(rect)]
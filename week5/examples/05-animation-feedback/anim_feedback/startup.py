@@ -0,0 +1,47 @@
+"""Startup profile: where does the time go before the first frame?
+
+`main.py --profile-startup` passes a `StartupProfile` to `Game`, which wraps each
+startup phase in `profile.phase(name)`; the report is printed after the first
+frame is on screen.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import time
+from typing import Iterator
+
+
+class StartupProfile:
+    def __init__(self, started: float | None = None) -> None:
+        self.started = time.perf_counter() if started is None else started
+        self.phases: list[tuple[str, float]] = []
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases.append((name, seconds))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - t0)
+
+    def report(self) -> str:
+        total = time.perf_counter() - self.started
+        width = max([len(name) for name, _ in self.phases] + [len("first frame")])
+        lines = [f"{name:<{width}}  {seconds * 1000:8.1f} ms" for name, seconds in self.phases]
+        other = total - sum(seconds for _, seconds in self.phases)
+        lines.append(f"{'other':<{width}}  {other * 1000:8.1f} ms")
+        lines.append(f"{'first frame':<{width}}  {total * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+class _NoProfile:
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        yield
+
+
+NO_PROFILE = _NoProfile()
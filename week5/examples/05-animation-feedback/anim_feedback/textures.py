@@ -0,0 +1,178 @@
+"""Optional renderer: SDL2 textures instead of Surface blits.
+
+`Game.draw` paints everything with `Surface.blit` and `pygame.draw` on the CPU.
+`TextureRenderer` draws the same frame through SDL's 2D renderer
+(`pygame._sdl2.video`): each cached sprite frame (coin frames, the hazard, player
+frames, tile chunks) is uploaded as a texture the first time it's drawn and reused
+after that. Hazard rotation, particle color/alpha and the hit flash (additive
+blending) are applied by the renderer at draw time, so no surfaces are made per
+frame.
+
+With a GPU driver that work leaves the CPU. SDL's software renderer works too
+(e.g. on a headless machine with SDL_VIDEODRIVER=dummy), which is how both paths
+can be benchmarked side by side: `python3 main.py --renderer texture --bench 600`.
+
+`open_texture_renderer` returns None when `pygame._sdl2` or a renderer isn't
+available; main.py then falls back to the Surface path.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import weakref
+
+import pygame
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:  # not every pygame build ships _sdl2
+    Renderer = Texture = Window = None
+
+if TYPE_CHECKING:
+    from anim_feedback.game import Game
+
+# SDL_BlendMode values
+_BLEND = 1
+_ADD = 2
+
+_DOT_RADIUS = 16
+
+
+def open_texture_renderer(title: str, size: tuple[int, int], *, software: bool = False) -> TextureRenderer | None:
+    """A window with an SDL renderer, or None if that isn't possible here.
+
+    Don't call `pygame.display.set_mode` as well: a window can have a display
+    surface or a renderer, not both.
+    """
+    if Window is None:
+        return None
+    try:
+        window = Window(title, size=size)
+        renderer = Renderer(window, accelerated=0 if software else -1)
+    except pygame.error:
+        return None
+    return TextureRenderer(renderer)
+
+
+class TextureRenderer:
+    def __init__(self, renderer: Renderer) -> None:
+        self.renderer = renderer
+        # One texture per source surface, dropped when the surface is (e.g. the old
+        # level's tile chunks after a reset).
+        self._textures: weakref.WeakKeyDictionary[pygame.Surface, Texture] = weakref.WeakKeyDictionary()
+        self._text: dict[tuple[int, str, tuple[int, ...]], Texture] = {}
+        self.uploads = 0
+
+        # Particles are one white dot, tinted and faded per particle.
+        self._dot_surface = pygame.Surface((_DOT_RADIUS * 2, _DOT_RADIUS * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self._dot_surface, (255, 255, 255), (_DOT_RADIUS, _DOT_RADIUS), _DOT_RADIUS)
+        self._dot = self.texture(self._dot_surface)
+
+    def texture(self, surface: pygame.Surface) -> Texture:
+        """The texture for `surface`, uploaded on first use. Don't edit `surface` afterwards."""
+        tex = self._textures.get(surface)
+        if tex is None:
+            tex = Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = tex
+            self.uploads += 1
+        return tex
+
+    def text(self, font: pygame.font.Font, text: str, color: pygame.Color) -> Texture:
+        key = (id(font), text, tuple(color))
+        tex = self._text.get(key)
+        if tex is None:
+            if len(self._text) > 64:
+                self._text.clear()  # HUD text changes now and then; don't keep every score
+            tex = Texture.from_surface(self.renderer, font.render(text, True, color))
+            self._text[key] = tex
+        return tex
+
+    def draw(self, game: Game) -> None:
+        """Draw `game`'s current frame (what `game.draw()` would show)."""
+        r = self.renderer
+        palette = game.palette
+
+        r.set_viewport(None)
+        r.draw_color = palette.bg
+        r.clear()
+
+        r.draw_color = palette.panel
+        r.fill_rect(pygame.Rect(0, 0, game.SCREEN_W, game.HUD_H))
+        for text, pos, color in game.hud_lines():
+            self.text(game.font, text, color).draw(dstrect=pos)
+
+        cam, view = game.frame_view()
+        coins = game.coins.query(view)
+        hazards = game.hazards.query(view)
+
+        field = game.playfield
+        r.fill_rect(field)
+
+        # The viewport clips to the playfield and makes its top-left (0, 0).
+        r.set_viewport(field)
+        ox = cam[0] - field.left
+        oy = cam[1] - field.top
+
+        for image, (x, y) in game.tiles.visible_chunks(cam, field):
+            self.texture(image).draw(dstrect=(x - field.left, y - field.top))
+
+        for coin in coins:
+            self.texture(coin.image).draw(dstrect=coin.rect.move(ox, oy))
+
+        for hz in hazards:
+            dst = hz.base.get_rect(center=(hz.rect.centerx + ox, hz.rect.centery + oy))
+            # transform.rotate turns counterclockwise, the renderer clockwise.
+            self.texture(hz.base).draw(dstrect=dst, angle=-hz.angle)
+
+        player = self.texture(game.player.image)
+        player_dst = game.player.rect.move(ox, oy)
+        player.draw(dstrect=player_dst)
+        if game.player_flashing:
+            player.blend_mode = _ADD
+            player.alpha = 120
+            player.draw(dstrect=player_dst)
+            player.blend_mode = _BLEND
+            player.alpha = 255
+
+        particle_view = view.inflate(16, 16)
+        for p in game.particles:
+            if not particle_view.collidepoint(p.pos):
+                continue
+            radius, alpha = p.appearance()
+            self._dot.color = p.color[:3]
+            self._dot.alpha = alpha
+            self._dot.draw(dstrect=pygame.Rect(int(p.pos.x) - radius + ox, int(p.pos.y) - radius + oy, radius * 2, radius * 2))
+
+        if game.debug:
+            for rect, color in [(game.player.rect, "#d08770")] + [(c.rect, "#ebcb8b") for c in coins] + [(h.rect, "#bf616a") for h in hazards]:
+                r.draw_color = pygame.Color(color)
+                box = rect.move(ox, oy)
+                r.draw_rect(box)
+                r.draw_rect(box.inflate(-2, -2))
+
+        r.set_viewport(None)
+
+        if game.debug:
+            drawn = len(coins) + len(hazards)
+            total = len(game.coins) + len(game.hazards)
+            label = f"drawn {drawn}/{total} sprites, {self.uploads} textures uploaded"
+            self.text(game.font, label, palette.subtle).draw(dstrect=(field.left + 8, field.bottom - 26))
+            y = field.bottom - 26 - game.font.get_linesize()
+            self.text(game.font, game.quality_line(), palette.subtle).draw(dstrect=(field.left + 8, y))
+            pacing = game.pacing_line()
+            if pacing is not None:
+                y -= game.font.get_linesize()
+                self.text(game.font, pacing, palette.subtle).draw(dstrect=(field.left + 8, y))
+                r.draw_color = palette.subtle
+                for bar in game.pacing_bars():
+                    r.fill_rect(bar)
+
+        message = game.center_message()
+        if message is not None:
+            tex = self.text(game.big_font, message, palette.text)
+            tex.draw(dstrect=tex.get_rect(center=(field.centerx, field.centery)))
+
+        game.frame_done()
+
+    def present(self) -> None:
+        self.renderer.present()
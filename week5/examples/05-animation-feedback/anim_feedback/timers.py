@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+
+class Timer:
+    """A restartable countdown scheduled on a `TimerWheel`.
+
+    `active` is True while the timer is counting down; `remaining` is the time left
+    in seconds (0 once it has fired or been cancelled).
+    """
+
+    __slots__ = ("wheel", "callback", "deadline", "tick", "bucket")
+
+    def __init__(self, wheel: TimerWheel, callback: Callable[[], None] | None = None) -> None:
+        self.wheel = wheel
+        self.callback = callback
+        self.deadline = 0.0  # wheel time when the timer fires
+        self.tick = 0  # deadline rounded up to a whole wheel tick
+        self.bucket: dict[Timer, None] | None = None  # wheel slot while scheduled
+
+    @property
+    def active(self) -> bool:
+        return self.bucket is not None
+
+    @property
+    def remaining(self) -> float:
+        if self.bucket is None:
+            return 0.0
+        return max(0.0, self.deadline - self.wheel.now)
+
+    def start(self, duration: float) -> Timer:
+        """(Re)start the countdown, replacing any time left."""
+        self.wheel._insert(self, duration)
+        return self
+
+    def extend(self, duration: float) -> Timer:
+        """Make sure at least `duration` seconds are left (like `t = max(t, duration)`)."""
+        if duration > self.remaining:
+            self.start(duration)
+        return self
+
+    def cancel(self) -> None:
+        self.wheel._remove(self)
+
+
+class TimerWheel:
+    """Hierarchical timing wheel: one shared clock for every countdown in a game.
+
+    Level 0 has `slots` buckets of `resolution` seconds each; every level above covers
+    `slots` times the span of the one below. A timer is filed in the lowest level
+    whose span reaches its deadline and moves down a level when the clock gets close
+    (a "cascade"). `advance(dt)` only visits the buckets the clock passes over, so the
+    per-frame cost depends on how many timers expire, not how many exist.
+
+    While `paused` (e.g. during hitstop) `advance` does nothing and every timer on
+    this wheel keeps its remaining time.
+    """
+
+    def __init__(self, *, resolution: float = 0.001, slots: int = 64, levels: int = 4) -> None:
+        if slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+
+        self.now = 0.0
+        self.paused = False
+
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._tick = 0  # next tick to process
+        self._wheel: list[list[dict[Timer, None]]] = [[{} for _ in range(slots)] for _ in range(levels)]
+        self._overflow: dict[Timer, None] = {}  # deadlines beyond the top level
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def timer(self, callback: Callable[[], None] | None = None) -> Timer:
+        """Create an idle timer; call `start` on it to begin counting down."""
+        return Timer(self, callback)
+
+    def schedule(self, delay: float, callback: Callable[[], None] | None = None) -> Timer:
+        """Run `callback` after `delay` seconds of wheel time."""
+        return Timer(self, callback).start(delay)
+
+    def pause(self) -> None:
+        self.paused = True
+
+    def resume(self) -> None:
+        self.paused = False
+
+    def advance(self, dt: float) -> None:
+        if self.paused or dt <= 0:
+            return
+
+        self.now += dt
+        target = int(self.now / self.resolution)
+        if self._count == 0:
+            # Nothing scheduled: jump straight to the new time.
+            self._tick = target + 1
+            return
+
+        while self._tick <= target and self._count > 0:
+            self._process(self._tick)
+        self._tick = max(self._tick, target + 1)
+
+    def _process(self, tick: int) -> None:
+        # Cascade higher levels whose bucket starts at this tick (top level first).
+        for level in range(self.levels - 1, 0, -1):
+            if tick & ((1 << (self._bits * level)) - 1) == 0:
+                slot = (tick >> (self._bits * level)) & self._mask
+                bucket = self._wheel[level][slot]
+                if bucket:
+                    self._wheel[level][slot] = {}
+                    for t in bucket:
+                        self._file(t, tick)
+        if self._overflow and tick & ((1 << (self._bits * self.levels)) - 1) == 0:
+            bucket = self._overflow
+            self._overflow = {}
+            for t in bucket:
+                self._file(t, tick)
+
+        slot = tick & self._mask
+        due = self._wheel[0][slot]
+        self._tick = tick + 1
+        if not due:
+            return
+
+        # Swap the bucket out first so callbacks can safely schedule new timers. Timers
+        # stay filed in `due` until they fire, so a callback that cancels or restarts
+        # another one due this tick takes it out of `due` and it doesn't fire.
+        self._wheel[0][slot] = {}
+        for t in list(due):
+            if t.bucket is not due:
+                continue
+            del due[t]
+            t.bucket = None
+            self._count -= 1
+            if t.callback is not None:
+                t.callback()
+
+    def _file(self, t: Timer, current: int) -> None:
+        for level in range(self.levels):
+            shift = self._bits * (level + 1)
+            if (t.tick >> shift) == (current >> shift):
+                bucket = self._wheel[level][(t.tick >> (self._bits * level)) & self._mask]
+                break
+        else:
+            bucket = self._overflow
+        bucket[t] = None
+        t.bucket = bucket
+
+    def _insert(self, t: Timer, duration: float) -> None:
+        self._remove(t)
+        t.deadline = self.now + max(0.0, duration)
+        # Small epsilon so e.g. 0.1 / 0.001 doesn't round up to 101 ticks.
+        t.tick = max(self._tick, math.ceil(t.deadline / self.resolution - 1e-9))
+        self._file(t, self._tick)
+        self._count += 1
+
+    def _remove(self, t: Timer) -> None:
+        if t.bucket is None:
+            return
+        del t.bucket[t]
+        t.bucket = None
+        self._count -= 1
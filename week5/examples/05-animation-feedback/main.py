@@ -1,30 +1,171 @@
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse
+from pathlib import Path
+
 import pygame
 
 from anim_feedback.game import Game
+from anim_feedback.governor import QualityGovernor
+from anim_feedback.idle import IdleLoop
+from anim_feedback.pacing import FramePacer
+from anim_feedback.startup import StartupProfile
+from anim_feedback.textures import open_texture_renderer
+
+_IMPORTED = time.perf_counter()
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Week 5 Animation + Feedback")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print how long each startup phase took, once the first frame is shown",
+    )
+    parser.add_argument(
+        "--no-asset-cache",
+        action="store_true",
+        help="always redraw the procedural sprite frames instead of loading them from .cache/",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=["surface", "texture"],
+        default="surface",
+        help="surface: Surface blits (default); texture: SDL2 textures via pygame._sdl2, if available",
+    )
+    parser.add_argument(
+        "--render-scale",
+        type=int,
+        default=1,
+        metavar="N",
+        help="draw at 1/N resolution (2 = 480x270) and scale up to the window; Surface renderer only",
+    )
+    parser.add_argument(
+        "--low-res-hud",
+        action="store_true",
+        help="with --render-scale, draw the HUD text at the low resolution too instead of full resolution",
+    )
+    parser.add_argument(
+        "--fixed-quality",
+        action="store_true",
+        help="never turn particles or shake down automatically when frames run long",
+    )
+    parser.add_argument(
+        "--log-quality",
+        action="store_true",
+        help="print each automatic quality change",
+    )
+    parser.add_argument(
+        "--bench",
+        type=int,
+        metavar="FRAMES",
+        help="draw FRAMES frames as fast as possible (no frame cap), print the average draw time, and exit",
+    )
+    parser.add_argument(
+        "--pacing",
+        choices=FramePacer.MODES,
+        default="clock",
+        help="clock: wait with Clock.tick (default); sleep-spin: sleep, then busy-wait the last 2 ms for exact frame deadlines",
+    )
+    parser.add_argument(
+        "--pacing-report",
+        metavar="PATH",
+        help="on exit, write frame interval stats (jitter histogram, missed deadlines, percentiles) to PATH as JSON",
+    )
+    parser.add_argument(
+        "--no-idle",
+        action="store_true",
+        help="always run at the full frame rate, even on the title screen or in the background",
+    )
+    parser.add_argument(
+        "--idle-after",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="slow the loop down after this long without input (default: 60)",
+    )
+    args = parser.parse_args()
+
+    profile = StartupProfile(started=_STARTED) if args.profile_startup else None
+    if profile is not None:
+        profile.add("imports", _IMPORTED - _STARTED)
+
+    t0 = time.perf_counter()
     pygame.init()
-    pygame.display.set_caption("Week 5 Animation + Feedback (Pygame)")
+    title = "Week 5 Animation + Feedback (Pygame)"
+    pygame.display.set_caption(title)
+    if profile is not None:
+        profile.add("pygame.init", time.perf_counter() - t0)
 
-    game = Game()
-    clock = pygame.time.Clock()
+    textures = None
+    if args.renderer == "texture":
+        textures = open_texture_renderer(title, (Game.SCREEN_W, Game.SCREEN_H))
+        if textures is None:
+            print("SDL2 texture renderer not available; using Surface blits.")
+
+    pacer = FramePacer(mode=args.pacing)
+    cache_dir = None if args.no_asset_cache else str(Path(__file__).resolve().parent / ".cache" / "frames")
+    # The texture window has no display surface; the game gets an unused off-screen one.
+    screen = pygame.Surface((Game.SCREEN_W, Game.SCREEN_H)) if textures is not None else None
+    game = Game(
+        profile=profile,
+        asset_cache_dir=cache_dir,
+        screen=screen,
+        render_scale=args.render_scale,
+        native_hud=not args.low_res_hud,
+        governor=QualityGovernor(1.0 / Game.fps, enabled=not args.fixed_quality, echo=args.log_quality),
+        pacing=pacer.stats,
+    )
+    # --bench measures uncapped draw time, so it never idles.
+    loop = IdleLoop(
+        0 if args.bench else game.fps,
+        after=args.idle_after,
+        enabled=not (args.no_idle or args.bench),
+        pacer=pacer,
+    )
+
+    frames = 0
+    draw_time = 0.0
+    if args.bench:
+        game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0))
 
     running = True
     while running:
-        dt = clock.tick(game.fps) / 1000.0
-        dt = min(dt, 0.05)
+        dt, events = loop.tick(menu=game.state != "play")
+        dt = 1 / game.fps if args.bench else min(dt, 0.05)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             else:
                 game.handle_event(event)
 
         game.update(dt)
-        game.draw()
-        pygame.display.flip()
+        # Title and game-over screens are only redrawn when something changed.
+        if game.needs_redraw():
+            t0 = time.perf_counter()
+            if textures is not None:
+                textures.draw(game)
+                textures.present()
+            else:
+                game.draw()
+                pygame.display.flip()
+            draw_time += time.perf_counter() - t0
+
+        if profile is not None:
+            print(profile.report())
+            profile = None
+
+        frames += 1
+        if args.bench and frames >= args.bench:
+            backend = "texture" if textures is not None else "surface"
+            print(f"{backend}: {frames} frames, {draw_time / frames * 1000:.2f} ms/frame to draw and present")
+            running = False
 
+    if args.pacing_report:
+        pacer.stats.dump(args.pacing_report)
     pygame.quit()
 
 
@@ -1,5 +1,5 @@
 # import modules for pygame template
-import pygame, random, sys, os
+import pygame, random, sys, os, math
 # import event
 import pygame.event as EVENTS
 
@@ -155,6 +155,83 @@ class Projectile(pygame.sprite.Sprite):
 
 
 
+# create a background layer - cut the image into display-format tiles once, then only blit tiles in view
+class ParallaxLayer:
+    # speed_y - pixels per frame, use a lower speed for layers further away
+    # colorkey - optional colour to treat as transparent, tiles with nothing else are skipped
+    def __init__(self, image, speed_y, tile_size=128, colorkey=None):
+        self.speed_y = speed_y
+        self.offset_y = 0.0
+        self.tile_size = tile_size
+        # image width & height should be a multiple of tile_size so the layer wraps cleanly
+        self.cols = math.ceil(image.get_width() / tile_size)
+        self.rows = math.ceil(image.get_height() / tile_size)
+        self.height = self.rows * tile_size
+        # convert() copies the image into the display's pixel format - fastest to blit
+        image = image.convert()
+        if colorkey is not None:
+            # tiles cut from the image below share its colour key
+            image.set_colorkey(colorkey)
+        # grid of tiles - each entry is (surface, offset in tile) or None for an empty tile
+        self.tiles = []
+        for row in range(self.rows):
+            tile_row = []
+            for col in range(self.cols):
+                area = pygame.Rect(col * tile_size, row * tile_size, tile_size, tile_size)
+                area = area.clip(image.get_rect())
+                tile = image.subsurface(area)
+                # crop the tile to the pixels that are actually drawn - skip tiles with nothing to draw
+                bounds = tile.get_bounding_rect()
+                if bounds.width == 0 or bounds.height == 0:
+                    tile_row.append(None)
+                    continue
+                tile = tile.subsurface(bounds).copy()
+                if colorkey is not None:
+                    # run-length encode the sparse tile - faster colour key blits
+                    tile.set_colorkey(colorkey, pygame.RLEACCEL)
+                tile_row.append((tile, bounds.topleft))
+            self.tiles.append(tile_row)
+
+    def update(self):
+        # scroll down the screen - wrap the offset so the layer repeats forever
+        self.offset_y = (self.offset_y + self.speed_y) % self.height
+
+    def draw(self, surface):
+        view_width, view_height = surface.get_size()
+        size = self.tile_size
+        # image row shown at the top of the window
+        top = int(-self.offset_y) % self.height
+        row = top // size
+        y = -(top % size)
+        # only visit tiles that overlap the window...
+        while y < view_height:
+            tile_row = self.tiles[row % self.rows]
+            col = 0
+            x = 0
+            while x < view_width and col < self.cols:
+                tile = tile_row[col]
+                if tile is not None:
+                    surface.blit(tile[0], (x + tile[1][0], y + tile[1][1]))
+                x += size
+                col += 1
+            y += size
+            row += 1
+
+# create a parallax background - solid fill colour, then each layer drawn back to front
+class ParallaxBackground:
+    def __init__(self, fill_colour, layers):
+        self.fill_colour = fill_colour
+        self.layers = layers
+
+    def update(self):
+        for layer in self.layers:
+            layer.update()
+
+    def draw(self, surface):
+        surface.fill(self.fill_colour)
+        for layer in self.layers:
+            layer.draw(surface)
+
 # define game quit and program exit
 def gameExit():
     pygame.quit()
@@ -162,8 +239,13 @@ def gameExit():
 
 # load graphics/images for the game
 bg_img = pygame.image.load(os.path.join(img_dir, "bg-purple-lg.png")).convert()
-# add rect for bg - helps locate background
-bg_rect = bg_img.get_rect()
+# background is a flat purple with scattered stars - fill the purple, then only draw tiles with stars
+bg_colour = bg_img.get_at((0, 0))
+# far stars scroll slowly, near stars (mirrored copy of the image) scroll faster - parallax
+background = ParallaxBackground(bg_colour, [
+    ParallaxLayer(bg_img, 0.5, colorkey=bg_colour),
+    ParallaxLayer(pygame.transform.flip(bg_img, True, False), 1.5, colorkey=bg_colour),
+])
 # player's ship
 ship_img = pygame.image.load(os.path.join(img_dir, "ship-blue.png")).convert()
 # ship's laser
@@ -213,6 +295,8 @@ while running:
     # 'updating' the game
     # update all game sprites
     game_sprites.update()
+    # scroll background layers
+    background.update()
 
     # add check for sprite group collide with another sprite group - projectiles hitting enemy objects - use True to delete sprites from each group...
     collisions = pygame.sprite.groupcollide(mob_sprites, projectiles, True, True)
@@ -229,8 +313,8 @@ while running:
         running = False
 
     # draw
-    # draw background image - specify image file and rect to load image
-    window.blit(bg_img, bg_rect)
+    # draw scrolling background - fill colour & star tiles in view
+    background.draw(window)
     #window.fill(BLACK)
     # draw all sprites to the game window
     game_sprites.draw(window)